@@ -0,0 +1,148 @@
+/////////////////////////////////////////////////////////////////////////////////
+// BSD 3-Clause License
+//
+// Copyright (c) 2022, Jose R. Garcia
+// All rights reserved.
+//
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are met:
+//
+// 1. Redistributions of source code must retain the above copyright notice, this
+//    list of conditions and the following disclaimer.
+//
+// 2. Redistributions in binary form must reproduce the above copyright notice,
+//    this list of conditions and the following disclaimer in the documentation
+//    and/or other materials provided with the distribution.
+//
+// 3. Neither the name of the copyright holder nor the names of its
+//    contributors may be used to endorse or promote products derived from
+//    this software without specific prior written permission.
+//
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+// DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+// FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+// DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+// SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+// CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+// OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+// OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+/////////////////////////////////////////////////////////////////////////////////
+// File name    : TB_MODEL.v
+// Author       : Jose R Garcia (jg-fossh@protonmail.com)
+// Project Name : Goldschmidt Integer Divider
+// Module Name  : TB_TOP
+// Description  : Port compatible TB_TOP without the divider, used by the model
+//                backend (make BACKEND=model). The divider's outputs are driven
+//                by the Python cycle accurate model (gdiv_model.py) through the
+//                r_model_* registers, see top.py model_backend().
+//
+// Additional Comments:
+//   Has the same parameters, ports and g_tb_inst[1..N-1] signals as TB_TOP.v
+//   so the verification agents and the UVM environment run unchanged.
+//
+/////////////////////////////////////////////////////////////////////////////////
+module TB_TOP #(
+  parameter integer P_GDIV_FACTORS_MSB = 24,                   // The MSB of each division factor.
+  parameter integer P_GDIV_FRAC_LENGTH = P_GDIV_FACTORS_MSB+1, // he amount of bits after the fixed point.
+  parameter integer P_GDIV_ROUND_LVL   = 3,                    // Bits after fixed point that need to be '1' to round up result.
+  parameter integer P_GDIV_RDUC_STP_BY = 0,
+  parameter integer P_GDIV_PIPELINED   = 0,                    // 1=unrolled divider, one division per clock.
+  parameter integer P_GDIV_DIVMOD      = 0,                    // 1=divmod operation, i_wb4s_tgd[2].
+  parameter integer P_GDIV_EARLY_TERM  = 0,                    // 1=early termination of the iterations.
+  parameter integer P_GDIV_LANES       = 1,                    // Divisions per request, 2 or 4 with GDIV_LANES defined.
+  parameter integer P_GDIV_CORES       = 1,                    // Dividers per port, more than 1 with GDIV_CLUSTER defined.
+  parameter integer P_GDIV_TAG_MSB     = 3,                    // The MSB of the cluster's request tag, tga_i and tgd_o.
+  parameter integer P_GDIV_IN_ORDER    = 0,                    // 1=the cluster acknowledges in request order.
+  parameter integer P_GDIV_RCP_CACHE   = 0,                    // Entries of the divisor reciprocal cache, 0=none.
+  parameter integer P_TB_INSTANCES     = 1                     // Amount of divider instances.
+)(
+  // Component's clocks and resets
+  input i_clk, // clock
+  input i_rst, // reset
+  // WB4S Pipeline Interface
+  input                               i_wb4s_cyc,   // WB cyc, active/abort signal
+  input  [P_GDIV_DIVMOD+1:0]          i_wb4s_tgd,   // [2] 1=divmod; [1] 0=quotient, 1=rem; [0] 0=signed, 1=unsigned
+  input                               i_wb4s_stb,   // WB stb, valid strobe
+  input  [(P_GDIV_FACTORS_MSB*2)+1:0] i_wb4s_data,  // WB data, {divisor, dividend}
+  output                              o_wb4s_stall, // WB stall, not ready
+  output                              o_wb4s_ack,   // WB write enable
+  output [((P_GDIV_FACTORS_MSB+1)*(P_GDIV_DIVMOD+1))-1:0] o_wb4s_data,  // WB data, result. P_GDIV_DIVMOD=1 {remainder, quotient}
+  // Wishbone Pipeline Slave Verification Agent Stubs
+  input  adr_i, //
+  input  we_i,  //
+  input  sel_i, //
+  input  [P_GDIV_TAG_MSB:0] tga_i, // Request tag, the cluster's i_wb4s_tga
+  input                     tgc_i, // Added to stub connections
+  output [P_GDIV_TAG_MSB:0] tgd_o  // Acknowledged request tag, the cluster's o_wb4s_tgd
+);
+
+  ///////////////////////////////////////////////////////////////////////////////
+  // Internal Signals Declarations
+  ///////////////////////////////////////////////////////////////////////////////
+  // Divider outputs, driven by the model
+  reg                        r_model_stall /*verilator public_flat_rw*/;
+  reg                        r_model_ack   /*verilator public_flat_rw*/;
+  reg [((P_GDIV_FACTORS_MSB+1)*(P_GDIV_DIVMOD+1))-1:0] r_model_data  /*verilator public_flat_rw*/;
+  reg [P_GDIV_TAG_MSB:0]     r_model_tgd   /*verilator public_flat_rw*/;
+  reg [31:0]                 r_model_rcp_hits   /*verilator public_flat_rw*/;
+  reg [31:0]                 r_model_rcp_misses /*verilator public_flat_rw*/;
+  // Reciprocal cache counters, TB_TOP's
+  wire [31:0]                w_rcp_hits    /*verilator public*/;
+  wire [31:0]                w_rcp_misses  /*verilator public*/;
+
+  ///////////////////////////////////////////////////////////////////////////////
+  //            ********      Architecture Declaration      ********           //
+  ///////////////////////////////////////////////////////////////////////////////
+
+  // Model outputs
+  assign tgd_o        = r_model_tgd;
+  assign o_wb4s_stall = r_model_stall;
+  assign o_wb4s_ack   = r_model_ack;
+  assign o_wb4s_data  = r_model_data;
+  assign w_rcp_hits   = r_model_rcp_hits;
+  assign w_rcp_misses = r_model_rcp_misses;
+
+  ///////////////////////////////////////////////////////////////////////////////
+  // Instance    : g_tb_inst
+  // Description : Additional model instances, instance 0 uses the ports.
+  ///////////////////////////////////////////////////////////////////////////////
+  genvar gi;
+  generate
+    for (gi = 1; gi < P_TB_INSTANCES; gi = gi+1) begin : g_tb_inst
+      // Clock and reset, shared by all instances
+      wire                              w_clk         /*verilator public*/;
+      wire                              w_rst         /*verilator public*/;
+      // WB4S Pipeline Interface, driven by this instance's verification agent
+      reg                               i_wb4s_cyc    /*verilator public_flat_rw*/;
+      reg  [P_GDIV_DIVMOD+1:0]          i_wb4s_tgd    /*verilator public_flat_rw*/;
+      reg                               i_wb4s_stb    /*verilator public_flat_rw*/;
+      reg  [(P_GDIV_FACTORS_MSB*2)+1:0] i_wb4s_data   /*verilator public_flat_rw*/;
+      wire                              o_wb4s_stall  /*verilator public*/;
+      wire                              o_wb4s_ack    /*verilator public*/;
+      wire [((P_GDIV_FACTORS_MSB+1)*(P_GDIV_DIVMOD+1))-1:0] o_wb4s_data   /*verilator public*/;
+      // Wishbone Pipeline Slave Verification Agent Stubs
+      reg                               adr_i         /*verilator public_flat_rw*/;
+      reg                               we_i          /*verilator public_flat_rw*/;
+      reg                               sel_i         /*verilator public_flat_rw*/;
+      reg  [P_GDIV_TAG_MSB:0]           tga_i         /*verilator public_flat_rw*/;
+      reg                               tgc_i         /*verilator public_flat_rw*/;
+      wire [P_GDIV_TAG_MSB:0]           tgd_o         /*verilator public*/;
+      // Divider outputs, driven by the model
+      reg                               r_model_stall /*verilator public_flat_rw*/;
+      reg                               r_model_ack   /*verilator public_flat_rw*/;
+      reg  [((P_GDIV_FACTORS_MSB+1)*(P_GDIV_DIVMOD+1))-1:0] r_model_data  /*verilator public_flat_rw*/;
+      reg  [P_GDIV_TAG_MSB:0]           r_model_tgd   /*verilator public_flat_rw*/;
+
+      assign w_clk        = i_clk;
+      assign w_rst        = i_rst;
+      assign tgd_o        = r_model_tgd;
+      assign o_wb4s_stall = r_model_stall;
+      assign o_wb4s_ack   = r_model_ack;
+      assign o_wb4s_data  = r_model_data;
+    end
+  endgenerate
+
+endmodule
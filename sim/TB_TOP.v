@@ -39,54 +39,105 @@
 //                unused signals)
 //
 // Additional Comments:
+//   P_TB_INSTANCES > 1 adds more divider instances under g_tb_inst[1..N-1].
+//   Each one has its own interface signals, public to the simulator, so a
+//   verification agent can drive every instance concurrently. Instance 0 is
+//   connected to the module ports.
+//   Defining GDIV_LANES replaces the dividers with
+//   Goldschmidt_Integer_Divider_Lanes, P_GDIV_LANES divisions per request.
+//   Defining GDIV_CLUSTER replaces them with Goldschmidt_Integer_Divider_Cluster,
+//   P_GDIV_CORES dividers behind each port. The request tag is tga_i and the
+//   tag of the acknowledged result tgd_o, stubbed to 0 otherwise.
+//   w_rcp_hits and w_rcp_misses are the reciprocal cache counters of dut,
+//   summed over its lanes or cores, public to the simulator.
 //
 /////////////////////////////////////////////////////////////////////////////////
 module TB_TOP #(
   parameter integer P_GDIV_FACTORS_MSB = 24,                   // The MSB of each division factor.
   parameter integer P_GDIV_FRAC_LENGTH = P_GDIV_FACTORS_MSB+1, // he amount of bits after the fixed point.
   parameter integer P_GDIV_ROUND_LVL   = 3,                    // Bits after fixed point that need to be '1' to round up result.
-  parameter integer P_GDIV_RDUC_STP_BY = 0
+  parameter integer P_GDIV_RDUC_STP_BY = 0,
+  parameter integer P_GDIV_PIPELINED   = 0,                    // 1=unrolled divider, one division per clock.
+  parameter integer P_GDIV_DIVMOD      = 0,                    // 1=divmod operation, i_wb4s_tgd[2].
+  parameter integer P_GDIV_EARLY_TERM  = 0,                    // 1=early termination of the iterations.
+  parameter integer P_GDIV_LANES       = 1,                    // Divisions per request, 2 or 4 with GDIV_LANES defined.
+  parameter integer P_GDIV_CORES       = 1,                    // Dividers per port, more than 1 with GDIV_CLUSTER defined.
+  parameter integer P_GDIV_TAG_MSB     = 3,                    // The MSB of the cluster's request tag, tga_i and tgd_o.
+  parameter integer P_GDIV_IN_ORDER    = 0,                    // 1=the cluster acknowledges in request order.
+  parameter integer P_GDIV_RCP_CACHE   = 0,                    // Entries of the divisor reciprocal cache, 0=none.
+  parameter integer P_TB_INSTANCES     = 1                     // Amount of divider instances.
 )(
   // Component's clocks and resets
   input i_clk, // clock
   input i_rst, // reset
   // WB4S Pipeline Interface
   input                               i_wb4s_cyc,   // WB cyc, active/abort signal
-  input  [1:0]                        i_wb4s_tgd,   // [1] 0=quotient, 1=rem; [0] 0=signed, 1=unsigned
+  input  [P_GDIV_DIVMOD+1:0]          i_wb4s_tgd,   // [2] 1=divmod; [1] 0=quotient, 1=rem; [0] 0=signed, 1=unsigned
   input                               i_wb4s_stb,   // WB stb, valid strobe
   input  [(P_GDIV_FACTORS_MSB*2)+1:0] i_wb4s_data,  // WB data, {divisor, dividend}
   output                              o_wb4s_stall, // WB stall, not ready
   output                              o_wb4s_ack,   // WB write enable
-  output [P_GDIV_FACTORS_MSB:0]       o_wb4s_data,  // WB data, result
+  output [((P_GDIV_FACTORS_MSB+1)*(P_GDIV_DIVMOD+1))-1:0] o_wb4s_data,  // WB data, result. P_GDIV_DIVMOD=1 {remainder, quotient}
   // Wishbone Pipeline Slave Verification Agent Stubs
   input  adr_i, //
   input  we_i,  //
   input  sel_i, //
-  output tga_i, // Added to stub connections
-  input  tgc_i, // Added to stub connections
-  output tgd_o  // Added to stub connections
+  input  [P_GDIV_TAG_MSB:0] tga_i, // Request tag, the cluster's i_wb4s_tga
+  input                     tgc_i, // Added to stub connections
+  output [P_GDIV_TAG_MSB:0] tgd_o  // Acknowledged request tag, the cluster's o_wb4s_tgd
 );
 
   ///////////////////////////////////////////////////////////////////////////////
   // Internal Signals Declarations
   ///////////////////////////////////////////////////////////////////////////////
+  // Reciprocal cache counters of dut
+  wire [31:0] w_rcp_hits   /*verilator public*/;
+  wire [31:0] w_rcp_misses /*verilator public*/;
 
   ///////////////////////////////////////////////////////////////////////////////
   //            ********      Architecture Declaration      ********           //
   ///////////////////////////////////////////////////////////////////////////////
 
+`ifndef GDIV_LANES
+  initial begin
+    if (P_GDIV_LANES != 1)
+      $display("\nError-Type : Parameter Ignored\nError-Msg  : P_GDIV_LANES requires GDIV_LANES to be defined, make GDIV_LANES=%0d. \n", P_GDIV_LANES);
+  end
+`endif
+
+`ifndef GDIV_CLUSTER
+  initial begin
+    if (P_GDIV_CORES != 1)
+      $display("\nError-Type : Parameter Ignored\nError-Msg  : P_GDIV_CORES requires GDIV_CLUSTER to be defined, make GDIV_CORES=%0d. \n", P_GDIV_CORES);
+  end
+
   // Slave Stubs
   assign tgd_o = 0;
+`endif
 
   ///////////////////////////////////////////////////////////////////////////////
   // Instance    : dut
   // Description : Instance of the CLU implementation.
   ///////////////////////////////////////////////////////////////////////////////
+`ifdef GDIV_CLUSTER
+  Goldschmidt_Integer_Divider_Cluster #(
+    .P_GDIV_CORES(P_GDIV_CORES),
+    .P_GDIV_TAG_MSB(P_GDIV_TAG_MSB),
+    .P_GDIV_IN_ORDER(P_GDIV_IN_ORDER),
+`elsif GDIV_LANES
+  Goldschmidt_Integer_Divider_Lanes #(
+    .P_GDIV_LANES(P_GDIV_LANES),
+`else
   Goldschmidt_Integer_Divider_Parallel #(
+`endif
     .P_GDIV_FACTORS_MSB(P_GDIV_FACTORS_MSB), 
     .P_GDIV_FRAC_LENGTH(P_GDIV_FRAC_LENGTH),
     .P_GDIV_ROUND_LVL(P_GDIV_ROUND_LVL),
-    .P_GDIV_RDUC_STP_BY(P_GDIV_RDUC_STP_BY)
+    .P_GDIV_RDUC_STP_BY(P_GDIV_RDUC_STP_BY),
+    .P_GDIV_PIPELINED(P_GDIV_PIPELINED),
+    .P_GDIV_DIVMOD(P_GDIV_DIVMOD),
+    .P_GDIV_EARLY_TERM(P_GDIV_EARLY_TERM),
+    .P_GDIV_RCP_CACHE(P_GDIV_RCP_CACHE)
   ) dut (
     // Component's clocks and resets
     .i_clk(i_clk), // clock
@@ -96,9 +147,118 @@ module TB_TOP #(
     .i_wb4s_stb(i_wb4s_stb),     // WB stb, valid strobe
     .i_wb4s_data(i_wb4s_data),   // WB data 0
     .i_wb4s_tgd(i_wb4s_tgd),     // WB data tag, 0=add 1=substract
+`ifdef GDIV_CLUSTER
+    .i_wb4s_tga(tga_i),          // WB address tag, request tag
+    .o_wb4s_tgd(tgd_o),          // WB data tag, acknowledged request tag
+`endif
     .o_wb4s_stall(o_wb4s_stall), // WB stall, not ready
     .o_wb4s_ack(o_wb4s_ack),     // WB write enable
     .o_wb4s_data(o_wb4s_data)    // WB data, result
   );
 
+  ///////////////////////////////////////////////////////////////////////////////
+  // Instance    : g_rcp_count
+  // Description : Sums the reciprocal cache counters of dut's dividers.
+  ///////////////////////////////////////////////////////////////////////////////
+`ifdef GDIV_CLUSTER
+  localparam integer L_TB_DIVIDERS = P_GDIV_CORES;
+`elsif GDIV_LANES
+  localparam integer L_TB_DIVIDERS = P_GDIV_LANES;
+`else
+  localparam integer L_TB_DIVIDERS = 1;
+`endif
+  wire [((L_TB_DIVIDERS+1)*64)-1:0] w_rcp_count; // {misses, hits} after each divider
+
+  assign w_rcp_count[63:0] = 0;
+  assign w_rcp_hits        = w_rcp_count[(L_TB_DIVIDERS*64) +: 32];
+  assign w_rcp_misses      = w_rcp_count[(L_TB_DIVIDERS*64)+32 +: 32];
+
+  genvar gr;
+  generate
+    for (gr = 0; gr < L_TB_DIVIDERS; gr = gr+1) begin : g_rcp_count
+`ifdef GDIV_CLUSTER
+      wire [31:0] w_hits   = dut.g_core[gr].core.w_rcp_hits;
+      wire [31:0] w_misses = dut.g_core[gr].core.w_rcp_misses;
+`elsif GDIV_LANES
+      wire [31:0] w_hits   = dut.g_lane[gr].lane.w_rcp_hits;
+      wire [31:0] w_misses = dut.g_lane[gr].lane.w_rcp_misses;
+`else
+      wire [31:0] w_hits   = dut.w_rcp_hits;
+      wire [31:0] w_misses = dut.w_rcp_misses;
+`endif
+      assign w_rcp_count[(gr+1)*64 +: 64] = {w_rcp_count[(gr*64)+32 +: 32] + w_misses, w_rcp_count[gr*64 +: 32] + w_hits};
+    end
+  endgenerate
+
+  ///////////////////////////////////////////////////////////////////////////////
+  // Instance    : g_tb_inst
+  // Description : Additional instances of the divider, instance 0 is dut.
+  ///////////////////////////////////////////////////////////////////////////////
+  genvar gi;
+  generate
+    for (gi = 1; gi < P_TB_INSTANCES; gi = gi+1) begin : g_tb_inst
+      // Clock and reset, shared by all instances
+      wire                              w_clk        /*verilator public*/;
+      wire                              w_rst        /*verilator public*/;
+      // WB4S Pipeline Interface, driven by this instance's verification agent
+      reg                               i_wb4s_cyc   /*verilator public_flat_rw*/;
+      reg  [P_GDIV_DIVMOD+1:0]          i_wb4s_tgd   /*verilator public_flat_rw*/;
+      reg                               i_wb4s_stb   /*verilator public_flat_rw*/;
+      reg  [(P_GDIV_FACTORS_MSB*2)+1:0] i_wb4s_data  /*verilator public_flat_rw*/;
+      wire                              o_wb4s_stall /*verilator public*/;
+      wire                              o_wb4s_ack   /*verilator public*/;
+      wire [((P_GDIV_FACTORS_MSB+1)*(P_GDIV_DIVMOD+1))-1:0] o_wb4s_data  /*verilator public*/;
+      // Wishbone Pipeline Slave Verification Agent Stubs
+      reg                               adr_i        /*verilator public_flat_rw*/;
+      reg                               we_i         /*verilator public_flat_rw*/;
+      reg                               sel_i        /*verilator public_flat_rw*/;
+      reg  [P_GDIV_TAG_MSB:0]           tga_i        /*verilator public_flat_rw*/;
+      reg                               tgc_i        /*verilator public_flat_rw*/;
+      wire [P_GDIV_TAG_MSB:0]           tgd_o        /*verilator public*/;
+
+      assign w_clk = i_clk;
+      assign w_rst = i_rst;
+`ifndef GDIV_CLUSTER
+      assign tgd_o = 0;
+`endif
+
+`ifdef GDIV_CLUSTER
+      Goldschmidt_Integer_Divider_Cluster #(
+        .P_GDIV_CORES(P_GDIV_CORES),
+        .P_GDIV_TAG_MSB(P_GDIV_TAG_MSB),
+        .P_GDIV_IN_ORDER(P_GDIV_IN_ORDER),
+`elsif GDIV_LANES
+      Goldschmidt_Integer_Divider_Lanes #(
+        .P_GDIV_LANES(P_GDIV_LANES),
+`else
+      Goldschmidt_Integer_Divider_Parallel #(
+`endif
+        .P_GDIV_FACTORS_MSB(P_GDIV_FACTORS_MSB), 
+        .P_GDIV_FRAC_LENGTH(P_GDIV_FRAC_LENGTH),
+        .P_GDIV_ROUND_LVL(P_GDIV_ROUND_LVL),
+        .P_GDIV_RDUC_STP_BY(P_GDIV_RDUC_STP_BY),
+        .P_GDIV_PIPELINED(P_GDIV_PIPELINED),
+        .P_GDIV_DIVMOD(P_GDIV_DIVMOD),
+        .P_GDIV_EARLY_TERM(P_GDIV_EARLY_TERM),
+        .P_GDIV_RCP_CACHE(P_GDIV_RCP_CACHE)
+      ) dut (
+        // Component's clocks and resets
+        .i_clk(i_clk), // clock
+        .i_rst(i_rst), // reset
+        // Wishbone(Pipeline) Slave Interface
+        .i_wb4s_cyc(i_wb4s_cyc),     // WB stb, valid strobe
+        .i_wb4s_stb(i_wb4s_stb),     // WB stb, valid strobe
+        .i_wb4s_data(i_wb4s_data),   // WB data 0
+        .i_wb4s_tgd(i_wb4s_tgd),     // WB data tag, 0=add 1=substract
+`ifdef GDIV_CLUSTER
+        .i_wb4s_tga(tga_i),          // WB address tag, request tag
+        .o_wb4s_tgd(tgd_o),          // WB data tag, acknowledged request tag
+`endif
+        .o_wb4s_stall(o_wb4s_stall), // WB stall, not ready
+        .o_wb4s_ack(o_wb4s_ack),     // WB write enable
+        .o_wb4s_data(o_wb4s_data)    // WB data, result
+      );
+    end
+  endgenerate
+
 endmodule
@@ -0,0 +1,214 @@
+##################################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2022, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##################################################################################################
+# File name    : ab_compare.py
+# Author       : Jose R Garcia (jg-fossh@protonmail.com)
+# Project Name : Goldschmidt Integer Divider
+# Class Name   : ab_compare
+# Description  : A/B harness for the divider variants. Simulates the same seeded request stream
+#                on the flip flop LUT (ff) and block RAM LUT (rom) variants at the same time
+#                with the ab_test and compares result equivalence, latency and throughput.
+#
+# Additional Comments:
+#   python3 ab_compare.py --seed 7 --count 1000
+#   python3 ab_compare.py --no-run ab_ff.json ab_rom.json
+#   Both simulations run in SIM_DIR at the same time. Each one writes its own waveform
+#   (dump_ab_<variant>.fst), coverage and metrics files, the metrics are appended to
+#   sim_metrics.jsonl once both finished.
+##################################################################################################
+import argparse
+import json
+import os
+import sys
+
+import sim_metrics
+from sim_runner import SIM_DIR, sim_runner, run_parallel
+
+OPERATIONS = {0: "signed quotient", 1: "unsigned quotient", 2: "signed remainder", 3: "unsigned remainder",
+              4: "signed divmod", 5: "unsigned divmod"}
+
+
+def load_results(file_name):
+    """
+       Function: load_results
+
+       Definition: Reads the file written by the ab_test report phase.
+    """
+    with open(file_name) as f:
+        return json.load(f)
+
+
+def latency_stats(records):
+    """
+       Function: latency_stats
+
+       Definition: Returns {cycle_tag: (count, min, mean, max)} of the records latencies.
+    """
+    per_op = {}
+    for data_in, cycle_tag, data_out, accept_cycle, ack_cycle in records:
+        per_op.setdefault(cycle_tag, []).append(ack_cycle - accept_cycle)
+
+    stats = {}
+    for cycle_tag, latencies in per_op.items():
+        stats[cycle_tag] = (len(latencies), min(latencies), sum(latencies)/len(latencies), max(latencies))
+    return stats
+
+
+def throughput(results):
+    """
+       Function: throughput
+
+       Definition: Completed requests per clock, first accepted request to last acknowledge.
+    """
+    records = results["records"]
+    if (not records):
+        return 0.0
+    return len(records) / max(1, records[-1][4] - records[0][3])
+
+
+def compare(result_a, result_b, max_listed=10):
+    """
+       Function: compare
+
+       Definition: Prints the comparison of two ab_test results and returns the amount of
+         requests whose results differ.
+    """
+    name_a, name_b = result_a["dut"], result_b["dut"]
+    records_a, records_b = result_a["records"], result_b["records"]
+
+    if (result_a["seed"] != result_b["seed"] or result_a["factors_length"] != result_b["factors_length"]):
+        print("WARNING: runs used different seeds or factor lengths, the operand streams differ.")
+
+    # Equivalence, request by request
+    mismatches = []
+    for ii, (rec_a, rec_b) in enumerate(zip(records_a, records_b)):
+        if (rec_a[0] != rec_b[0] or rec_a[1] != rec_b[1]):
+            print("ERROR: request %d differs between runs, the operand streams are not identical." % ii)
+            return max(len(records_a), len(records_b))
+        if (rec_a[2] != rec_b[2]):
+            mismatches.append((ii, rec_a, rec_b))
+
+    print("\nEquivalence")
+    print("  Requests compared : %d (%s completed %d, %s completed %d)" % (
+        min(len(records_a), len(records_b)), name_a, len(records_a), name_b, len(records_b)))
+    print("  Result mismatches : %d" % len(mismatches))
+    half = result_a["factors_length"]
+    for ii, rec_a, rec_b in mismatches[:max_listed]:
+        print("    #%-6d %-18s dividend 0x%x divisor 0x%x : %s 0x%x, %s 0x%x" % (
+            ii, OPERATIONS.get(rec_a[1], str(rec_a[1])), rec_a[0] & ((1 << half)-1), rec_a[0] >> half,
+            name_a, rec_a[2], name_b, rec_b[2]))
+
+    # Latency, per operation
+    stats_a, stats_b = latency_stats(records_a), latency_stats(records_b)
+    print("\nLatency in clocks (count, min / mean / max)")
+    for cycle_tag in sorted(set(stats_a) | set(stats_b)):
+        line = "  %-18s" % OPERATIONS.get(cycle_tag, str(cycle_tag))
+        for name, stats in ((name_a, stats_a), (name_b, stats_b)):
+            if (cycle_tag in stats):
+                line += "  %-4s %6d, %3d / %6.2f / %3d" % ((name,) + stats[cycle_tag])
+        print(line)
+
+    # Throughput
+    print("\nThroughput")
+    for results in (result_a, result_b):
+        print("  %-4s %0.4f results/clock, %d clocks simulated, run phase %0.2f s" % (
+            results["dut"], throughput(results), results["cycles"], results["wall_time"]))
+
+    return len(mismatches) + abs(len(records_a) - len(records_b))
+
+
+def collect_metrics(run_files, metrics_file):
+    """
+       Function: collect_metrics
+
+       Definition: Appends the runs of each parallel simulation's own metrics file to the
+         shared one and removes them.
+
+       Args:
+         run_files: metrics files of the parallel simulations
+         metrics_file: shared metrics file, i.e. sim_metrics.jsonl
+    """
+    for run_file in run_files:
+        if (os.path.exists(run_file)):
+            for record in sim_metrics.load(run_file):
+                sim_metrics.append(metrics_file, record)
+            os.remove(run_file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate and compare the divider variants.")
+    parser.add_argument("files", nargs="*", help="with --no-run, the two ab_test result files to compare")
+    parser.add_argument("--variants", nargs=2, default=["ff", "rom"], help="DUT variants, default ff rom")
+    parser.add_argument("--seed", type=int, default=1, help="operand stream seed")
+    parser.add_argument("--count", type=int, default=200, help="amount of requests")
+    parser.add_argument("--no-run", action="store_true", help="only compare existing result files")
+    parser.add_argument("--strict", action="store_true", help="exit with an error if the results differ")
+    args = parser.parse_args()
+
+    if (args.no_run):
+        if (len(args.files) != 2):
+            parser.error("--no-run requires two result files")
+        files = args.files
+    else:
+        runs          = []
+        files         = []
+        metrics_files = []
+        for variant in args.variants:
+            out_file     = os.path.join(SIM_DIR, "ab_%s.json" % variant)
+            metrics_file = os.path.join(SIM_DIR, "sim_metrics_ab_%s.jsonl" % variant)
+            files.append(out_file)
+            metrics_files.append(metrics_file)
+            # The runs share SIM_DIR, every file they write needs its own name
+            runs.append(sim_runner("ab_" + variant,
+                make_vars={"DUT": variant, "UVM_TEST": "ab_test", "GDIV_TRACE_FILE": "dump_ab_%s.fst" % variant},
+                plusargs=["+AB_SEED=%d" % args.seed, "+AB_COUNT=%d" % args.count, "+AB_OUT=" + out_file,
+                          "+GDIV_METRICS=" + metrics_file,
+                          "+GDIV_COVERAGE=" + os.path.join(SIM_DIR, "coverage_ab_%s.yml" % variant)]))
+
+        print("Simulating %s in parallel, seed %d, %d requests" % (" and ".join(args.variants), args.seed, args.count))
+        for run in run_parallel(runs):
+            print("  %-4s exit %d, %0.1f s wall clock (build and run), log %s" % (
+                run.make_vars["DUT"], run.returncode, run.wall_time, run.log_file))
+        collect_metrics(metrics_files, os.path.join(SIM_DIR, "sim_metrics.jsonl"))
+
+    for file_name in files:
+        if (not os.path.exists(file_name)):
+            sys.exit("Missing %s, check the simulation log." % file_name)
+
+    differences = compare(load_results(files[0]), load_results(files[1]))
+
+    if (args.strict and differences > 0):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
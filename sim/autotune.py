@@ -0,0 +1,194 @@
+##################################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2022, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##################################################################################################
+# File name    : autotune.py
+# Author       : Jose R Garcia (jg-fossh@protonmail.com)
+# Project Name : Goldschmidt Integer Divider
+# Class Name   : autotune
+# Description  : Verilator thread configuration autotuner. Builds the simulation with each
+#                candidate thread and tracing setting, runs the same benchmark workload on
+#                each one and stores the setting with the most simulated cycles per second
+#                for the design and parameter set.
+#
+# Additional Comments:
+#   python3 autotune.py                            # DUT=ff, default parameters
+#   python3 autotune.py --dut rom --factors-msb 31 --threads 1 2 4
+#   python3 autotune.py --allow-no-trace           # also consider disabling the waveforms
+#   Results are kept in autotune.json and written as autotune.mk, which the Makefile includes,
+#   so make and the python runners (sim_runner.py) pick the tuned setting up. The Makefile
+#   names the build directory after the design, its parameters and the setting, a newly tuned
+#   one is built from scratch and every candidate gets its own build.
+##################################################################################################
+import argparse
+import json
+import os
+import sys
+
+import sim_metrics
+from sim_runner import SIM_DIR, sim_runner
+
+RESULTS_FILE  = os.path.join(SIM_DIR, "autotune.json")
+MAKEFILE_FILE = os.path.join(SIM_DIR, "autotune.mk")
+# Makefile variables that identify a design and parameter set, in key order
+KEY_VARS = ["DUT", "GDIV_FACTORS_MSB", "GDIV_FRAC_LENGTH", "GDIV_ROUND_LVL", "GDIV_RDUC_STP_BY", "GDIV_PIPELINED", "GDIV_DIVMOD", "GDIV_EARLY_TERM", "GDIV_LANES", "GDIV_CORES", "GDIV_TAG_MSB", "GDIV_IN_ORDER", "GDIV_RCP_CACHE", "TB_INSTANCES"]
+
+
+def design_key(make_vars):
+    return "|".join(str(make_vars[var]) for var in KEY_VARS)
+
+
+def candidates(threads, allow_no_trace):
+    """
+       Function: candidates
+
+       Definition: Returns the settings to try, dicts of VL_THREADS, VL_TRACE and
+         VL_TRACE_THREADS.
+    """
+    settings = []
+    for num_threads in threads:
+        for trace_threads in (1, 2):
+            settings.append({"VL_THREADS": num_threads, "VL_TRACE": 1, "VL_TRACE_THREADS": trace_threads})
+        if (allow_no_trace):
+            settings.append({"VL_THREADS": num_threads, "VL_TRACE": 0, "VL_TRACE_THREADS": 1})
+    return settings
+
+
+def benchmark(name, make_vars, setting, count, metrics_file):
+    """
+       Function: benchmark
+
+       Definition: Builds and runs the benchmark workload with one setting and returns its
+         simulated cycles per second, None when the run failed.
+    """
+    run_vars = dict(make_vars)
+    run_vars.update(setting)
+    # The Makefile names SIM_BUILD after the design, its parameters and the setting, so a
+    # candidate never reuses the build of another design or setting.
+    run_vars["UVM_TEST"] = "soak_test"
+    if (os.path.exists(metrics_file)):
+        os.remove(metrics_file)
+
+    run = sim_runner(name, make_vars=run_vars,
+                     plusargs=["+SOAK_COUNT=%d" % count, "+SOAK_SEED=1", "+SOAK_PROGRESS=0",
+                               "+GDIV_METRICS=" + metrics_file])
+    if (run.start().wait() != 0 or not os.path.exists(metrics_file)):
+        return None
+    return sim_metrics.load(metrics_file)[-1]["cycles_per_s"]
+
+
+def write_makefile(results):
+    """
+       Function: write_makefile
+
+       Definition: Writes the best setting of every tuned design as Makefile conditionals.
+    """
+    condition = "|".join("$(%s)" % var for var in KEY_VARS)
+    with open(MAKEFILE_FILE, "w") as f:
+        f.write("# Written by autotune.py, do not edit. Best verilator setting per design and parameter set.\n")
+        f.write("# Key: %s\n" % "|".join(KEY_VARS))
+        for key in sorted(results):
+            best = results[key]["best"]
+            f.write("ifeq (%s,%s)\n" % (condition, key))
+            for var in ("VL_THREADS", "VL_TRACE", "VL_TRACE_THREADS"):
+                f.write("  %s ?= %s\n" % (var, best[var]))
+            f.write("endif\n")
+
+
+def main():
+    cpus = os.cpu_count() or 2
+    parser = argparse.ArgumentParser(description="Find the fastest verilator thread setting of a design.")
+    parser.add_argument("--dut", default="ff", choices=["ff", "rom"], help="DUT variant")
+    parser.add_argument("--factors-msb", type=int, default=24, help="P_GDIV_FACTORS_MSB")
+    parser.add_argument("--frac-length", type=int, default=None, help="P_GDIV_FRAC_LENGTH, default factors-msb+1")
+    parser.add_argument("--round-lvl", type=int, default=3, help="P_GDIV_ROUND_LVL")
+    parser.add_argument("--rduc-stp-by", type=int, default=0, help="P_GDIV_RDUC_STP_BY")
+    parser.add_argument("--pipelined", type=int, default=0, choices=[0, 1], help="P_GDIV_PIPELINED")
+    parser.add_argument("--divmod", type=int, default=0, choices=[0, 1], help="P_GDIV_DIVMOD")
+    parser.add_argument("--early-term", type=int, default=0, choices=[0, 1], help="P_GDIV_EARLY_TERM")
+    parser.add_argument("--lanes", type=int, default=1, choices=[1, 2, 4], help="P_GDIV_LANES")
+    parser.add_argument("--cores", type=int, default=1, help="P_GDIV_CORES")
+    parser.add_argument("--tag-msb", type=int, default=3, help="P_GDIV_TAG_MSB")
+    parser.add_argument("--in-order", type=int, default=0, choices=[0, 1], help="P_GDIV_IN_ORDER")
+    parser.add_argument("--rcp-cache", type=int, default=0, help="P_GDIV_RCP_CACHE")
+    parser.add_argument("--instances", type=int, default=1, help="TB_INSTANCES")
+    parser.add_argument("--threads", type=int, nargs="+",
+                        default=sorted(set([1, 2, 4, max(cpus - 1, 1)]) & set(range(1, cpus + 1))),
+                        help="verilator thread counts to try")
+    parser.add_argument("--allow-no-trace", action="store_true", help="also try without waveform tracing")
+    parser.add_argument("--count", type=int, default=2000, help="benchmark requests per run")
+    args = parser.parse_args()
+
+    make_vars = { "DUT"              : args.dut,
+                  "GDIV_FACTORS_MSB" : args.factors_msb,
+                  "GDIV_FRAC_LENGTH" : args.frac_length if args.frac_length is not None else args.factors_msb + 1,
+                  "GDIV_ROUND_LVL"   : args.round_lvl,
+                  "GDIV_RDUC_STP_BY" : args.rduc_stp_by,
+                  "GDIV_PIPELINED"   : args.pipelined,
+                  "GDIV_DIVMOD"      : args.divmod,
+                  "GDIV_EARLY_TERM"  : args.early_term,
+                  "GDIV_LANES"       : args.lanes,
+                  "GDIV_CORES"       : args.cores,
+                  "GDIV_TAG_MSB"     : args.tag_msb,
+                  "GDIV_IN_ORDER"    : args.in_order,
+                  "GDIV_RCP_CACHE"   : args.rcp_cache,
+                  "TB_INSTANCES"     : args.instances }
+    key          = design_key(make_vars)
+    metrics_file = os.path.join(SIM_DIR, "autotune_metrics.jsonl")
+
+    print("Tuning %s (%s), %d requests per run" % (key, "|".join(KEY_VARS), args.count))
+    tried = []
+    for ii, setting in enumerate(candidates(args.threads, args.allow_no_trace)):
+        cycles_per_s = benchmark("tune_%d" % ii, make_vars, setting, args.count, metrics_file)
+        tried.append(dict(setting, cycles_per_s=cycles_per_s))
+        print("  threads %2d trace %d trace threads %d : %s" % (setting["VL_THREADS"], setting["VL_TRACE"],
+            setting["VL_TRACE_THREADS"], "failed" if cycles_per_s is None else "%0.1f cycles/s" % cycles_per_s))
+
+    working = [setting for setting in tried if setting["cycles_per_s"] is not None]
+    if (not working):
+        sys.exit("Every run failed, see the tune_*.log files")
+    best = max(working, key=lambda setting: setting["cycles_per_s"])
+
+    results = {}
+    if (os.path.exists(RESULTS_FILE)):
+        with open(RESULTS_FILE) as f:
+            results = json.load(f)
+    results[key] = {"best": best, "tried": tried}
+    with open(RESULTS_FILE, "w") as f:
+        json.dump(results, f, indent=2)
+    write_makefile(results)
+
+    print("Best: threads %d trace %d trace threads %d, %0.1f cycles/s, stored in %s" % (
+        best["VL_THREADS"], best["VL_TRACE"], best["VL_TRACE_THREADS"], best["cycles_per_s"], MAKEFILE_FILE))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+##################################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2022, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##################################################################################################
+# File name    : compare_metrics.py
+# Author       : Jose R Garcia (jg-fossh@protonmail.com)
+# Project Name : Goldschmidt Integer Divider
+# Class Name   : compare_metrics
+# Description  : Flags runs that got slower than a stored baseline. Compares the latest run of
+#                every key (test, seed and parameters) of a metrics file with the baseline's.
+#
+# Additional Comments:
+#   python3 compare_metrics.py                     # sim_metrics.jsonl vs metrics_baseline.json
+#   python3 compare_metrics.py --tolerance 0.2     # allow 20% before flagging
+#   python3 compare_metrics.py --update            # store the latest runs as the baseline
+#   python3 compare_metrics.py --backends          # model backend speed against the rtl one
+##################################################################################################
+import argparse
+import json
+import os
+import sys
+
+import sim_metrics
+
+# Metric, True when higher is better
+METRICS = [("tx_per_s", True), ("cycles_per_s", True), ("import_s", False), ("elaboration_s", False),
+           ("first_tr_s", False), ("run_s", False), ("peak_rss_kb", False)]
+
+
+def latest(records):
+    """
+       Function: latest
+
+       Definition: Returns the most recent run of every key.
+    """
+    runs = {}
+    for record in records:
+        runs[record["key"]] = record
+    return runs
+
+
+def slower(run, base, tolerance):
+    """
+       Function: slower
+
+       Definition: Returns the metrics of a run worse than the baseline by more than the
+         tolerance, as (metric, baseline, run, relative change).
+    """
+    flagged = []
+    for metric, higher_is_better in METRICS:
+        if (metric not in base or metric not in run or base[metric] <= 0):
+            continue
+        change = (run[metric] - base[metric]) / base[metric]
+        if ((higher_is_better and change < -tolerance) or (not higher_is_better and change > tolerance)):
+            flagged.append((metric, base[metric], run[metric], change))
+    return flagged
+
+
+def backend_pairs(runs):
+    """
+       Function: backend_pairs
+
+       Definition: Returns (rtl run, model run) of the tests, seeds and parameters run with
+         both backends, see make BACKEND=model.
+    """
+    pairs = {}
+    for record in runs.values():
+        params  = dict(record["params"])
+        backend = params.pop("backend", "rtl")
+        key     = sim_metrics.run_key(record["test"], record["seed"], params)
+        pairs.setdefault(key, {})[backend] = record
+    return [(pair["rtl"], pair["model"]) for key, pair in sorted(pairs.items()) if "rtl" in pair and "model" in pair]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare simulation speed metrics against a baseline.")
+    parser.add_argument("--metrics", default="sim_metrics.jsonl", help="runs, written by test_base")
+    parser.add_argument("--baseline", default="metrics_baseline.json", help="stored baseline")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="relative change allowed, default 0.10")
+    parser.add_argument("--update", action="store_true", help="store the latest runs as the baseline")
+    parser.add_argument("--backends", action="store_true", help="compare the runs made with both backends")
+    args = parser.parse_args()
+
+    runs = latest(sim_metrics.load(args.metrics))
+
+    if (args.backends):
+        pairs = backend_pairs(runs)
+        for rtl, model in pairs:
+            print("%s|%s" % (rtl["test"], rtl["seed"]))
+            for metric, higher_is_better in [(m, h) for m, h in METRICS if m in ["tx_per_s", "cycles_per_s", "first_tr_s"]]:
+                faster, slower_run = (model, rtl) if higher_is_better else (rtl, model)
+                print("        %-14s rtl %12.3f  model %12.3f  x%0.2f" % (metric, rtl[metric], model[metric],
+                    faster[metric] / max(slower_run[metric], 1e-9)))
+        if (not pairs):
+            sys.exit("No run of %s was made with both backends" % args.metrics)
+        return
+
+    if (args.update):
+        baseline = {}
+        if (os.path.exists(args.baseline)):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.update(runs)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2)
+        print("Stored %d runs in %s" % (len(runs), args.baseline))
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+
+    regressions = 0
+    for key in sorted(runs):
+        if (key not in baseline):
+            print("NEW   %s" % key)
+            continue
+        flagged = slower(runs[key], baseline[key], args.tolerance)
+        if (not flagged):
+            print("OK    %s" % key)
+            continue
+        regressions += 1
+        print("SLOW  %s" % key)
+        for metric, base, run, change in flagged:
+            print("        %-14s %14.3f -> %14.3f  (%+0.1f%%)" % (metric, base, run, 100 * change))
+
+    if (regressions > 0):
+        sys.exit("%d of %d runs got slower than the baseline" % (regressions, len(runs)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+##################################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2022, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##################################################################################################
+# File name    : err_stats.py
+# Author       : Jose R Garcia (jg-fossh@protonmail.com)
+# Project Name : Goldschmidt Integer Divider
+# Class Name   : err_stats
+# Description  : Error distribution of the divider. Computes the signed error (DUT minus the
+#                exact result) of every completed request and accumulates it in streaming
+#                histograms, one per operation, divisor magnitude and dividend magnitude.
+#
+# Additional Comments:
+#   Subscribes to the latency monitor, whose transactions carry the DUT's result. Memory is
+#   bounded by the factors width; 4 operations x (width+1) divisor bit lengths x (width+1)
+#   dividend bit lengths, each bucket made on its first result, with the count, sum, sum of
+#   squares, min, max and a histogram of the error in power of two bins.
+#   Signed requests (i_wb4s_tgd[0] = 0) use the two's complement value of the operands and of
+#   the result. The exact quotient is the rational dividend/divisor, the divider rounds it, so a
+#   correct quotient is off by up to 1/2. The exact remainder is the one of the quotient
+#   truncated towards zero. A divmod request (i_wb4s_tgd[2] = 1) returns {remainder, quotient},
+#   each half is accumulated under its own operation.
+##################################################################################################
+import json
+from fractions import Fraction
+
+from uvm.base import *
+from uvm.comps import *
+from uvm.tlm1 import *
+from uvm.macros import *
+from wb4s_seq import *
+
+OPERATIONS = ["signed quotient", "unsigned quotient", "signed remainder", "unsigned remainder"]
+
+
+def to_signed(value, width):
+    """
+       Function: to_signed
+
+       Definition: Two's complement value of a width bits vector.
+    """
+    value &= (1 << width) - 1
+    if (value >> (width - 1)):
+        return value - (1 << width)
+    return value
+
+
+def exact_result(dividend, divisor, tgd):
+    """
+       Function: exact_result
+
+       Definition: Exact quotient (the rational dividend/divisor) or remainder of a request,
+         None when dividing by zero. The operands are already signed or unsigned values.
+    """
+    if (divisor == 0):
+        return None
+    if ((tgd & 2) == 0):
+        return Fraction(dividend, divisor)
+    quotient = abs(dividend) // abs(divisor)
+    if ((dividend < 0) != (divisor < 0)):
+        quotient = -quotient
+    return dividend - quotient * divisor
+
+
+def error_bin(error):
+    """
+       Function: error_bin
+
+       Definition: Histogram bin of an error, 0 for no error or a quotient within 1/2 of the
+         rational one, +/-n for a magnitude rounding to n bits; 1, 2-3, 4-7 ...
+    """
+    magnitude = int(abs(error) + Fraction(1, 2))
+    if (abs(error) <= Fraction(1, 2)):
+        return 0
+    if (error < 0):
+        return -magnitude.bit_length()
+    return magnitude.bit_length()
+
+
+class err_stats(UVMSubscriber):
+    """
+       Class: Error Statistics
+
+       Definition: Contains functions, tasks and methods of this analysis component.
+    """
+
+    def __init__(self, name, parent=None):
+        super().__init__(name, parent)
+        """
+           Function: new
+
+           Definition: Constructor.
+
+           Args:
+             name: This component's name.
+             parent: NONE
+        """
+        self.tag          = name
+        self.data_length  = 0    # {divisor, dividend} bits
+        self.width        = 0    # bits of each operand
+        self.file_name    = None # JSON export, written in the report phase
+        self.num_items    = 0
+        self.div_by_zero  = 0
+        self.buckets      = None # [operation][(divisor bits, dividend bits)] = [count, sum, sum_sq, min, max, histogram]
+
+
+    def end_of_elaboration_phase(self, phase):
+        """
+           Function: end_of_elaboration_phase
+
+           Definition: Sets the operands width once the data length is known. The buckets of
+             each operation are made by accumulate(), one per divisor and dividend bit length.
+        """
+        self.width   = int(self.data_length/2)
+        self.buckets = [{} for op in range(len(OPERATIONS))]
+
+
+    def write(self, t):
+        """
+           Function: write
+
+           Definition: Receives a completed request and accumulates its error.
+
+           Args:
+             t: wb4s_seq (Sequence Item) with data_in, cycle_tag and data_out
+        """
+        mask     = (1 << self.width) - 1
+        tgd      = t.cycle_tag & 7
+        dividend = t.data_in & mask
+        divisor  = (t.data_in >> self.width) & mask
+        if ((tgd & 1) == 0):
+            dividend = to_signed(dividend, self.width)
+            divisor  = to_signed(divisor, self.width)
+
+        if (divisor == 0):
+            self.div_by_zero += 1
+            return
+
+        if (tgd & 4):
+            # {remainder, quotient}
+            self.accumulate(tgd & 1, dividend, divisor, t.data_out & mask)
+            self.accumulate(2 | (tgd & 1), dividend, divisor, (t.data_out >> self.width) & mask)
+        else:
+            self.accumulate(tgd & 3, dividend, divisor, t.data_out & mask)
+        self.num_items += 1
+
+
+    def accumulate(self, op, dividend, divisor, result):
+        """
+           Function: accumulate
+
+           Definition: Adds the error of one result to its operation, divisor and dividend
+             bucket. Each histogram has one bin per error bit length, positive and negative,
+             and one for no error.
+
+           Args:
+             op: index in OPERATIONS
+             dividend: signed or unsigned dividend value
+             divisor: signed or unsigned divisor value, not zero
+             result: raw result bits, width bits
+        """
+        if ((op & 1) == 0):
+            result = to_signed(result, self.width)
+
+        error  = result - exact_result(dividend, divisor, op)
+        key    = (abs(divisor).bit_length(), abs(dividend).bit_length())
+        bucket = self.buckets[op].get(key)
+        if (bucket is None):
+            bucket = [0, 0.0, 0.0, None, None, [0] * (2 * (self.width + 1) + 1)]
+            self.buckets[op][key] = bucket
+        value      = float(error)
+        bucket[0] += 1
+        bucket[1] += value
+        bucket[2] += value * value
+        bucket[3]  = value if bucket[3] is None else min(bucket[3], value)
+        bucket[4]  = value if bucket[4] is None else max(bucket[4], value)
+        bucket[5][error_bin(error) + self.width + 1] += 1
+
+
+    def summary(self, op):
+        """
+           Function: summary
+
+           Definition: Returns [count, exact, mean, rms, min, max] of an operation, merging
+             its buckets. exact counts the errors in bin 0.
+        """
+        buckets = self.buckets[op].values()
+        count   = sum(bucket[0] for bucket in buckets)
+        if (count == 0):
+            return [0, 0, 0.0, 0.0, 0, 0]
+        exact  = sum(bucket[5][self.width + 1] for bucket in buckets)
+        total  = sum(bucket[1] for bucket in buckets)
+        sum_sq = sum(bucket[2] for bucket in buckets)
+        low    = min(bucket[3] for bucket in buckets)
+        high   = max(bucket[4] for bucket in buckets)
+        return [count, exact, total / count, (sum_sq / count) ** 0.5, low, high]
+
+
+    def export(self):
+        """
+           Function: export
+
+           Definition: Returns the statistics as a dict, the buckets by divisor bit length
+             and then by dividend bit length.
+        """
+        results = { "factors_length" : self.width,
+                    "transactions"   : self.num_items,
+                    "div_by_zero"    : self.div_by_zero,
+                    "error_bins"     : "index 0 is no error, +/-n is an error magnitude of n bits",
+                    "buckets"        : "by_divisor_bits, then by dividend bit length",
+                    "operations"     : {} }
+        for op, name in enumerate(OPERATIONS):
+            count, exact, mean, rms, low, high = self.summary(op)
+            buckets = {}
+            for (bits, dividend_bits), (num, total, sum_sq, b_low, b_high, histogram) in sorted(self.buckets[op].items()):
+                buckets.setdefault(bits, {})[dividend_bits] = {
+                    "count" : num, "mean" : total / num, "rms" : (sum_sq / num) ** 0.5, "min" : b_low, "max" : b_high,
+                    "histogram" : { ii - self.width - 1 : histogram[ii] for ii in range(len(histogram)) if histogram[ii] > 0 } }
+            results["operations"][name] = { "count" : count, "exact" : exact, "mean" : mean, "rms" : rms,
+                                            "min" : low, "max" : high, "by_divisor_bits" : buckets }
+        return results
+
+
+    def report_phase(self, phase):
+        text = "\n    %-20s %10s %8s %12s %12s %12s %12s\n" % ("Operation", "Count", "Exact %", "Mean", "RMS", "Min", "Max")
+        for op, name in enumerate(OPERATIONS):
+            count, exact, mean, rms, low, high = self.summary(op)
+            text += "    %-20s %10d %8.2f %12.3f %12.3f %12.3f %12.3f\n" % (
+                name, count, 100.0 * exact / max(count, 1), mean, rms, low, high)
+        text += "    Division by zero : %d\n" % self.div_by_zero
+        uvm_info(self.get_type_name(), "Error (DUT - exact) distribution" + text, UVM_LOW)
+
+        if (self.file_name):
+            with open(self.file_name, "w") as f:
+                json.dump(self.export(), f, indent=2)
+
+
+uvm_component_utils(err_stats)
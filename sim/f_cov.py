@@ -37,7 +37,7 @@
 # Description  : Funtional Coverage definitions and collections.
 #
 # Additional Comments:
-#
+#   With P_GDIV_LANES > 1 each lane of a request is sampled as one division.
 ##################################################################################################
 #
 import binascii
@@ -56,6 +56,7 @@ from uvm.comps import *
 from uvm.tlm1 import *
 from uvm.macros import *
 from wb4s_seq import *
+from golden_table import lanes_split
 
 
 class f_cov(UVMSubscriber):
@@ -79,21 +80,26 @@ class f_cov(UVMSubscriber):
         self.num_items    = 0
         self.tag          = name
         self.data_length  = 0
+        self.lanes        = 1    # P_GDIV_LANES, divisions per request
+        self.width        = 0    # Bits of each factor, all lanes
         self.factors_bins = None
+        self.sample       = None # cover points, created by the first write
+        self.operations   = [0, 1, 2, 3] # i_wb4s_tgd values, [4, 5] are divmod
         #
         self.data_bins_range = [0, 50]
 
 
-    def end_of_elaboration_phase(self, phase):
+    def setup_coverage(self):
         """
-           Function: end_of_elaboration_phase
+           Function: setup_coverage
 
-           Definition: This function is executed before the run phase. We generate the coverage
-             bins after the connect and build phase so that if the test intents to modify
-             self.data_bins_range it should have already done so. Also this way we only generate
-             self.factors_bins once as it is a loop that may have the pontential to slow the
-             simulation.
+           Definition: Generates the coverage bins and the cover points. Called by the first
+             write() instead of the end_of_elaboration_phase so the tests that never sample
+             do not pay for it, by then the test has already modified self.data_bins_range if
+             it intends to. The bins are generated only once as it is a loop that may have the
+             pontential to slow the simulation.
         """
+        self.width = int(self.data_length/2)
 
         if (self.data_length >= 8):
             # translate data length from width in bits to width in hex characters
@@ -101,6 +107,15 @@ class f_cov(UVMSubscriber):
 
         self.factors_bins = self.hex_bins_gen(self.data_length)
 
+        # Define the cover point
+        @coverage.CoverPoint("dut.operation", vname="div_rem_signess", bins = self.operations, weight = 80)
+        @coverage.CoverPoint("dut.dividend", vname="dividend", bins = self.factors_bins, weight = 10)
+        @coverage.CoverPoint("dut.divisor", vname="divisor", bins = self.factors_bins, weight = 10)
+        def sample(div_rem_signess, dividend, divisor):
+            pass
+
+        self.sample = sample
+
 
     def write(self, t):
         """
@@ -113,19 +128,22 @@ class f_cov(UVMSubscriber):
            Args:
              t: wb4s_seq (Sequence Item)
         """
+        if (self.sample is None):
+            self.setup_coverage()
 
-        # Define the cover point
-        @coverage.CoverPoint("dut.operation", vname="div_rem_signess", bins = [0, 1, 2, 3], weight = 80)
-        @coverage.CoverPoint("dut.dividend", vname="dividend", bins = self.factors_bins, weight = 10)
-        @coverage.CoverPoint("dut.divisor", vname="divisor", bins = self.factors_bins, weight = 10)
-        def sample(div_rem_signess, dividend, divisor):
-            pass
+        if (self.lanes > 1):
+            # One sample per lane
+            dividend, divisor = self.int_to_hex(t.data_in, self.width)
+            for lane_dividend, lane_divisor in zip(lanes_split(dividend, self.width, self.lanes),
+                                                   lanes_split(divisor, self.width, self.lanes)):
+                self.sample(t.data_tag, lane_dividend, lane_divisor)
+            return
 
         # get a string with the hex value of the dividend and the divisor
         dividend, divisor = self.int_to_hex(t.data_in, int(self.data_length/2))
 
         # Collect coverage
-        sample(t.data_tag , dividend, divisor)
+        self.sample(t.data_tag , dividend, divisor)
 
 
     def int_to_hex(self, int_value, factors_length):
@@ -0,0 +1,1265 @@
+##################################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2022, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##################################################################################################
+# File name    : gdiv_model.py
+# Author       : Jose R Garcia (jg-fossh@protonmail.com)
+# Project Name : Goldschmidt Integer Divider
+# Class Name   : gdiv_model
+# Description  : Cycle accurate model of Goldschmidt_Integer_Divider_Parallel. Mirrors the
+#                registers of the Divider_Accumulator_Process, Division_Step_Process and the
+#                multiplication processes so it predicts the stall, acknowledge and result of
+#                the RTL clock by clock for any parameter set.
+#
+# Additional Comments:
+#   Does not depend on cocotb nor uvm, it can be used stand alone to estimate the latency and
+#   throughput of a workload:
+#     python3 gdiv_model.py --factors-msb 31 --trace requests.csv
+#     python3 gdiv_model.py --factors-msb 31 --random 10000
+#   A trace has one request per line; dividend, divisor, tgd (decimal or 0x hexadecimal).
+#   The rom variant assumes Generic_Simple_DPRAM registers its read data.
+#   pipelined=1 models P_GDIV_PIPELINED=1, a shift register of rem_limit+3 stages holding the
+#   result of each accepted request, see unrolled().
+#   divmod=1 models P_GDIV_DIVMOD=1, tgd 4 to 5 return {remainder, quotient} in the time of a
+#   remainder.
+#   early_term=1 models P_GDIV_EARLY_TERM=1, see fast_forward(). --compare prints the latency
+#   of the workload with and without it:
+#     python3 gdiv_model.py --factors-msb 31 --random 10000 --dist log --early-term 1 --compare
+#   lanes=2 or 4 models Goldschmidt_Integer_Divider_Lanes, one narrower model per lane. The
+#   random requests of --lanes pack a division per lane, --sweep-lanes prints the divisions
+#   per clock of the same narrow divisions with every lane configuration:
+#     python3 gdiv_model.py --factors-msb 31 --random 10000 --sweep-lanes
+#   cores>1 models Goldschmidt_Integer_Divider_Cluster, one model per core, outputs_tagged()
+#   also returns the tag of the acknowledged request. --sweep-cores prints the results per
+#   clock of the workload from 1 to --cores cores:
+#     python3 gdiv_model.py --factors-msb 31 --random 10000 --cores 4 --sweep-cores
+#   rcp_cache>0 models P_GDIV_RCP_CACHE, the divisor reciprocal cache, see rcp_lookup(). The
+#   --repeat option draws the divisors of the random requests from that many values, --compare
+#   prints the latency of the workload with and without the cache:
+#     python3 gdiv_model.py --factors-msb 31 --random 10000 --repeat 4 --rcp-cache 4 --compare
+##################################################################################################
+import argparse
+import math
+import os
+
+from golden_table import lanes_pack, lanes_split
+from soak_stimulus import DISTRIBUTIONS, soak_stimulus
+
+
+class gdiv_model:
+    """
+       Class: Goldschmidt Divider Model
+
+       Definition: Register level model of the divider. outputs() evaluates the combinational
+         outputs for the current clock and clock() advances the registers one rising edge.
+    """
+
+    def __init__(self, factors_msb=24, frac_length=None, round_lvl=3, rduc_stp_by=0,
+                 variant="ff", lut_file=None, pipelined=0, divmod=0, early_term=0, lanes=1,
+                 cores=1, tag_msb=3, in_order=0, rcp_cache=0):
+        """
+           Function: new
+
+           Definition: Constructor. The arguments match the RTL parameters.
+
+           Args:
+             factors_msb: P_GDIV_FACTORS_MSB
+             frac_length: P_GDIV_FRAC_LENGTH, default P_GDIV_FACTORS_MSB+1
+             round_lvl: P_GDIV_ROUND_LVL
+             rduc_stp_by: P_GDIV_RDUC_STP_BY
+             variant: "ff" LookUp Table in flip flops, "rom" LookUp Table in block RAM
+             lut_file: $readmemb file of the rom variant, default lut.memb next to this file
+             pipelined: P_GDIV_PIPELINED
+             divmod: P_GDIV_DIVMOD
+             early_term: P_GDIV_EARLY_TERM, ignored when pipelined
+             lanes: P_GDIV_LANES, Goldschmidt_Integer_Divider_Lanes when greater than 1
+             cores: P_GDIV_CORES, Goldschmidt_Integer_Divider_Cluster when greater than 1
+             tag_msb: P_GDIV_TAG_MSB
+             in_order: P_GDIV_IN_ORDER
+             rcp_cache: P_GDIV_RCP_CACHE, entries of the divisor reciprocal cache, ignored when
+               pipelined
+        """
+        self.factors_msb = factors_msb
+        self.frac_length = factors_msb+1 if frac_length is None else frac_length
+        self.round_lvl   = round_lvl
+        self.rduc_stp_by = rduc_stp_by
+        self.variant     = variant
+        self.pipelined   = int(pipelined)
+        self.divmod      = int(divmod)
+        self.early_term  = int(early_term) == 1 and self.pipelined == 0
+        self.rcp_cache   = int(rcp_cache) if self.pipelined == 0 else 0
+
+        W = factors_msb+1
+        F = self.frac_length
+        # Vector widths and masks
+        self.width        = W
+        self.mask         = (1 << W)-1
+        self.frac_mask    = (1 << F)-1
+        self.mul_mask     = (1 << (W+F))-1   # [L_MUL_FACTORS_MSB:0]
+        self.product_mask = (1 << (W+2*F))-1 # [L_PRODUCT_MSB:0]
+        self.round_mask   = (1 << round_lvl)-1
+        # LookUp Table constants
+        lut_width   = (W*2)-F
+        nine_nibles = (W//4)-1
+        one_tength  = 1
+        for ii in range(nine_nibles):
+            one_tength = (one_tength << 4) | 0x9
+        self.lut_mask   = (1 << lut_width)-1
+        self.one_tength = (one_tength << max(lut_width-((nine_nibles*4)+4), 0)) & self.lut_mask
+        self.array_high = 0
+        jj = self.one_tength
+        while (jj > 0):
+            self.array_high += 1
+            jj //= 10
+        self.number_two = 2 << F
+        # Division iteration steps limits
+        self.quo_limit = math.ceil(math.sqrt(W))-1-rduc_stp_by
+        self.rem_limit = math.ceil(math.sqrt(W+F))-1-rduc_stp_by
+        self.step_mask = (1 << (self.rem_limit+1))-1
+        # Pipelined mode, normalize and EE stages plus one stage per step
+        self.pipe_depth = self.rem_limit+3
+        # Early termination, the divisor's fixed point 1-2^-F and the last step added
+        self.divisor_fixed = (1 << F)-2
+        self.ff_last       = max(self.quo_limit, self.rem_limit-1)
+        # Reciprocal cache, the scale chain divides 2^(W-1), its product shifted by W-1 is 2^(2F)/d.
+        # A hit's product is within 2^(F+quo_limit+4) of the steps' one, it is checked against
+        # the round up threshold with that guard band.
+        self.rcp_one       = (1 << (W-1)) << F
+        self.rcp_guard_lsb = F+self.quo_limit+4
+        self.rcp_ceil      = ((1 << round_lvl)-1) << (2*F-round_lvl)
+        if (self.rcp_cache > 0 and (F < W or F > W+1)):
+            raise ValueError("rcp_cache requires factors_msb+1 <= frac_length <= factors_msb+2")
+        if (self.rcp_cache > 0 and self.rcp_guard_lsb > 2*F-round_lvl):
+            raise ValueError("rcp_cache requires frac_length >= quo_limit+4+round_lvl")
+
+        self.lut_mem = []
+        if (variant == "rom"):
+            lut_file = lut_file or os.path.join(os.path.dirname(os.path.abspath(__file__)), "lut.memb")
+            with open(lut_file) as f:
+                self.lut_mem = [int(line, 2) & self.lut_mask for line in f if line.strip()]
+        elif (variant != "ff"):
+            raise ValueError("Unknown variant " + str(variant) + ", expected ff or rom")
+
+        # SIMD lane mode, one model per lane of Goldschmidt_Integer_Divider_Lanes
+        self.lanes       = int(lanes)
+        self.lane_width  = W // self.lanes
+        self.lane_models = []
+        if (self.lanes > 1):
+            if (self.lanes not in (2, 4) or (W % self.lanes) != 0 or (F % self.lanes) != 0 or self.lane_width < 8):
+                raise ValueError("Unsupported lanes " + str(lanes) + " for factors_msb " + str(factors_msb))
+            self.lane_models = [gdiv_model(self.lane_width-1, F // self.lanes, round_lvl, rduc_stp_by, variant,
+                                           lut_file, pipelined, divmod, early_term, rcp_cache=rcp_cache)
+                                for kk in range(self.lanes)]
+            # The steps are the lanes' ones
+            self.quo_limit  = self.lane_models[0].quo_limit
+            self.rem_limit  = self.lane_models[0].rem_limit
+            self.pipe_depth = self.lane_models[0].pipe_depth
+
+        # Cluster, one model per core of Goldschmidt_Integer_Divider_Cluster
+        self.cores       = int(cores)
+        self.core_mask   = (1 << self.cores)-1
+        self.tag_mask    = (1 << (tag_msb+1))-1
+        self.in_order    = int(in_order)
+        self.seq_mask    = (1 << max(1, (self.cores-1).bit_length()))-1
+        self.core_models = []
+        if (self.cores > 1):
+            if (self.pipelined or self.lanes > 1 or self.cores > self.tag_mask+1):
+                raise ValueError("Unsupported cores " + str(cores) + ", iterative without lanes and tag_msb " +
+                                 str(tag_msb) + " tags every core")
+            self.core_models = [gdiv_model(factors_msb, frac_length, round_lvl, rduc_stp_by, variant, lut_file,
+                                           divmod=divmod, early_term=early_term, rcp_cache=rcp_cache)
+                                for kk in range(self.cores)]
+
+        self.latency_cache = {}
+        self.reset()
+
+
+    def reset(self):
+        """
+           Function: reset
+
+           Definition: Clears the registers, equivalent to power up followed by reset.
+        """
+        self.r_stall          = 0
+        self.r_ack            = 0
+        self.r_calc_remainder = 0
+        self.r_neg_result     = 0
+        self.r_divisor        = 0
+        self.r_1step_result   = 0
+        self.r_gte_twenty     = 0
+        self.r_rem_zero       = 0
+        self.r_divmod         = 0
+        self.r_quotient       = 0
+        self.r_div_step       = 1
+        self.r_product0       = 0
+        self.r_product1       = 0
+        self.r_lut_value      = self.one_tength if self.variant == "ff" else 0
+        # Pipelined mode stages, the result of a valid stage or None
+        self.r_pipe           = [None] * self.pipe_depth
+        # Lane mode, Lane_Results_Process
+        self.r_pending        = 0
+        self.r_lane_data      = [0] * self.lanes
+        for lane in self.lane_models:
+            lane.reset()
+        # Cluster, Cluster_Process and Core_Request_Process
+        self.r_busy           = 0
+        self.r_done           = 0
+        self.r_seq_in         = 0
+        self.r_seq_out        = 0
+        self.r_core_data      = [0] * self.cores
+        self.r_core_tag       = [0] * self.cores
+        self.r_core_seq       = [0] * self.cores
+        for core in self.core_models:
+            core.reset()
+        # Reciprocal cache, Reciprocal_Cache_Process and the scale chain
+        self.r_product2       = 0
+        self.r_rcp_fill       = 0
+        self.r_rcp_check      = 0
+        self.r_rcp_valid      = [0] * self.rcp_cache
+        self.r_rcp_key        = [0] * self.rcp_cache
+        self.r_rcp_value      = [0] * self.rcp_cache
+        self.r_rcp_next       = 0
+        self.r_rcp_hits       = 0
+        self.r_rcp_misses     = 0
+
+
+    ###############################################################################################
+    # Constant functions
+    ###############################################################################################
+    def two_ee(self, ee):
+        """
+           Function: two_ee
+
+           Definition: F_TWO_EE, 20*10^ee truncated to the factors width.
+        """
+        return (20 * pow(10, ee)) & self.mask
+
+
+    def ee_lut(self, nth_iteration):
+        """
+           Function: ee_lut
+
+           Definition: F_EE_LUT, 0.1 divided by 10 nth_iteration-1 times.
+        """
+        return self.one_tength // pow(10, max(nth_iteration-1, 0))
+
+
+    def lut_select(self, divisor, lut_value):
+        """
+           Function: lut_select
+
+           Definition: Value loaded into r_lut_value by the ff variant when a division starts.
+        """
+        for ii in range(2, self.array_high+1):
+            if (divisor >= self.two_ee(ii-1)):
+                lut_value = self.ee_lut(ii)
+        return lut_value
+
+
+    def lut_addr(self, divisor):
+        """
+           Function: lut_addr
+
+           Definition: F_LUT_ADDR, block RAM address used by the rom variant.
+        """
+        addr = 0
+        for jj in range(1, self.array_high+1):
+            if (divisor >= self.two_ee(jj)):
+                addr = jj
+        return addr
+
+
+    ###############################################################################################
+    # Combinational logic
+    ###############################################################################################
+    def bit(self, vector, index):
+        return (vector >> index) & 1
+
+
+    def factors(self, data, tgd):
+        """
+           Function: factors
+
+           Definition: Splits i_wb4s_data and returns the raw dividend and divisor and their
+             magnitudes (w_dividend, w_divisor) as the RTL does for the requested signedness.
+        """
+        dividend   = data & self.mask
+        divisor    = (data >> self.width) & self.mask
+        w_dividend = dividend
+        w_divisor  = divisor
+        if ((tgd & 1) == 0):
+            if (self.bit(dividend, self.factors_msb)):
+                w_dividend = (-dividend) & self.mask
+            if (self.bit(divisor, self.factors_msb)):
+                w_divisor = (-divisor) & self.mask
+        return dividend, divisor, w_dividend, w_divisor
+
+
+    def special_case(self, dividend, divisor, w_dividend, w_divisor):
+        """
+           Function: special_case
+
+           Definition: Returns the single clock result of the corner cases, None when the
+             iterative process is required.
+        """
+        if (divisor == 0):
+            return self.mask                # -1
+        if (w_dividend < w_divisor):
+            return 0
+        if (w_divisor == 1):
+            return dividend
+        if (self.width >= 32 and w_divisor == self.mask):
+            return (-dividend) & self.mask  # w_divisor == -1 only matches at 32 bits or wider
+        if (dividend == divisor):
+            return 1
+        return None
+
+
+    def is_divmod(self, tgd):
+        """
+           Function: is_divmod
+
+           Definition: w_divmod, tgd[2] requests the quotient and remainder when P_GDIV_DIVMOD=1.
+        """
+        return self.divmod == 1 and ((tgd >> 2) & 1) == 1
+
+
+    def ceil(self, product0=None):
+        """
+           Function: ceil
+
+           Definition: w_ceil, the P_GDIV_ROUND_LVL bits after the fixed point are all ones.
+
+           Args:
+             product0: dividend product, default r_product0
+        """
+        F        = self.frac_length
+        product0 = self.r_product0 if product0 is None else product0
+        return ((product0 >> ((2*F)-self.round_lvl)) & self.round_mask) == self.round_mask
+
+
+    def result_magnitude(self, product0=None):
+        """
+           Function: result_magnitude
+
+           Definition: w_result_mag, the integer part of r_product0 rounded up by w_ceil.
+
+           Args:
+             product0: dividend product, default r_product0
+        """
+        product0 = self.r_product0 if product0 is None else product0
+        mag      = (product0 >> (2*self.frac_length)) & self.mask
+        if (self.ceil(product0)):
+            mag = (mag+1) & self.mask
+        return mag
+
+
+    def unrolled(self, data, tgd):
+        """
+           Function: unrolled
+
+           Definition: Result of one request through the stages of the pipelined mode, which
+             take the same steps as the iterative FSM.
+
+           Args:
+             data: i_wb4s_data, {divisor, dividend}
+             tgd: i_wb4s_tgd
+        """
+        if (self.lanes > 1):
+            dividends = lanes_split(data & self.mask, self.width, self.lanes)
+            divisors  = lanes_split(data >> self.width, self.width, self.lanes)
+            return lanes_pack([lane.unrolled((divisor << self.lane_width) | dividend, tgd) for lane, dividend, divisor
+                               in zip(self.lane_models, dividends, divisors)], self.width)
+
+        if (self.is_divmod(tgd)):
+            # The quotient is taken from the remainder's stages, same steps as a quotient.
+            return (self.unrolled(data, (tgd & 1) | 2) << self.width) | self.unrolled(data, tgd & 1)
+
+        F = self.frac_length
+        dividend, divisor, w_dividend, w_divisor = self.factors(data, tgd)
+        one_step = self.special_case(dividend, divisor, w_dividend, w_divisor)
+        if (one_step is not None):
+            return one_step
+        neg_result     = (tgd & 1) == 0 and self.bit(dividend, self.factors_msb) != self.bit(divisor, self.factors_msb)
+        calc_remainder = (tgd >> 1) & 1
+        # Normalize stage
+        multiplier = self.one_tength & self.mul_mask
+        product0   = (((w_dividend << F) & self.mul_mask) * multiplier) & self.product_mask
+        product1   = (((w_divisor << F) & self.mul_mask) * multiplier) & self.product_mask
+        # EE stage
+        if (w_divisor >= 20):
+            if (self.variant == "ff"):
+                multiplier = self.lut_select(w_divisor, self.one_tength) & self.mul_mask
+            else:
+                addr       = self.lut_addr(w_divisor)
+                multiplier = (self.lut_mem[addr] if addr < len(self.lut_mem) else 0) & self.mul_mask
+            product0 = (((product0 >> F) & self.mul_mask) * multiplier) & self.product_mask
+            product1 = (((product1 >> F) & self.mul_mask) * multiplier) & self.product_mask
+        # Step stages
+        for step in range(self.rem_limit+1):
+            if (not calc_remainder and step > self.quo_limit):
+                break
+            if (calc_remainder and step == self.quo_limit and self.ceil(product0)):
+                return 0
+            if (calc_remainder and step == self.rem_limit):
+                product0 = ((product0 & self.frac_mask) * ((w_divisor << F) & self.mul_mask)) & self.product_mask
+            else:
+                multiplier = (self.number_two + (~(product1 >> F) & self.mul_mask)) & self.mul_mask
+                product0   = (((product0 >> F) & self.mul_mask) * multiplier) & self.product_mask
+                product1   = (((product1 >> F) & self.mul_mask) * multiplier) & self.product_mask
+
+        mag = self.result_magnitude(product0)
+        return (-mag) & self.mask if neg_result else mag
+
+
+    def fast_forward(self, step, product0=None, last=None):
+        """
+           Function: fast_forward
+
+           Definition: w_ff_product, r_product0 after each step from the current one to
+             ff_last when every one multiplies by 1+2^-F, {step: product}.
+
+           Args:
+             step: Current step, the index of the bit set in r_div_step
+             product0: product of the first step, default r_product0
+             last: last step, default ff_last
+        """
+        F        = self.frac_length
+        product0 = self.r_product0 if product0 is None else product0
+        last     = self.ff_last if last is None else last
+        products = {}
+        for kk in range(step, last+1):
+            x            = (product0 >> F) & self.mul_mask
+            product0     = ((x << F) + x) & self.product_mask
+            products[kk] = product0
+        return products
+
+
+    def rcp_lookup(self, w_divisor):
+        """
+           Function: rcp_lookup
+
+           Definition: w_rcp_match, returns the divisor's scaling product, None when the
+             reciprocal cache does not have it. The scaling product is the one of the quotient's
+             steps, the dividend times it is within the guard band of rcp_near() of the r_product0
+             of the quotient's last step. The entry written at the end of the clock is looked up
+             as if it was written, the division being acknowledged forwards its scaling product
+             and the one it replaces is not matched.
+
+           Args:
+             w_divisor: Divisor magnitude
+        """
+        filling = self.r_ack and self.r_rcp_fill
+        if (filling and self.r_divisor == w_divisor):
+            return (self.r_product2 >> self.factors_msb) & self.mul_mask
+        for kk in range(self.rcp_cache):
+            if (self.r_rcp_valid[kk] and self.r_rcp_key[kk] == w_divisor and
+                not (filling and kk == self.r_rcp_next)):
+                return self.r_rcp_value[kk]
+        return None
+
+
+    def rcp_near(self, product=None):
+        """
+           Function: rcp_near
+
+           Definition: w_rcp_near, True when the fraction of the product is within
+             2^rcp_guard_lsb of the round up threshold, the steps' product may round the other
+             way. Always True when the guard band does not fit below the threshold.
+
+           Args:
+             product: Defaults to r_product2
+        """
+        F       = self.frac_length
+        product = self.r_product2 if product is None else product
+        offset  = (product & ((1 << (2*F))-1)) - self.rcp_ceil
+        return (self.rcp_guard_lsb > 2*F-self.round_lvl or
+                -(1 << self.rcp_guard_lsb) <= offset < (1 << self.rcp_guard_lsb))
+
+
+    def rcp_counters(self):
+        """
+           Function: rcp_counters
+
+           Definition: Returns (hits, misses) of the reciprocal cache, the sum of every lane or
+             core.
+        """
+        models = self.lane_models or self.core_models or [self]
+        return (sum(model.r_rcp_hits for model in models), sum(model.r_rcp_misses for model in models))
+
+
+    def outputs(self, stb):
+        """
+           Function: outputs
+
+           Definition: Returns (o_wb4s_stall, o_wb4s_ack, o_wb4s_data) of the current clock.
+             Like the RTL's, the result is selected with the registers only.
+
+           Args:
+             stb: i_wb4s_stb, the outputs do not depend on it
+        """
+        if (self.lanes > 1):
+            return self.lanes_outputs(stb)
+
+        if (self.cores > 1):
+            return self.outputs_tagged(stb)[0:3]
+
+        if (self.pipelined):
+            last = self.r_pipe[-1]
+            return 0, int(last is not None), 0 if last is None else last
+
+        mag        = self.result_magnitude()
+        signed_mag = (-mag) & self.mask if self.r_neg_result else mag
+
+        if (self.r_rem_zero):
+            result = 0
+        elif (not self.r_stall and self.r_calc_remainder):
+            result = signed_mag
+        elif (not self.r_stall and self.bit(self.r_div_step, self.quo_limit+1) == 0):
+            result = self.r_1step_result
+        else:
+            result = signed_mag
+
+        if (self.r_divmod):
+            quotient = signed_mag if self.r_rem_zero else self.r_quotient
+            result   = (result << self.width) | quotient
+
+        return self.r_stall, self.r_ack, result
+
+
+    ###############################################################################################
+    # Sequential logic
+    ###############################################################################################
+    def outputs_tagged(self, stb):
+        """
+           Function: outputs_tagged
+
+           Definition: Returns (o_wb4s_stall, o_wb4s_ack, o_wb4s_data, o_wb4s_tgd) of the
+             current clock. Only the cluster has o_wb4s_tgd, the others return 0.
+
+           Args:
+             stb: i_wb4s_stb, the outputs do not depend on it
+        """
+        if (self.cores == 1):
+            return self.outputs(stb) + (0,)
+
+        outs, acks, sel = self.cluster_select()
+        free = (~self.r_busy | sel) & self.core_mask
+        if (sel == 0):
+            return int(free == 0), 0, 0, 0
+        kk     = sel.bit_length()-1
+        result = self.r_core_data[kk] if (self.r_done >> kk) & 1 else outs[kk][2]
+        return int(free == 0), 1, result, self.r_core_tag[kk]
+
+
+    def clock(self, cyc, stb, tgd, data, rst=0, tga=0):
+        """
+           Function: clock
+
+           Definition: Advances the registers one rising edge of i_clk with the given inputs.
+
+           Args:
+             cyc: i_wb4s_cyc
+             stb: i_wb4s_stb
+             tgd: i_wb4s_tgd
+             data: i_wb4s_data, {divisor, dividend}
+             rst: i_rst
+             tga: i_wb4s_tga, the request tag of the cluster
+        """
+        if (self.lanes > 1):
+            self.lanes_clock(cyc, stb, tgd, data, rst)
+            return
+
+        if (self.cores > 1):
+            self.cluster_clock(cyc, stb, tgd, data, rst, tga)
+            return
+
+        if (self.pipelined):
+            if (rst or not cyc):
+                self.r_pipe = [None] * self.pipe_depth
+            else:
+                self.r_pipe = [self.unrolled(data, tgd) if stb else None] + self.r_pipe[:-1]
+            return
+
+        F = self.frac_length
+        dividend, divisor, w_dividend, w_divisor = self.factors(data, tgd)
+        # FSM states
+        s_initiate = stb and not self.r_stall
+        s_ee_mul   = self.r_gte_twenty
+        s_iterate  = not self.r_gte_twenty and self.r_stall
+        step_quo   = self.bit(self.r_div_step, self.quo_limit)
+        step_rem   = self.bit(self.r_div_step, self.rem_limit)
+        converged  = step_rem if self.r_calc_remainder else step_quo
+        calc_frac  = step_rem and self.r_calc_remainder
+        ceil       = self.ceil()
+        # Reciprocal cache, a quotient whose divisor is found starts its steps while the scale
+        # chain multiplies the dividend by the cached scaling product, the next clock takes that
+        # product unless it is near the round up threshold. Remainders and divmods take the steps.
+        rcp_lookup = (s_initiate and self.rcp_cache > 0 and
+                      self.special_case(dividend, divisor, w_dividend, w_divisor) is None)
+        rcp_value  = self.rcp_lookup(w_divisor) if rcp_lookup else None
+        rcp_start  = rcp_value is not None and ((tgd >> 1) & 1) == 0 and not self.is_divmod(tgd)
+        rcp_hit    = self.r_rcp_check and not self.rcp_near()
+        # Early termination, the divisor is at its fixed point and steps are left
+        step      = self.r_div_step.bit_length()-1
+        last_step = self.rem_limit-1 if self.r_calc_remainder else self.quo_limit
+        fast_forward = (self.early_term and s_iterate and step < last_step and
+            ((self.r_product1 >> F) & self.mul_mask) == self.divisor_fixed and
+            not (ceil and self.r_calc_remainder and step_quo))
+        if (fast_forward):
+            ff_products = self.fast_forward(step)
+            ff_rem_zero = (self.r_calc_remainder and step < self.quo_limit and
+                           self.ceil(ff_products[max(self.quo_limit-1, 0)]))
+            if (self.r_calc_remainder and not ff_rem_zero):
+                ff_product0 = ff_products[max(self.rem_limit-1, 0)]
+            else:
+                ff_product0 = ff_products[self.quo_limit]
+        # Divmod Quotient Process, evaluated with r_product0's value before this edge
+        if (s_initiate):
+            one_step        = self.special_case(dividend, divisor, w_dividend, w_divisor)
+            self.r_quotient = 0 if one_step is None else one_step
+        elif (fast_forward and step <= self.quo_limit):
+            mag             = self.result_magnitude(ff_products[self.quo_limit])
+            self.r_quotient = (-mag) & self.mask if self.r_neg_result else mag
+        elif (s_iterate and self.bit(self.r_div_step, self.quo_limit+1)):
+            mag             = self.result_magnitude()
+            self.r_quotient = (-mag) & self.mask if self.r_neg_result else mag
+        # Multipliers' inputs
+        if (s_initiate):
+            divisor_acc  = (w_divisor << F) & self.mul_mask
+            dividend_acc = (w_dividend << F) & self.mul_mask
+            multiplier   = self.one_tength & self.mul_mask
+        else:
+            divisor_acc = (self.r_product1 >> F) & self.mul_mask
+            if (calc_frac):
+                dividend_acc = self.r_product0 & self.frac_mask
+            else:
+                dividend_acc = (self.r_product0 >> F) & self.mul_mask
+            if (s_ee_mul):
+                multiplier = self.r_lut_value & self.mul_mask
+            elif (calc_frac):
+                multiplier = (self.r_divisor << F) & self.mul_mask
+            else:
+                multiplier = (self.number_two + (~divisor_acc & self.mul_mask)) & self.mul_mask
+
+        # Division Step Process, evaluated with the registers' values before this edge
+        if (rcp_hit):
+            # The quotient's steps are done.
+            next_div_step = (1 << (self.quo_limit+1)) & self.step_mask
+        elif (fast_forward):
+            if (self.r_calc_remainder and not ff_rem_zero):
+                next_div_step = 1 << self.rem_limit
+            else:
+                next_div_step = (1 << (self.quo_limit+1)) & self.step_mask
+        elif (self.r_stall and not s_ee_mul):
+            next_div_step = (self.r_div_step << 1) & self.step_mask
+        else:
+            next_div_step = 1
+
+        # Reciprocal Cache Process, filled with the scaling product of the division acknowledged
+        if (rst):
+            self.r_rcp_valid  = [0] * self.rcp_cache
+            self.r_rcp_check  = 0
+            self.r_rcp_next   = 0
+            self.r_rcp_hits   = 0
+            self.r_rcp_misses = 0
+        elif (self.rcp_cache > 0):
+            if (self.r_ack and self.r_rcp_fill):
+                # Replaces the oldest entry
+                kk              = self.r_rcp_next
+                self.r_rcp_next = (self.r_rcp_next+1) % self.rcp_cache
+                self.r_rcp_valid[kk] = 1
+                self.r_rcp_key[kk]   = self.r_divisor
+                self.r_rcp_value[kk] = (self.r_product2 >> self.factors_msb) & self.mul_mask
+            # Misses are the divisors not found and the products near the threshold
+            self.r_rcp_hits   += int(rcp_hit)
+            self.r_rcp_misses += int(not rcp_hit and ((cyc and rcp_lookup and not rcp_start) or self.r_rcp_check))
+            self.r_rcp_check   = int(cyc and rcp_start)
+
+        # Multiplication Processes
+        if (cyc):
+            if (rcp_hit):
+                self.r_product0 = self.r_product2
+            else:
+                self.r_product0 = ff_product0 if fast_forward else (dividend_acc * multiplier) & self.product_mask
+            self.r_product1 = (divisor_acc * multiplier) & self.product_mask
+            if (self.rcp_cache > 0 and fast_forward and step <= self.quo_limit):
+                self.r_product2 = self.fast_forward(step, self.r_product2, self.quo_limit)[self.quo_limit]
+            elif (self.rcp_cache > 0 and (s_initiate or (self.r_div_step >> (self.quo_limit+1)) == 0)):
+                # Scale chain, the dividend chain of 2^(W-1) up to the quotient's last step, or the
+                # dividend times the cached scaling product
+                if (rcp_start):
+                    self.r_product2 = (w_dividend * rcp_value) & self.product_mask
+                else:
+                    scale_acc       = self.rcp_one if s_initiate else (self.r_product2 >> F) & self.mul_mask
+                    self.r_product2 = (scale_acc * multiplier) & self.product_mask
+
+        # LookUp Table, the rom variant reads the block RAM every clock
+        if (self.variant == "rom"):
+            addr = 0 if (s_iterate or rst) else self.lut_addr(w_divisor)
+            self.r_lut_value = self.lut_mem[addr] if addr < len(self.lut_mem) else 0
+
+        # Divider Accumulator Process
+        if (rst or not cyc):
+            self.r_stall          = 0
+            self.r_ack            = 0
+            self.r_divisor        = 0
+            self.r_1step_result   = 0
+            self.r_gte_twenty     = 0
+            self.r_calc_remainder = 0
+            self.r_neg_result     = 0
+            self.r_rem_zero       = 0
+            self.r_divmod         = 0
+            self.r_rcp_fill       = 0
+            if (self.variant == "ff"):
+                self.r_lut_value = self.one_tength
+        elif (s_initiate):
+            one_step = self.special_case(dividend, divisor, w_dividend, w_divisor)
+            if (one_step is not None):
+                self.r_1step_result = one_step
+                self.r_stall        = 0
+                self.r_ack          = 1
+            else:
+                self.r_neg_result   = int((tgd & 1) == 0 and
+                    self.bit(dividend, self.factors_msb) != self.bit(divisor, self.factors_msb))
+                self.r_1step_result = 0
+                self.r_gte_twenty   = int(w_divisor >= 20)
+                self.r_stall        = 1
+                self.r_ack          = 0
+                if (self.variant == "ff"):
+                    self.r_lut_value = self.lut_select(w_divisor, self.r_lut_value)
+            self.r_rcp_fill       = int(one_step is None and rcp_value is None) # Divisors not in the cache
+            self.r_divmod         = int(self.is_divmod(tgd))
+            self.r_calc_remainder = ((tgd >> 1) & 1) | self.r_divmod # divmod takes the remainder's steps
+            self.r_divisor        = w_divisor
+            self.r_rem_zero       = 0
+        elif (rcp_hit):
+            # The dividend times the cached scaling product is the quotient.
+            self.r_gte_twenty = 0
+            self.r_rem_zero   = 0
+            self.r_stall      = 0
+            self.r_ack        = 1
+            if (self.variant == "ff"):
+                self.r_lut_value = self.one_tength
+        elif (s_ee_mul):
+            self.r_gte_twenty = 0
+            if (self.variant == "ff"):
+                self.r_lut_value = self.one_tength
+        elif (s_iterate):
+            if (ceil and self.r_calc_remainder and step_quo):
+                self.r_rem_zero = 1
+                self.r_stall    = 0
+                self.r_ack      = 1
+            elif (converged):
+                self.r_rem_zero = 0
+                self.r_stall    = 0
+                self.r_ack      = 1
+            elif (fast_forward and (ff_rem_zero or not self.r_calc_remainder)):
+                self.r_rem_zero = int(ff_rem_zero)
+                self.r_stall    = 0
+                self.r_ack      = 1
+            else:
+                self.r_rem_zero = 0
+                self.r_stall    = 1
+                self.r_ack      = 0
+        else:
+            self.r_divisor        = 0
+            self.r_1step_result   = 0
+            self.r_calc_remainder = 0
+            self.r_neg_result     = 0
+            self.r_stall          = 0
+            self.r_ack            = 0
+            self.r_rem_zero       = 0
+            self.r_divmod         = 0
+            self.r_gte_twenty     = 0
+            self.r_rcp_fill       = 0
+            if (self.variant == "ff"):
+                self.r_lut_value = self.one_tength
+
+        self.r_div_step = next_div_step
+
+
+    ###############################################################################################
+    # Lane mode, Goldschmidt_Integer_Divider_Lanes
+    ###############################################################################################
+    def lanes_acks(self):
+        """
+           Function: lanes_acks
+
+           Definition: Returns the lanes' outputs of the current clock and their acknowledges,
+             one bit per lane.
+        """
+        outs = [lane.outputs(0) for lane in self.lane_models]
+        acks = 0
+        for kk, (stall, ack, result) in enumerate(outs):
+            acks |= ack << kk
+        return outs, acks
+
+
+    def lanes_outputs(self, stb):
+        """
+           Function: lanes_outputs
+
+           Definition: outputs() of the lane mode. The transaction is acknowledged with the
+             last of its lanes, the lanes done before return the result they kept.
+        """
+        outs, acks = self.lanes_acks()
+        waiting    = (self.r_pending & ~acks) != 0
+        results    = [out[2] if out[1] else self.r_lane_data[kk] for kk, out in enumerate(outs)]
+        if (self.pipelined):
+            return 0, outs[0][1], lanes_pack(results, self.width)
+        return int(waiting), int(self.r_pending != 0 and not waiting), lanes_pack(results, self.width)
+
+
+    def lanes_clock(self, cyc, stb, tgd, data, rst):
+        """
+           Function: lanes_clock
+
+           Definition: clock() of the lane mode. Every lane gets the strobe only when the
+             transaction is accepted, and its own {divisor, dividend}.
+        """
+        outs, acks = self.lanes_acks()
+        accept     = int(bool(stb) and (self.r_pending & ~acks) == 0)
+        # Lane Data Process
+        for kk, out in enumerate(outs):
+            if (out[1]):
+                self.r_lane_data[kk] = out[2]
+        # Lane Results Process
+        if (rst or not cyc or self.pipelined):
+            self.r_pending = 0
+        elif (accept):
+            self.r_pending = (1 << self.lanes)-1
+        else:
+            self.r_pending &= ~acks
+
+        dividends = lanes_split(data & self.mask, self.width, self.lanes)
+        divisors  = lanes_split(data >> self.width, self.width, self.lanes)
+        for lane, dividend, divisor in zip(self.lane_models, dividends, divisors):
+            lane.clock(cyc, accept, tgd, (divisor << self.lane_width) | dividend, rst)
+
+
+    ###############################################################################################
+    # Cluster, Goldschmidt_Integer_Divider_Cluster
+    ###############################################################################################
+    def cluster_select(self):
+        """
+           Function: cluster_select
+
+           Definition: Returns the cores' outputs of the current clock, their acknowledges and
+             the core whose result is acknowledged, one bit per core.
+        """
+        outs  = [core.outputs(0) for core in self.core_models]
+        acks  = 0
+        head  = 0
+        for kk, (stall, ack, result) in enumerate(outs):
+            acks |= ack << kk
+            if ((self.r_busy >> kk) & 1 and self.r_core_seq[kk] == self.r_seq_out):
+                head |= 1 << kk
+        ready = (self.r_done | acks) & (head if self.in_order else -1)
+        return outs, acks, ready & -ready
+
+
+    def cluster_clock(self, cyc, stb, tgd, data, rst, tga):
+        """
+           Function: cluster_clock
+
+           Definition: clock() of the cluster. The request goes to the lowest numbered free core,
+             the core acknowledged in this clock is free.
+        """
+        outs, acks, sel = self.cluster_select()
+        free     = (~self.r_busy | sel) & self.core_mask
+        accept   = int(bool(stb) and free != 0)
+        dispatch = (free & -free) if accept else 0
+        # Core Request Process
+        for kk, out in enumerate(outs):
+            if ((dispatch >> kk) & 1):
+                self.r_core_tag[kk] = tga & self.tag_mask
+                self.r_core_seq[kk] = self.r_seq_in
+            if (out[1]):
+                self.r_core_data[kk] = out[2]
+        # Cluster Process
+        if (rst or not cyc):
+            self.r_busy    = 0
+            self.r_done    = 0
+            self.r_seq_in  = 0
+            self.r_seq_out = 0
+        else:
+            self.r_busy    = (self.r_busy & ~sel) | dispatch
+            self.r_done    = (self.r_done | acks) & ~sel
+            self.r_seq_in  = (self.r_seq_in + accept) & self.seq_mask
+            self.r_seq_out = (self.r_seq_out + int(sel != 0)) & self.seq_mask
+
+        for kk, core in enumerate(self.core_models):
+            core.clock(cyc, (dispatch >> kk) & 1, tgd, data, rst)
+
+
+    ###############################################################################################
+    # Request level helpers
+    ###############################################################################################
+    def run(self, requests, max_clocks=None, keep=False, max_in_flight=None):
+        """
+           Function: run
+
+           Definition: Drives a stream of requests back to back, the strobe stays asserted
+             until the last request is accepted, and returns one (result, accept_clock,
+             ack_clock) per request in the order of the requests. Clock 0 is the first clock
+             the strobe is asserted. Each request gets the lowest tag not in flight, the
+             cluster's acknowledges are paired by their tag.
+
+           Args:
+             requests: iterable of (dividend, divisor, tgd)
+             max_clocks: time out, default 64 clocks per request
+             keep: start from the current registers instead of reset, the reciprocal cache
+               keeps its entries
+             max_in_flight: de-asserts the strobe while this many requests are in flight,
+               the tags stay below it. Default no limit
+        """
+        pending   = [((divisor << self.width) | dividend, tgd) for dividend, divisor, tgd in requests]
+        results   = [None] * len(pending)
+        in_flight = [] # (request, accept_clock, tag)
+        issued    = 0
+        done      = 0
+        clock     = 0
+        max_clocks = max_clocks or (64 * max(len(pending), 1))
+
+        if (not keep):
+            self.reset()
+        while (done < len(pending) and clock < max_clocks):
+            stb       = int(issued < len(pending) and (max_in_flight is None or len(in_flight) < max_in_flight))
+            data, tgd = pending[issued] if stb else (0, 0)
+            tga       = free_tag([entry[2] for entry in in_flight])
+
+            stall, ack, result, tag = self.outputs_tagged(stb)
+            if (ack and in_flight):
+                kk = 0
+                if (self.cores > 1):
+                    kk = next(ii for ii, entry in enumerate(in_flight) if entry[2] == tag)
+                request, accept, tga_ack = in_flight.pop(kk)
+                results[request] = (result, accept, clock)
+                done += 1
+            if (stb and not stall):
+                in_flight.append((issued, clock, tga))
+                issued += 1
+
+            self.clock(1, stb, tgd, data, tga=tga)
+            clock += 1
+
+        return [entry for entry in results if entry is not None]
+
+
+    def latency(self, dividend, divisor, tgd):
+        """
+           Function: latency
+
+           Definition: Clocks from the request being accepted to its acknowledge. Requests do
+             not depend on the previous ones, so in the iterative mode this is also the amount
+             of clocks a request occupies the divider in a back to back stream. With the
+             reciprocal cache they depend on the divisors before, the requests must be given in
+             the order they were accepted, each one goes through the model.
+        """
+        if (self.pipelined):
+            return self.pipe_depth
+        if (self.rcp_cache > 0):
+            result, accept, ack = self.run([(dividend & self.mask, divisor & self.mask, tgd & 7)], keep=True)[0]
+            return ack - accept
+        key = (dividend & self.mask, divisor & self.mask, tgd & 7)
+        if (key not in self.latency_cache):
+            result, accept, ack = self.run([key])[0]
+            self.latency_cache[key] = ack - accept
+        return self.latency_cache[key]
+
+
+    def estimate(self, requests, max_in_flight=None):
+        """
+           Function: estimate
+
+           Definition: Returns (clocks, {tgd: [count, total latency, min, max]}) of a
+             back to back stream of requests. The pipelined mode accepts one request per clock.
+             The cluster's requests overlap, they are run clock by clock, max_in_flight limits
+             how many, see run().
+        """
+        if (self.cores > 1):
+            return self.estimate_cluster(requests, max_in_flight=max_in_flight)
+
+        self.reset()
+        clocks = 0
+        per_op = {}
+        for dividend, divisor, tgd in requests:
+            lat = self.latency(dividend, divisor, tgd)
+            clocks += lat
+            stats = per_op.setdefault(tgd & 7, [0, 0, lat, lat])
+            stats[0] += 1
+            stats[1] += lat
+            stats[2]  = min(stats[2], lat)
+            stats[3]  = max(stats[3], lat)
+        if (self.pipelined and per_op):
+            clocks = sum(stats[0] for stats in per_op.values()) + self.pipe_depth - 1
+        return clocks, per_op
+
+
+    def estimate_cluster(self, requests, max_in_flight=None, keep=False):
+        """
+           Function: estimate_cluster
+
+           Definition: estimate() of the cluster, clocks from the first request accepted to the
+             last acknowledge.
+        """
+        requests = list(requests)
+        results  = self.run(requests, keep=keep, max_in_flight=max_in_flight)
+        per_op   = {}
+        for (dividend, divisor, tgd), (result, accept, ack) in zip(requests, results):
+            lat   = ack - accept
+            stats = per_op.setdefault(tgd & 7, [0, 0, lat, lat])
+            stats[0] += 1
+            stats[1] += lat
+            stats[2]  = min(stats[2], lat)
+            stats[3]  = max(stats[3], lat)
+        clocks = 0
+        if (results):
+            clocks = max(ack for result, accept, ack in results) - min(accept for result, accept, ack in results)
+        return clocks, per_op
+
+
+def free_tag(in_flight):
+    """
+       Function: free_tag
+
+       Definition: Returns the lowest tag not used by the requests in flight, the cluster's
+         tags must tell apart the requests in flight.
+
+       Args:
+         in_flight: tags of the requests in flight
+    """
+    tag = 0
+    while (tag in in_flight):
+        tag += 1
+    return tag
+
+
+def lanes_requests(requests, operand_width, lanes_width, lanes):
+    """
+       Function: lanes_requests
+
+       Definition: Packs a stream of operand_width bits requests into transactions of the lane
+         mode, each one takes up to lanes requests with the same tgd. The operands of the
+         signed operations are sign extended to the lanes' width. Returns the transactions,
+         (dividend, divisor, tgd), and the amount of divisions.
+
+       Args:
+         requests: iterable of (dividend, divisor, tgd), operand_width bits operands
+         operand_width: Width of the requests' operands
+         lanes_width: P_GDIV_FACTORS_MSB+1
+         lanes: P_GDIV_LANES
+    """
+    lane_width = lanes_width // lanes
+    lane_mask  = (1 << lane_width)-1
+    sign_bit   = 1 << (operand_width-1)
+    queues     = {}
+    packed     = []
+    divisions  = 0
+
+    def extend(value, tgd):
+        if ((tgd & 1) == 0 and (value & sign_bit)):
+            value -= 2*sign_bit
+        return value & lane_mask
+
+    def pack(queue, tgd):
+        dividend = 0
+        divisor  = 0
+        for kk, (lane_dividend, lane_divisor) in enumerate(queue):
+            dividend |= extend(lane_dividend, tgd) << (kk*lane_width)
+            divisor  |= extend(lane_divisor, tgd) << (kk*lane_width)
+        packed.append((dividend, divisor, tgd))
+
+    for dividend, divisor, tgd in requests:
+        queue = queues.setdefault(tgd, [])
+        queue.append((dividend, divisor))
+        divisions += 1
+        if (len(queue) == lanes):
+            pack(queue, tgd)
+            queues[tgd] = []
+    # Partially filled transactions, the unused lanes divide 0 by 1
+    for tgd, queue in queues.items():
+        if (queue):
+            pack(queue + [(0, 1)] * (lanes-len(queue)), tgd)
+    return packed, divisions
+
+
+def read_trace(file_name):
+    """
+       Function: read_trace
+
+       Definition: Yields (dividend, divisor, tgd) from a comma separated trace file.
+    """
+    with open(file_name) as f:
+        for line in f:
+            line = line.split("#")[0].strip()
+            if (line):
+                fields = [int(field, 0) for field in line.split(",")]
+                yield fields[0], fields[1], fields[2] if len(fields) > 2 else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estimate the divider latency and throughput of a workload.")
+    parser.add_argument("--factors-msb", type=int, default=24, help="P_GDIV_FACTORS_MSB")
+    parser.add_argument("--frac-length", type=int, default=None, help="P_GDIV_FRAC_LENGTH")
+    parser.add_argument("--round-lvl", type=int, default=3, help="P_GDIV_ROUND_LVL")
+    parser.add_argument("--rduc-stp-by", type=int, default=0, help="P_GDIV_RDUC_STP_BY")
+    parser.add_argument("--variant", default="ff", choices=["ff", "rom"], help="DUT variant")
+    parser.add_argument("--pipelined", type=int, default=0, choices=[0, 1], help="P_GDIV_PIPELINED")
+    parser.add_argument("--divmod", type=int, default=0, choices=[0, 1], help="P_GDIV_DIVMOD")
+    parser.add_argument("--early-term", type=int, default=0, choices=[0, 1], help="P_GDIV_EARLY_TERM")
+    parser.add_argument("--lanes", type=int, default=1, choices=[1, 2, 4], help="P_GDIV_LANES")
+    parser.add_argument("--sweep-lanes", action="store_true",
+                        help="divisions per clock of the narrowest lanes' divisions with 1, 2 and 4 lanes")
+    parser.add_argument("--cores", type=int, default=1, help="P_GDIV_CORES")
+    parser.add_argument("--tag-msb", type=int, default=3, help="P_GDIV_TAG_MSB")
+    parser.add_argument("--in-order", type=int, default=0, choices=[0, 1], help="P_GDIV_IN_ORDER")
+    parser.add_argument("--sweep-cores", action="store_true", help="results per clock from 1 to --cores cores")
+    parser.add_argument("--rcp-cache", type=int, default=0, help="P_GDIV_RCP_CACHE")
+    parser.add_argument("--compare", action="store_true",
+                        help="also estimate the workload with the fixed steps and no reciprocal cache")
+    parser.add_argument("--trace", help="workload, one 'dividend, divisor, tgd' per line")
+    parser.add_argument("--random", type=int, default=0, help="use this many random requests")
+    parser.add_argument("--dist", default="uniform", choices=DISTRIBUTIONS, help="operand distribution of --random")
+    parser.add_argument("--repeat", type=int, default=0, help="draw the divisors of --random from this many values")
+    parser.add_argument("--seed", type=int, default=1, help="seed of --random")
+    parser.add_argument("--clock-mhz", type=float, default=0.0, help="report results per second at this clock")
+    args = parser.parse_args()
+
+    if (args.sweep_lanes):
+        sweep_lanes(args)
+        return
+
+    if (args.sweep_cores):
+        sweep_cores(args)
+        return
+
+    model = gdiv_model(args.factors_msb, args.frac_length, args.round_lvl, args.rduc_stp_by, args.variant,
+        pipelined=args.pipelined, divmod=args.divmod, early_term=args.early_term, lanes=args.lanes,
+        cores=args.cores, tag_msb=args.tag_msb, in_order=args.in_order, rcp_cache=args.rcp_cache)
+
+    if (args.trace):
+        requests  = list(read_trace(args.trace))
+        divisions = len(requests) * model.lanes
+    else:
+        mix      = "1,1,1,1,1,1" if model.divmod else "1,1,1,1"
+        stimulus = soak_stimulus(args.seed, model.lane_width, args.dist, mix, args.repeat)
+        requests, divisions = lanes_requests([next(stimulus) for ii in range((args.random or 1000) * model.lanes)],
+            model.lane_width, model.width, model.lanes)
+
+    clocks, per_op = model.estimate(requests)
+
+    names = {0: "signed quotient", 1: "unsigned quotient", 2: "signed remainder", 3: "unsigned remainder",
+             4: "signed divmod", 5: "unsigned divmod"}
+    print("Steps limits : quotient %d, remainder %d" % (model.quo_limit, model.rem_limit))
+    print("Latency in clocks (count, min / mean / max)")
+    for tgd in sorted(per_op):
+        count, total, low, high = per_op[tgd]
+        print("  %-18s %8d, %3d / %6.2f / %3d" % (names[tgd], count, low, total/count, high))
+    print("Requests     : %d in %d clocks" % (len(requests), clocks))
+    print("Throughput   : %0.4f results/clock" % (len(requests) / max(clocks, 1)))
+    if (args.clock_mhz > 0):
+        print("             : %0.2f M results/s at %0.1f MHz" % (args.clock_mhz * len(requests) / max(clocks, 1), args.clock_mhz))
+    if (model.lanes > 1):
+        print("Divisions    : %d in %d lanes of %d bits, %0.4f divisions/clock" % (
+            divisions, model.lanes, model.lane_width, divisions / max(clocks, 1)))
+    if (model.rcp_cache > 0):
+        hits, misses = model.rcp_counters()
+        print("Rcp cache    : %d entries, %d hits, %d misses, %0.1f%% hit rate" % (
+            model.rcp_cache, hits, misses, 100.0 * hits / max(hits + misses, 1)))
+    if (args.compare):
+        fixed = gdiv_model(args.factors_msb, args.frac_length, args.round_lvl, args.rduc_stp_by, args.variant,
+            pipelined=args.pipelined, divmod=args.divmod)
+        fixed_clocks, fixed_per_op = fixed.estimate(requests)
+        print("Fixed steps mean latency (clocks)")
+        for tgd in sorted(per_op):
+            count, total = fixed_per_op[tgd][0:2]
+            print("  %-18s %6.2f -> %6.2f" % (names[tgd], total/count, per_op[tgd][1]/per_op[tgd][0]))
+        print("Fixed steps  : %d clocks, %0.1f%% saved" % (fixed_clocks, 100.0 * (fixed_clocks - clocks) / max(fixed_clocks, 1)))
+
+
+def sweep_lanes(args):
+    """
+       Function: sweep_lanes
+
+       Definition: Prints the divisions per clock of one stream of narrow divisions with every
+         lane configuration of the factors' width. The operands are as wide as the narrowest
+         lanes, the wider lanes sign extend them.
+    """
+    width    = args.factors_msb+1
+    frac     = width if args.frac_length is None else args.frac_length
+    configs  = [lanes for lanes in (1, 2, 4) if (width % lanes) == 0 and (frac % lanes) == 0 and width // lanes >= 8]
+    operand  = width // configs[-1]
+    mix      = "1,1,1,1,1,1" if args.divmod else "1,1,1,1"
+    stimulus = soak_stimulus(args.seed, operand, args.dist, mix, args.repeat)
+    narrow   = [next(stimulus) for ii in range(args.random or 1000)]
+
+    print("%d bits divisions, %d bits datapath (P_GDIV_FACTORS_MSB=%d)" % (operand, width, args.factors_msb))
+    print("  lanes  lane bits  transactions  clocks  mean latency  divisions/clock")
+    for lanes in configs:
+        model = gdiv_model(args.factors_msb, args.frac_length, args.round_lvl, args.rduc_stp_by, args.variant,
+            pipelined=args.pipelined, divmod=args.divmod, early_term=args.early_term, lanes=lanes,
+            rcp_cache=args.rcp_cache)
+        requests, divisions = lanes_requests(narrow, operand, width, lanes)
+        clocks, per_op      = model.estimate(requests)
+        latency             = sum(stats[1] for stats in per_op.values()) / max(len(requests), 1)
+        print("  %5d  %9d  %12d  %6d  %12.2f  %15.4f" % (
+            lanes, model.lane_width, len(requests), clocks, latency, divisions / max(clocks, 1)))
+
+
+def sweep_cores(args):
+    """
+       Function: sweep_cores
+
+       Definition: Prints the results per clock of one stream of requests with 1 to --cores
+         cores in the cluster.
+    """
+    mix      = "1,1,1,1,1,1" if args.divmod else "1,1,1,1"
+    stimulus = soak_stimulus(args.seed, args.factors_msb+1, args.dist, mix, args.repeat)
+    requests = list(read_trace(args.trace)) if args.trace else [next(stimulus) for ii in range(args.random or 1000)]
+
+    print("%d requests, %s completion" % (len(requests), "in order" if args.in_order else "out of order"))
+    print("  cores  clocks  mean latency  results/clock  speedup")
+    base = None
+    for cores in range(1, max(args.cores, 1)+1):
+        model = gdiv_model(args.factors_msb, args.frac_length, args.round_lvl, args.rduc_stp_by, args.variant,
+            divmod=args.divmod, early_term=args.early_term, cores=cores, tag_msb=args.tag_msb, in_order=args.in_order,
+            rcp_cache=args.rcp_cache)
+        clocks, per_op = model.estimate(requests)
+        latency        = sum(stats[1] for stats in per_op.values()) / max(len(requests), 1)
+        base           = base or clocks
+        print("  %5d  %6d  %12.2f  %13.4f  %7.2f" % (
+            cores, clocks, latency, len(requests) / max(clocks, 1), base / max(clocks, 1)))
+
+
+if __name__ == "__main__":
+    main()
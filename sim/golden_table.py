@@ -0,0 +1,279 @@
+##################################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2022, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##################################################################################################
+# File name    : golden_table.py
+# Author       : Jose R Garcia (jg-fossh@protonmail.com)
+# Project Name : Goldschmidt Integer Divider
+# Class Name   : golden_table
+# Description  : Precomputed golden results. The generator stores the expected quotient and
+#                remainder of every (dividend, divisor, i_wb4s_tgd) in an operand space into a
+#                flat binary file, the predictor memory maps it and answers with one read.
+#
+# Additional Comments:
+#   Does not depend on cocotb nor uvm. Generate a table with:
+#     python3 golden_table.py --factors-msb 7 --out gdiv_golden_8b.bin
+#     python3 golden_table.py --dividends 0 4096 --divisors 1 256 --out gdiv_golden.bin
+#   Operand spaces of more than MAX_ENTRIES pairs need --max-entries, the full space of a
+#   25 bit divider would take petabytes.
+#   File layout, native byte order:
+#     header  : magic, factors_msb, dividend low/count, divisor low/count, signs (8 x int64)
+#     results : int64 [sign][divisor][dividend][quotient, remainder]
+#   The sign index is i_wb4s_tgd[0] when the table has both, see golden_table.index().
+#   A divmod request, i_wb4s_tgd[2], reads both and packs them as {remainder, quotient}.
+##################################################################################################
+import argparse
+import mmap
+import os
+import sys
+from array import array
+
+MAGIC       = 0x3130544756494447 # "GDIVGT01"
+HEADER_LEN  = 8
+HEADER_SIZE = HEADER_LEN * 8
+MAX_ENTRIES = 1 << 22 # Largest table main() writes without --max-entries, 64 MiB
+
+
+def reference(dividend, divisor, tgd, width=None):
+    """
+       Function: reference
+
+       Definition: Expected result of a request, the predictor's division. i_wb4s_tgd[1]
+         selects the quotient (0) or the remainder (1), -1 when dividing by zero.
+         i_wb4s_tgd[2] selects both, {remainder, quotient}.
+
+       Args:
+         dividend: Dividend
+         divisor: Divisor
+         tgd: i_wb4s_tgd
+         width: P_GDIV_FACTORS_MSB+1, width of each half of a divmod result
+    """
+    if ((tgd & 4) != 0):
+        return divmod_pack(reference(dividend, divisor, tgd & 1),
+                           reference(dividend, divisor, (tgd & 1) | 2), width)
+
+    if ((tgd & 2) == 0):
+        if (divisor != 0):
+            return round(dividend / divisor)
+        return -1
+
+    if (divisor > 0):
+        return dividend % divisor
+    return -1
+
+
+def divmod_pack(quotient, remainder, width):
+    """
+       Function: divmod_pack
+
+       Definition: Returns the o_wb4s_data of a divmod request, {remainder, quotient}.
+
+       Args:
+         quotient: Quotient
+         remainder: Remainder
+         width: P_GDIV_FACTORS_MSB+1
+    """
+    mask = (1 << width)-1
+    return ((remainder & mask) << width) | (quotient & mask)
+
+
+def lanes_split(value, width, lanes):
+    """
+       Function: lanes_split
+
+       Definition: Returns the lanes of a packed factor, lane 0 first. P_GDIV_LANES > 1 packs
+         one factor per lane in each half of i_wb4s_data.
+
+       Args:
+         value: Packed dividends or divisors
+         width: P_GDIV_FACTORS_MSB+1
+         lanes: P_GDIV_LANES
+    """
+    lane_width = width // lanes
+    mask       = (1 << lane_width)-1
+    return [(value >> (kk*lane_width)) & mask for kk in range(lanes)]
+
+
+def lanes_pack(results, width):
+    """
+       Function: lanes_pack
+
+       Definition: Returns the o_wb4s_data of the lanes' results, lane 0 first. The lower half
+         of each result goes to the lower half of o_wb4s_data, the remainder of a divmod to
+         the upper half.
+
+       Args:
+         results: One result per lane, masked to the lane's o_wb4s_data
+         width: P_GDIV_FACTORS_MSB+1
+    """
+    lane_width = width // len(results)
+    mask       = (1 << lane_width)-1
+    packed     = 0
+    for kk, result in enumerate(results):
+        packed |= (result & mask) << (kk*lane_width)
+        packed |= ((result >> lane_width) & mask) << (width + kk*lane_width)
+    return packed
+
+
+class golden_table:
+    """
+       Class: Golden Result Table
+
+       Definition: Read only, memory mapped view of a table written by generate().
+    """
+
+    def __init__(self, file_name):
+        """
+           Function: new
+
+           Definition: Maps the table file.
+
+           Args:
+             file_name: Table file written by generate()
+        """
+        self.file_name = file_name
+        self.file      = open(file_name, "rb")
+        self.mm        = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        header         = memoryview(self.mm)[:HEADER_SIZE].cast("q")
+        if (header[0] != MAGIC):
+            raise ValueError("%s is not a golden result table" % file_name)
+        self.factors_msb    = header[1]
+        self.dividend_low   = header[2]
+        self.dividend_count = header[3]
+        self.divisor_low    = header[4]
+        self.divisor_count  = header[5]
+        self.signs          = header[6]
+        header.release()
+        self.results = memoryview(self.mm)[HEADER_SIZE:].cast("q")
+        # Statistics
+        self.hits   = 0
+        self.misses = 0
+
+
+    def index(self, dividend, divisor, tgd):
+        """
+           Function: index
+
+           Definition: Returns the position of the (quotient, remainder) pair of a request,
+             None when the request is outside the table.
+        """
+        dividend_idx = dividend - self.dividend_low
+        divisor_idx  = divisor - self.divisor_low
+        if (dividend_idx < 0 or dividend_idx >= self.dividend_count or
+            divisor_idx < 0 or divisor_idx >= self.divisor_count):
+            return None
+        sign_idx = (tgd & 1) if self.signs == 2 else 0
+        return ((sign_idx * self.divisor_count + divisor_idx) * self.dividend_count + dividend_idx) * 2
+
+
+    def lookup(self, dividend, divisor, tgd):
+        """
+           Function: lookup
+
+           Definition: Returns the expected result of a request, None when it is not in the
+             table.
+
+           Args:
+             dividend: Dividend
+             divisor: Divisor
+             tgd: i_wb4s_tgd
+        """
+        idx = self.index(dividend, divisor, tgd)
+        if (idx is None):
+            self.misses += 1
+            return None
+        self.hits += 1
+        if ((tgd & 4) != 0):
+            return divmod_pack(self.results[idx], self.results[idx+1], self.factors_msb+1)
+        return self.results[idx + ((tgd >> 1) & 1)]
+
+
+    def close(self):
+        self.results.release()
+        self.mm.close()
+        self.file.close()
+
+
+def generate(file_name, factors_msb, dividends, divisors, signs=2):
+    """
+       Function: generate
+
+       Definition: Writes the table of every request in dividends x divisors.
+
+       Args:
+         file_name: Output file
+         factors_msb: P_GDIV_FACTORS_MSB the table is valid for
+         dividends: range of dividends, step 1
+         divisors: range of divisors, step 1
+         signs: 2 to store i_wb4s_tgd[0] = 0 and 1, 1 when both give the same result
+    """
+    header = array("q", [MAGIC, factors_msb, dividends.start, len(dividends),
+                         divisors.start, len(divisors), signs, 0])
+    with open(file_name + ".tmp", "wb") as fh:
+        header.tofile(fh)
+        for sign in range(signs):
+            for divisor in divisors:
+                row = array("q")
+                for dividend in dividends:
+                    row.append(reference(dividend, divisor, sign))
+                    row.append(reference(dividend, divisor, 2 | sign))
+                row.tofile(fh)
+    os.replace(file_name + ".tmp", file_name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a golden result table for the predictor.")
+    parser.add_argument("--factors-msb", type=int, default=24, help="P_GDIV_FACTORS_MSB")
+    parser.add_argument("--dividends", type=int, nargs=2, metavar=("LOW", "HIGH"),
+                        help="dividend range, HIGH excluded. Default: every dividend")
+    parser.add_argument("--divisors", type=int, nargs=2, metavar=("LOW", "HIGH"),
+                        help="divisor range, HIGH excluded. Default: every divisor")
+    parser.add_argument("--out", default="gdiv_golden.bin", help="table file")
+    parser.add_argument("--max-entries", type=int, default=MAX_ENTRIES,
+                        help="largest amount of operand pairs to write, default %d" % MAX_ENTRIES)
+    args = parser.parse_args()
+
+    full      = [0, pow(2, args.factors_msb+1)]
+    dividends = range(*(args.dividends or full))
+    divisors  = range(*(args.divisors or full))
+    entries   = len(dividends) * len(divisors)
+    size      = HEADER_SIZE + entries * 16
+    print("%s: %d dividends x %d divisors, %d bytes (%0.1f MiB)" % (
+        args.out, len(dividends), len(divisors), size, size / (1 << 20)))
+    if (entries > args.max_entries):
+        sys.exit("%d operand pairs is more than %d, narrow --dividends and --divisors or raise --max-entries" % (
+            entries, args.max_entries))
+    # The predictor's results do not depend on the sign tag.
+    generate(args.out, args.factors_msb, dividends, divisors, signs=1)
+
+
+if __name__ == "__main__":
+    main()
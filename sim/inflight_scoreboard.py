@@ -0,0 +1,125 @@
+##################################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2022, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##################################################################################################
+# File name    : inflight_scoreboard.py
+# Author       : Jose R Garcia (jg-fossh@protonmail.com)
+# Project Name : Goldschmidt Integer Divider
+# Class Name   : inflight_scoreboard
+# Description  : Scoreboard for any amount of requests in flight. Checks the result of every
+#                completed request against the predictor's and its latency against the cycle
+#                accurate model's.
+#
+# Additional Comments:
+#   Subscribes to the latency monitor, which pairs each acknowledge with its request in order
+#   no matter how many are in flight, so every transaction carries its own operands, tag and
+#   result. Used by the pipelined divider (P_GDIV_PIPELINED=1), see pipelined_test.
+##################################################################################################
+from uvm.base import *
+from uvm.comps import *
+from uvm.tlm1 import *
+from uvm.macros import *
+from wb4s_seq import *
+
+class inflight_scoreboard(UVMSubscriber):
+    """
+       Class: In Flight Scoreboard
+
+       Definition: Contains functions, tasks and methods of this analysis component.
+    """
+
+    def __init__(self, name, parent=None):
+        super().__init__(name, parent)
+        """
+           Function: new
+
+           Definition: Constructor.
+
+           Args:
+             name: This component's name.
+             parent: NONE
+        """
+        self.tag                = name
+        self.data_length        = 0    # {divisor, dividend} bits
+        self.predictor          = None # predictor, expected results
+        self.model              = None # gdiv_model of the DUT, expected latencies
+        self.max_reports        = 10   # Mismatches printed, the rest are only counted
+        self.m_matches          = 0
+        self.m_mismatches       = 0
+        self.latency_mismatches = 0
+
+
+    def write(self, t):
+        """
+           Function: write
+
+           Definition: Receives a completed request from the latency monitor and checks its
+             result and the clocks it took to be acknowledged.
+
+           Args:
+             t: wb4s_seq (Sequence Item) with data_in, cycle_tag, data_out, accept_cycle and
+               ack_cycle
+        """
+        width    = int(self.data_length/2)
+        mask     = (1 << width) - 1
+        dividend = t.data_in & mask
+        divisor  = (t.data_in >> width) & mask
+        latency  = self.model.latency(dividend, divisor, t.cycle_tag)
+        measured = t.ack_cycle - t.accept_cycle
+        if (self.model.is_divmod(t.cycle_tag)):
+            # {remainder, quotient}
+            mask = (1 << (2*width)) - 1
+        expected = self.predictor.expected(t) & mask
+
+        if (expected == (t.data_out & mask) and latency == measured):
+            self.m_matches += 1
+            return
+
+        self.m_mismatches += 1
+        if (latency != measured):
+            self.latency_mismatches += 1
+        if (self.m_mismatches <= self.max_reports):
+            uvm_error(self.get_type_name(), sv.sformatf("In flight mismatch \
+                \n  Dividend : 0x%h \
+                \n  Divisor  : 0x%h \
+                \n  Tag      : %d \
+                \n  Accepted : clock %d \
+                \n  Expected : 0x%h after %d clocks \
+                \n  Measured : 0x%h after %d clocks", dividend, divisor, t.cycle_tag, t.accept_cycle,
+                expected, latency, t.data_out & mask, measured))
+
+
+    def report_phase(self, phase):
+        uvm_info(self.get_type_name(), sv.sformatf("In flight scoreboard, matches %d mismatches %d (latency %d)",
+            self.m_matches, self.m_mismatches, self.latency_mismatches), UVM_LOW)
+
+
+uvm_component_utils(inflight_scoreboard)
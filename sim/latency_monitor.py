@@ -0,0 +1,237 @@
+##################################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2022, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##################################################################################################
+# File name    : latency_monitor.py
+# Author       : Jose R Garcia (jg-fossh@protonmail.com)
+# Project Name : Goldschmidt Integer Divider
+# Class Name   : latency_monitor
+# Description  : Passive cycle counting monitor. Samples the WB4 slave interface every clock,
+#                pairs each accepted request (cyc & stb & !stall) with the acknowledge that
+#                returns its result and measures the amount of clocks in between.
+#
+# Additional Comments:
+#   Requests are paired with acknowledges in order, one result per request, no matter how
+#   many are in flight. With self.tagged set (Goldschmidt_Integer_Divider_Cluster) each
+#   acknowledge is paired with the oldest request in flight whose tga_i matches its tgd_o.
+##################################################################################################
+from collections import deque
+
+from cocotb.triggers import RisingEdge, ReadOnly
+from uvm.base import *
+from uvm.comps import *
+from uvm.tlm1 import *
+from uvm.macros import *
+from wb4s_seq import *
+
+class latency_monitor(UVMComponent):
+    """
+       Class: Latency Monitor
+
+       Definition: Contains functions, tasks and methods of this monitor.
+    """
+
+    def __init__(self, name, parent=None):
+        super().__init__(name, parent)
+        """
+           Function: new
+
+           Definition: Constructor.
+
+           Args:
+             name: This component's name.
+             parent: NONE
+        """
+        self.ap  = None # Completed requests, one wb4s_seq per acknowledge
+        self.vif = None # wb4s_if, the same interface the wb4s_agent drives
+        self.tag = name
+        # Cycle counting
+        self.cycle        = 0     # Clocks sampled since the run phase started
+        self.in_flight    = deque()
+        self.tagged       = False # Pair the acknowledges by tag, results return out of order
+        self.keep_records = False # When set every completed request is stored in self.records
+        self.records      = []    # [data_in, cycle_tag, data_out, accept_cycle, ack_cycle]
+        # Statistics
+        self.num_items     = 0
+        self.total_latency = 0
+        self.min_latency   = None
+        self.max_latency   = 0
+        self.first_accept  = None
+        self.first_ack     = None
+        self.last_ack      = None
+        self.max_in_flight = 0
+        self.unknown_tags  = 0
+
+
+    def build_phase(self, phase):
+        super().build_phase(phase)
+        """
+           Function: build_phase
+
+           Definition: Creates the analysis port.
+
+           Args:
+             phase: build_phase
+        """
+        self.ap = UVMAnalysisPort("ap", self)
+
+
+    async def run_phase(self, phase):
+        """
+           Function: run_phase
+
+           Definition: Samples the interface after every rising edge of the clock, once all the
+             signals have settled.
+
+           Args:
+             phase: run_phase
+        """
+        if (self.vif is None):
+            uvm_fatal("LATENCY_MONITOR/NoVif", "latency_monitor requires a vif")
+
+        while True:
+            await RisingEdge(self.vif.clk_i)
+            await ReadOnly()
+            self.cycle += 1
+            self.sample()
+
+
+    def sample(self):
+        """
+           Function: sample
+
+           Definition: Evaluates the interface signals of the current clock. The acknowledge is
+             checked before the request because the slave may accept the next request in the
+             same clock it returns the previous result.
+        """
+        if (int(self.vif.cyc_i.value) == 0):
+            # Dropping cyc aborts every request in flight.
+            self.in_flight.clear()
+            return
+
+        if (int(self.vif.ack_o.value) == 1 and len(self.in_flight) > 0):
+            request = self.pop_request()
+            if (request is not None):
+                data_in, cycle_tag, accept_cycle, tag = request
+                self.complete(data_in, cycle_tag, int(self.vif.dat_o.value), accept_cycle, tag)
+
+        if (int(self.vif.stb_i.value) == 1 and int(self.vif.stall_o.value) == 0):
+            tag = int(self.vif.tga_i.value) if self.tagged else 0
+            self.in_flight.append((int(self.vif.dat_i.value), int(self.vif.tgc_i.value), self.cycle, tag))
+            self.max_in_flight = max(self.max_in_flight, len(self.in_flight))
+
+
+    def pop_request(self):
+        """
+           Function: pop_request
+
+           Definition: Removes and returns the request of the current acknowledge, the oldest
+             one or, when tagged, the oldest one with the acknowledge's tag.
+        """
+        if (not self.tagged):
+            return self.in_flight.popleft()
+
+        tag = int(self.vif.tgd_o.value)
+        for request in self.in_flight:
+            if (request[3] == tag):
+                self.in_flight.remove(request)
+                return request
+
+        self.unknown_tags += 1
+        uvm_error("LATENCY_MONITOR/UnknownTag", sv.sformatf("Acknowledge with tag %d, no request in flight has it", tag))
+        return None
+
+
+    def complete(self, data_in, cycle_tag, data_out, accept_cycle, tag=0):
+        """
+           Function: complete
+
+           Definition: Updates the statistics and broadcasts the completed request.
+
+           Args:
+             data_in: Request data, {divisor, dividend}
+             cycle_tag: Request operation, i_wb4s_tgd
+             data_out: Result
+             accept_cycle: Clock in which the request was accepted
+             tag: Request tag, tga_i, when tagged
+        """
+        latency = self.cycle - accept_cycle
+
+        self.num_items     += 1
+        self.total_latency += latency
+        self.max_latency    = max(self.max_latency, latency)
+        if (self.min_latency is None or latency < self.min_latency):
+            self.min_latency = latency
+        if (self.first_ack is None):
+            self.first_ack = self.cycle
+        if (self.first_accept is None or accept_cycle < self.first_accept):
+            # Tagged results may return before the one of the first request
+            self.first_accept = accept_cycle
+        self.last_ack = self.cycle
+
+        if (self.keep_records):
+            self.records.append([data_in, cycle_tag, data_out, accept_cycle, self.cycle])
+
+        tr              = wb4s_seq("tr")
+        tr.data_in      = data_in
+        tr.cycle_tag    = cycle_tag
+        tr.data_out     = data_out
+        tr.acknowledge  = 1
+        tr.accept_cycle = accept_cycle
+        tr.ack_cycle    = self.cycle
+        tr.tga          = tag
+        self.ap.write(tr)
+
+
+    def mean_latency(self):
+        """
+           Function: mean_latency
+
+           Definition: Returns the average amount of clocks from request to acknowledge.
+        """
+        if (self.num_items == 0):
+            return 0.0
+        return self.total_latency / self.num_items
+
+
+    def throughput(self):
+        """
+           Function: throughput
+
+           Definition: Returns the completed requests per clock, measured from the first
+             accepted request to the last acknowledge.
+        """
+        if (self.num_items == 0):
+            return 0.0
+        return self.num_items / max(1, self.last_ack - self.first_accept)
+
+
+uvm_component_utils(latency_monitor)
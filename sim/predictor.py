@@ -35,9 +35,14 @@
 # Project Name : Goldschmidt Integer Divider
 # Class Name   : predictor
 # Description  : Non Time Consuming model. Calculates the product of the division when tgd = 0
-#                and calculates the remainder when tgd = 1.
+#                and calculates the remainder when tgd = 1. tgd[2] = 1 calculates both.
 #
 # Additional Comments:
+#   When a golden_table is assigned to self.golden the results are read from it, requests
+#   outside the table are computed.
+#   When a gdiv_model is assigned to self.model the predictor also checks the acknowledge
+#   timing of the requests received through timing_export (latency_monitor transactions).
+#   With P_GDIV_LANES > 1 every lane of a request is predicted on its own, see predict().
 #
 ##################################################################################################
 import binascii
@@ -52,6 +57,9 @@ from uvm.comps import *
 from uvm.tlm1 import *
 from uvm.macros import *
 from wb4s_seq import *
+from golden_table import reference, lanes_pack, lanes_split
+
+UVMAnalysisImp_timing = uvm_analysis_imp_decl("_timing")
 
 class predictor(UVMSubscriber):
     """
@@ -76,6 +84,13 @@ class predictor(UVMSubscriber):
         self.tag = name
         #
         self.data_length = 0
+        self.lanes       = 1    # P_GDIV_LANES, divisions per request
+        self.golden      = None # golden_table, precomputed results
+        # Acknowledge timing check
+        self.model             = None # gdiv_model
+        self.timing_export     = None
+        self.timing_matches    = 0
+        self.timing_mismatches = 0
 
 
     def build_phase(self, phase):
@@ -89,6 +104,7 @@ class predictor(UVMSubscriber):
              phase: build_phase
         """
         self.ap = UVMAnalysisPort("ap", self)
+        self.timing_export = UVMAnalysisImp_timing("timing_export", self)
 
 
     def write(self, t):
@@ -102,44 +118,100 @@ class predictor(UVMSubscriber):
            Args:
              t: wb4s_seq (Sequence Item)
         """
+        self.create_response(t, self.expected(t))
 
-        dividend, divisor = self.int_to_hex(t.data_in, int(self.data_length/2))
 
-        if (t.cycle_tag == 0):
-            # generate the result, convert it to hex, remove the '0x' appended by hex() and remove the overflow bit.
-            if (divisor != 0):
-                result_int = dividend / divisor
-            else:
-                result_int = -1
-
-
-        if (t.cycle_tag == 2):
-            # generate the result, convert it to hex, remove the '0x' appended by hex() and remove the overflow bit.
-            if (divisor > 0):
-                result_int = dividend % divisor
-            else:
-                result_int = -1
-
-        if (t.cycle_tag == 1):
-            if (divisor != 0):
-                result_int = dividend / divisor
-            else:
-                result_int = -1
-
-        if (t.cycle_tag == 3):
-            # generate the result, convert it to hex, remove the '0x' appended by hex() and remove the overflow bit.
-            if (divisor > 0):
-                result_int = dividend % divisor
-            else:
-                result_int = -1
+    def expected(self, t):
+        """
+           Function: expected
+
+           Definition: Returns the expected result of a request, every lane of it with
+             P_GDIV_LANES > 1.
+
+           Args:
+             t: wb4s_seq (Sequence Item) with data_in and cycle_tag
+        """
+        width             = int(self.data_length/2)
+        dividend, divisor = self.int_to_hex(t.data_in, width)
+
+        if (self.lanes > 1):
+            # Each lane's result masked to the lane, {remainder, quotient} for a divmod.
+            lane_width = int(width/self.lanes)
+            lane_mask  = (1 << (lane_width * (2 if (t.cycle_tag & 4) else 1)))-1
+            result_int = lanes_pack([self.predict(lane_dividend, lane_divisor, t.cycle_tag, lane_width) & lane_mask
+                for lane_dividend, lane_divisor in zip(lanes_split(dividend, width, self.lanes),
+                                                       lanes_split(divisor, width, self.lanes))], width)
+        else:
+            result_int = self.predict(dividend, divisor, t.cycle_tag, width)
 
         #uvm_info(self.get_type_name(), sv.sformatf("write() \
         #    \n  Dividen: %d <=> 0x%h \
         #    \n  Divisor: %d <=> 0x%h \
         #    \n  Result : %d <=> 0x%h",\
-        #    dividend, dividend, divisor, divisor, round(result_int), round(result_int)), UVM_NONE)
+        #    dividend, dividend, divisor, divisor, result_int, result_int), UVM_NONE)
 
-        self.create_response(t, round(result_int))
+        return result_int
+
+
+    def predict(self, dividend, divisor, cycle_tag, width):
+        """
+           Function: predict
+
+           Definition: Returns the expected result of one division, from the golden table
+             when it has it.
+
+           Args:
+             dividend: Dividend
+             divisor: Divisor
+             cycle_tag: i_wb4s_tgd
+             width: Bits of each factor
+        """
+        result_int = None
+        if (self.golden is not None):
+            result_int = self.golden.lookup(dividend, divisor, cycle_tag)
+
+        if (result_int is None):
+            result_int = reference(dividend, divisor, cycle_tag, width)
+
+        return result_int
+
+
+    def write_timing(self, t):
+        """
+           Function: write_timing
+
+           Definition: Receives a completed request from the latency monitor and compares
+             the clocks it took to be acknowledged against the cycle accurate model.
+
+           Args:
+             t: wb4s_seq (Sequence Item) with accept_cycle and ack_cycle
+        """
+        if (self.model is None):
+            return
+
+        dividend, divisor = self.int_to_hex(t.data_in, int(self.data_length/2))
+        expected = self.model.latency(dividend, divisor, t.cycle_tag)
+        measured = t.ack_cycle - t.accept_cycle
+
+        if (expected == measured):
+            self.timing_matches += 1
+        else:
+            self.timing_mismatches += 1
+            uvm_error(self.get_type_name(), sv.sformatf("Acknowledge timing mismatch \
+                \n  Dividend : 0x%h \
+                \n  Divisor  : 0x%h \
+                \n  Tag      : %d \
+                \n  Expected : %d clocks \
+                \n  Measured : %d clocks", dividend, divisor, t.cycle_tag, expected, measured))
+
+
+    def report_phase(self, phase):
+        if (self.golden is not None):
+            uvm_info(self.get_type_name(), sv.sformatf("Golden table %s, hits %d misses %d",
+                self.golden.file_name, self.golden.hits, self.golden.misses), UVM_LOW)
+        if (self.model is not None):
+            uvm_info(self.get_type_name(), sv.sformatf("Acknowledge timing, matches %d mismatches %d",
+                self.timing_matches, self.timing_mismatches), UVM_LOW)
 
 
     def create_response(self, t, result):
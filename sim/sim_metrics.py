@@ -0,0 +1,199 @@
+##################################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2022, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##################################################################################################
+# File name    : sim_metrics.py
+# Author       : Jose R Garcia (jg-fossh@protonmail.com)
+# Project Name : Goldschmidt Integer Divider
+# Class Name   : sim_metrics
+# Description  : Simulation speed metrics of a run; transactions and simulated cycles per
+#                wall clock second, start up, elaboration and run phase time and peak memory.
+#
+# Additional Comments:
+#   test_base appends one JSON line per run to sim_metrics.jsonl (+GDIV_METRICS=<file>),
+#   keyed by test name, seed and parameter set. compare_metrics.py checks them against a
+#   baseline.
+##################################################################################################
+import json
+import resource
+import sys
+import time
+
+
+def peak_rss_kb():
+    """
+       Function: peak_rss_kb
+
+       Definition: Peak resident set size of this process (simulator and Python), in KiB.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if (sys.platform == "darwin"):
+        return peak // 1024 # bytes
+    return peak
+
+
+def run_key(test, seed, params):
+    """
+       Function: run_key
+
+       Definition: Identifies runs that are comparable, same test, seed and parameters.
+    """
+    return "%s|%s|%s" % (test, seed, ",".join("%s=%s" % (k, params[k]) for k in sorted(params)))
+
+
+class sim_metrics:
+    """
+       Class: Simulation Metrics
+
+       Definition: Phase timestamps and the derived speed metrics.
+    """
+
+    def __init__(self):
+        """
+           Function: new
+
+           Definition: Constructor.
+        """
+        self.start_time = None # top.py import, reference of the start up times
+        self.elab_start = None
+        self.run_start  = None
+        self.first_tr   = None
+        self.elab_time  = 0.0
+        self.run_time   = 0.0
+        self.cycles     = 0
+
+
+    def start_elaboration(self):
+        self.elab_start = time.perf_counter()
+
+
+    def start_run(self):
+        """
+           Function: start_run
+
+           Definition: Ends the elaboration (build, connect and end of elaboration phases)
+             and starts the run phase.
+        """
+        self.run_start = time.perf_counter()
+        if (self.elab_start is not None):
+            self.elab_time = self.run_start - self.elab_start
+
+
+    def first_transaction(self):
+        """
+           Function: first_transaction
+
+           Definition: Marks the first transaction seen by the monitor.
+        """
+        if (self.first_tr is None):
+            self.first_tr = time.perf_counter()
+
+
+    def since_start(self, timestamp):
+        if (self.start_time is None or timestamp is None):
+            return 0.0
+        return timestamp - self.start_time
+
+
+    def stop_run(self, cycles):
+        """
+           Function: stop_run
+
+           Definition: Ends the run phase.
+
+           Args:
+             cycles: Simulated clock cycles
+        """
+        if (self.run_start is not None):
+            self.run_time = time.perf_counter() - self.run_start
+        self.cycles = cycles
+
+
+    def record(self, test, seed, params, transactions):
+        """
+           Function: record
+
+           Definition: Returns the metrics of the run as a dict.
+
+           Args:
+             test: Test name
+             seed: Stimulus seed
+             params: dict of the parameters that change the run, i.e. divider parameters
+             transactions: Amount of verified transactions
+        """
+        run_time = max(self.run_time, 1e-9)
+        return { "key"           : run_key(test, seed, params),
+                 "test"          : test,
+                 "seed"          : seed,
+                 "params"        : params,
+                 "date"          : time.strftime("%Y-%m-%dT%H:%M:%S"),
+                 "transactions"  : transactions,
+                 "cycles"        : self.cycles,
+                 "import_s"      : self.since_start(self.elab_start),
+                 "elaboration_s" : self.elab_time,
+                 "first_tr_s"    : self.since_start(self.first_tr),
+                 "run_s"         : self.run_time,
+                 "tx_per_s"      : transactions / run_time,
+                 "cycles_per_s"  : self.cycles / run_time,
+                 "peak_rss_kb"   : peak_rss_kb() }
+
+
+    def report(self, record):
+        return ("\n    Transactions : %d in %0.3f s, %0.1f tx/s" % (record["transactions"], record["run_s"], record["tx_per_s"]) +
+                "\n    Cycles       : %d, %0.1f cycles/s" % (record["cycles"], record["cycles_per_s"]) +
+                "\n    Start up     : import %0.3f s, elaboration %0.3f s, first transaction at %0.3f s" % (
+                    record["import_s"], record["elaboration_s"], record["first_tr_s"]) +
+                "\n    Peak RSS     : %d KiB\n" % record["peak_rss_kb"])
+
+
+def append(file_name, record):
+    """
+       Function: append
+
+       Definition: Appends a run to a metrics file, one JSON object per line.
+    """
+    with open(file_name, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def load(file_name):
+    """
+       Function: load
+
+       Definition: Returns the runs of a metrics file, oldest first.
+    """
+    records = []
+    with open(file_name) as f:
+        for line in f:
+            line = line.strip()
+            if (line):
+                records.append(json.loads(line))
+    return records
@@ -0,0 +1,136 @@
+##################################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2022, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##################################################################################################
+# File name    : sim_runner.py
+# Author       : Jose R Garcia (jg-fossh@protonmail.com)
+# Project Name : Goldschmidt Integer Divider
+# Class Name   : sim_runner
+# Description  : Helpers to launch simulations through the Makefile from python scripts. Each
+#                simulation is a separate make process so several can run at the same time.
+#
+# Additional Comments:
+#   Simulations running in parallel must use different SIM_BUILD directories, the Makefile
+#   derives it from the DUT variant unless it is overridden. They also need their own
+#   waveform (GDIV_TRACE_FILE), metrics (+GDIV_METRICS) and coverage (+GDIV_COVERAGE) files.
+##################################################################################################
+import os
+import shlex
+import subprocess
+import time
+
+SIM_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class sim_runner:
+    """
+       Class: Simulation Runner
+
+       Definition: A single make invocation of the test bench.
+    """
+
+    def __init__(self, name, make_vars=None, plusargs=None, log_file=None):
+        """
+           Function: new
+
+           Definition: Constructor.
+
+           Args:
+             name: This run's name, used for the default log file.
+             make_vars: dict of Makefile variables, i.e. {"DUT": "rom", "UVM_TEST": "ab_test"}
+             plusargs: list of simulation plusargs, i.e. ["+AB_SEED=1"]
+             log_file: where the make output is stored, default <name>.log
+        """
+        self.name       = name
+        self.make_vars  = dict(make_vars or {})
+        self.plusargs   = list(plusargs or [])
+        self.log_file   = log_file or os.path.join(SIM_DIR, name + ".log")
+        self.proc       = None
+        self.wall_time  = 0.0
+        self.returncode = None
+        self._start     = 0.0
+        self._log       = None
+
+
+    def command(self):
+        """
+           Function: command
+
+           Definition: Returns the make command line of this run.
+        """
+        cmd = ["make"]
+        for key, value in self.make_vars.items():
+            cmd.append("%s=%s" % (key, value))
+        if (self.plusargs):
+            cmd.append("SIM_PLUSARGS=" + " ".join(self.plusargs))
+        return cmd
+
+
+    def start(self):
+        """
+           Function: start
+
+           Definition: Launches make without waiting for it to finish.
+        """
+        self._log   = open(self.log_file, "w")
+        self._log.write("# " + " ".join(shlex.quote(c) for c in self.command()) + "\n")
+        self._log.flush()
+        self._start = time.perf_counter()
+        self.proc   = subprocess.Popen(self.command(), cwd=SIM_DIR, stdout=self._log, stderr=subprocess.STDOUT)
+        return self
+
+
+    def wait(self):
+        """
+           Function: wait
+
+           Definition: Waits for make to finish and returns its exit code.
+        """
+        self.returncode = self.proc.wait()
+        self.wall_time  = time.perf_counter() - self._start
+        self._log.close()
+        return self.returncode
+
+
+def run_parallel(runs):
+    """
+       Function: run_parallel
+
+       Definition: Starts every run, then waits for all of them.
+
+       Args:
+         runs: list of sim_runner
+    """
+    for run in runs:
+        run.start()
+    for run in runs:
+        run.wait()
+    return runs
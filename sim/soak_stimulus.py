@@ -0,0 +1,126 @@
+##################################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2022, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##################################################################################################
+# File name    : soak_stimulus.py
+# Author       : Jose R Garcia (jg-fossh@protonmail.com)
+# Project Name : Goldschmidt Integer Divider
+# Class Name   : soak_stimulus
+# Description  : Endless, seeded request generator of the soak test. Requests are generated
+#                one at a time so memory stays constant however long the test runs.
+#
+# Additional Comments:
+#   Operand distributions:
+#     uniform : every value equally likely.
+#     log     : bit length uniformly distributed, small operands as likely as wide ones.
+#     signed  : three quarters of the operands have the sign bit set (negative when the
+#               request is signed), the rest are uniform.
+#   The operation mix is a weight per i_wb4s_tgd value, "1,1,1,1" by default. Six weights
+#   add the divmod operations, i_wb4s_tgd 4 and 5, of a P_GDIV_DIVMOD=1 divider.
+#   repeat > 0 draws the divisors from that many values of the distribution, the traffic of
+#   the divisor reciprocal cache (P_GDIV_RCP_CACHE).
+##################################################################################################
+import itertools
+import random
+
+DISTRIBUTIONS = ["uniform", "log", "signed"]
+
+
+def parse_mix(text):
+    """
+       Function: parse_mix
+
+       Definition: Returns the cumulative weights of i_wb4s_tgd 0 to 3, or 0 to 5, from a
+         comma separated list of weights, i.e. "1,1,0,0" for quotients only.
+    """
+    weights = [float(weight) for weight in str(text).split(",")]
+    if (len(weights) not in [4, 6] or min(weights) < 0 or sum(weights) <= 0):
+        raise ValueError("operation mix needs four or six non negative weights, got '%s'" % text)
+    return list(itertools.accumulate(weights))
+
+
+class soak_stimulus:
+    """
+       Class: Soak Stimulus
+
+       Definition: Iterator of (dividend, divisor, cycle_tag) requests.
+    """
+
+    def __init__(self, seed, factors_length, distribution="uniform", mix="1,1,1,1", repeat=0):
+        """
+           Function: new
+
+           Definition: Constructor.
+
+           Args:
+             seed: Random seed, the same seed generates the same requests
+             factors_length: Bits of each operand
+             distribution: One of DISTRIBUTIONS
+             mix: Weights of i_wb4s_tgd 0 to 3 or 0 to 5, see parse_mix()
+             repeat: Amount of divisors to draw from, 0 draws every divisor
+        """
+        if (distribution not in DISTRIBUTIONS):
+            raise ValueError("unknown distribution '%s', use one of %s" % (distribution, ", ".join(DISTRIBUTIONS)))
+        self.rng            = random.Random(seed)
+        self.factors_length = factors_length
+        self.distribution   = distribution
+        self.cum_weights    = parse_mix(mix)
+        self.sign_bit       = 1 << (factors_length - 1)
+        self.divisors       = [self.operand() for ii in range(repeat)]
+
+
+    def __iter__(self):
+        return self
+
+
+    def __next__(self):
+        cycle_tag = self.rng.choices(range(len(self.cum_weights)), cum_weights=self.cum_weights)[0]
+        dividend  = self.operand()
+        divisor   = self.rng.choice(self.divisors) if self.divisors else self.operand()
+        return dividend, divisor, cycle_tag
+
+
+    def operand(self):
+        """
+           Function: operand
+
+           Definition: Returns one operand of the selected distribution.
+        """
+        if (self.distribution == "log"):
+            length = self.rng.randint(0, self.factors_length)
+            if (length == 0):
+                return 0
+            return (1 << (length - 1)) | self.rng.getrandbits(length - 1)
+
+        value = self.rng.getrandbits(self.factors_length)
+        if (self.distribution == "signed" and self.rng.random() < 0.75):
+            value |= self.sign_bit
+        return value
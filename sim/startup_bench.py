@@ -0,0 +1,102 @@
+##################################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2022, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##################################################################################################
+# File name    : startup_bench.py
+# Author       : Jose R Garcia (jg-fossh@protonmail.com)
+# Project Name : Goldschmidt Integer Divider
+# Class Name   : startup_bench
+# Description  : Start up benchmark. Runs a test several times and reports the time from the
+#                test bench import to the first transaction; import, elaboration and the run
+#                phase up to the first transaction seen by the monitor.
+#
+# Additional Comments:
+#   Save the numbers of one revision and compare another one against them:
+#     python3 startup_bench.py --save startup_before.json    # i.e. on the older revision
+#     python3 startup_bench.py --against startup_before.json
+#   The first run builds the simulation and is discarded (--warmup).
+##################################################################################################
+import argparse
+import json
+import os
+import statistics
+import sys
+
+import sim_metrics
+from sim_runner import SIM_DIR, sim_runner
+
+PHASES = [("import_s", "Import"), ("elaboration_s", "Elaboration"), ("first_tr_s", "First transaction")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the test bench time to first transaction.")
+    parser.add_argument("--test", default="default_test", help="UVM test, default default_test")
+    parser.add_argument("--runs", type=int, default=5, help="measured runs, default 5")
+    parser.add_argument("--warmup", type=int, default=1, help="discarded runs, default 1")
+    parser.add_argument("--make-var", action="append", default=[], metavar="NAME=VALUE",
+                        help="additional Makefile variable, i.e. BACKEND=model")
+    parser.add_argument("--save", help="store the medians in this file")
+    parser.add_argument("--against", help="compare the medians with a file written by --save")
+    args = parser.parse_args()
+
+    metrics_file = os.path.join(SIM_DIR, "startup_bench.jsonl")
+    if (os.path.exists(metrics_file)):
+        os.remove(metrics_file)
+
+    make_vars = dict(var.split("=", 1) for var in args.make_var)
+    make_vars["UVM_TEST"] = args.test
+    for ii in range(args.warmup + args.runs):
+        run = sim_runner("startup_bench", make_vars=make_vars,
+                         plusargs=["+GDIV_METRICS=" + (metrics_file if ii >= args.warmup else "")])
+        if (run.start().wait() != 0):
+            sys.exit("Run %d failed, see %s" % (ii, run.log_file))
+
+    records = sim_metrics.load(metrics_file)
+    medians = {key: statistics.median(record[key] for record in records) for key, name in PHASES}
+    baseline = None
+    if (args.against):
+        with open(args.against) as f:
+            baseline = json.load(f)
+
+    print("%s, median of %d runs" % (args.test, len(records)))
+    for key, name in PHASES:
+        line = "  %-18s : %8.3f s" % (name, medians[key])
+        if (baseline and key in baseline):
+            line += "  (was %8.3f s, %+0.1f%%)" % (baseline[key], 100 * (medians[key] - baseline[key]) / max(baseline[key], 1e-9))
+        print(line)
+
+    if (args.save):
+        with open(args.save, "w") as f:
+            json.dump(medians, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+##################################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2022, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##################################################################################################
+# File name    : tag_scoreboard.py
+# Author       : Jose R Garcia (jg-fossh@protonmail.com)
+# Project Name : Goldschmidt Integer Divider
+# Class Name   : tag_scoreboard
+# Description  : Scoreboard of the divider cluster. Compares the result of every completed
+#                request against the predictor's, the request is the one the acknowledge's
+#                tag names, not the oldest one.
+#
+# Additional Comments:
+#   Subscribes to the latency monitor with tagged set, which pairs each acknowledge with its
+#   request by tag (tga_i of the request, tgd_o of the acknowledge). Takes the place of the
+#   in order comparator with P_GDIV_CORES > 1, see cluster_test. Counts the results that
+#   overtook an older request, with in_order set each one is a mismatch.
+##################################################################################################
+from uvm.base import *
+from uvm.comps import *
+from uvm.tlm1 import *
+from uvm.macros import *
+from wb4s_seq import *
+
+class tag_scoreboard(UVMSubscriber):
+    """
+       Class: Tag Scoreboard
+
+       Definition: Contains functions, tasks and methods of this analysis component.
+    """
+
+    def __init__(self, name, parent=None):
+        super().__init__(name, parent)
+        """
+           Function: new
+
+           Definition: Constructor.
+
+           Args:
+             name: This component's name.
+             parent: NONE
+        """
+        self.tag          = name
+        self.predictor    = None  # predictor, expected results
+        self.in_order     = False # P_GDIV_IN_ORDER, results must return in request order
+        self.max_reports  = 10    # Mismatches printed, the rest are only counted
+        self.m_matches    = 0
+        self.m_mismatches = 0
+        self.reordered    = 0     # Results acknowledged before the ones of older requests
+        self.last_accept  = None  # Accept clock of the newest request acknowledged
+
+
+    def write(self, t):
+        """
+           Function: write
+
+           Definition: Receives a completed request from the latency monitor and checks its
+             result and its order.
+
+           Args:
+             t: wb4s_seq (Sequence Item) with data_in, cycle_tag, data_out, tga, accept_cycle
+               and ack_cycle
+        """
+        expected  = self.predictor.expected(t)
+        overtook  = self.last_accept is not None and t.accept_cycle < self.last_accept
+        self.last_accept = t.accept_cycle if self.last_accept is None else max(self.last_accept, t.accept_cycle)
+        if (overtook):
+            self.reordered += 1
+
+        if (expected == t.data_out and not (overtook and self.in_order)):
+            self.m_matches += 1
+            return
+
+        self.m_mismatches += 1
+        if (self.m_mismatches <= self.max_reports):
+            uvm_error(self.get_type_name(), sv.sformatf("Tagged mismatch \
+                \n  Request  : 0x%h \
+                \n  Op Tag   : %d \
+                \n  Tag      : %d \
+                \n  Accepted : clock %d \
+                \n  Expected : 0x%h \
+                \n  Measured : 0x%h at clock %d%s", t.data_in, t.cycle_tag, t.tga, t.accept_cycle,
+                expected, t.data_out, t.ack_cycle, ", out of order" if overtook else ""))
+
+
+    def report_phase(self, phase):
+        uvm_info(self.get_type_name(), sv.sformatf("Tag scoreboard, matches %d mismatches %d, %d results out of order",
+            self.m_matches, self.m_mismatches, self.reordered), UVM_LOW)
+
+
+uvm_component_utils(tag_scoreboard)
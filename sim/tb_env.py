@@ -37,11 +37,10 @@
 # Description  : Test Bench Environment.
 #
 # Additional Comments:
+#   With P_GDIV_CORES > 1 the results return out of order, the scoreboard is a tag_scoreboard
+#   fed by the latency monitor, which pairs the acknowledges by tag.
 #
 ##################################################################################################
-# Framework Libs
-import cocotb
-from cocotb_coverage.coverage import *
 # UVM Libs
 from uvm.base import *
 from uvm.comps import *
@@ -49,7 +48,12 @@ from uvm.macros import uvm_component_utils
 # This TB Libs
 from wb4s_agent import *
 from predictor import *
-from f_cov import *
+from latency_monitor import *
+from err_stats import *
+from inflight_scoreboard import *
+from tag_scoreboard import *
+from gdiv_model import gdiv_model
+from golden_table import golden_table
 
 class tb_env(UVMEnv):
     """
@@ -69,12 +73,15 @@ class tb_env(UVMEnv):
              name: This agents name.
              parent: NONE
         """
-        self.wb4s_agent = None # WB Instruction agent
-        self.cfg        = None # tb_env_config
-        self.scoreboard = None # scoreboard
-        self.predictor  = None # passive
-        self.f_cov      = None # functional coverage
-        self.tag        = name #
+        self.wb4s_agent  = None # WB Instruction agent
+        self.cfg         = None # tb_env_config
+        self.scoreboard  = None # scoreboard
+        self.predictor   = None # passive
+        self.f_cov       = None # functional coverage
+        self.lat_mon     = None # request to acknowledge latency
+        self.err_stats   = None # error distribution
+        self.inflight_sb = None # requests in flight scoreboard
+        self.tag         = name #
 
 
     def build_phase(self, phase):
@@ -92,16 +99,36 @@ class tb_env(UVMEnv):
             uvm_fatal("TB_ENV/NoTbEnvConfig", "Test Bench config not found")
 
         self.cfg = arr[0]
+        cluster  = int(self.cfg.gdiv_params.get("cores", 1)) > 1
 
         self.wb4s_agent     = wb4s_agent.type_id.create("wb4s_agent", self)
         self.wb4s_agent.cfg = self.cfg.wb4s_agent_cfg
 
-        self.predictor = predictor.type_id.create("predictor", self)
-        self.f_cov = f_cov.type_id.create("f_cov", self)
+        # Only the enabled components are created
+        if (self.cfg.has_predictor):
+            self.predictor = predictor.type_id.create("predictor", self)
 
-        if (self.cfg.has_scoreboard):
+        if (self.cfg.has_functional_coverage):
+            # cocotb_coverage is only imported by the tests that collect coverage
+            from f_cov import f_cov
+            self.f_cov = f_cov.type_id.create("f_cov", self)
+
+        if (self.cfg.has_scoreboard and cluster):
+            # The cluster's results are paired with their requests by tag
+            self.scoreboard = tag_scoreboard.type_id.create("scoreboard", self)
+        elif (self.cfg.has_scoreboard):
             self.scoreboard = UVMInOrderClassComparator.type_id.create("scoreboard", self)
 
+        if (self.cfg.has_latency_monitor or self.cfg.has_timing_check or self.cfg.has_error_stats or
+            self.cfg.has_inflight_scoreboard or (self.cfg.has_scoreboard and cluster)):
+            self.lat_mon = latency_monitor.type_id.create("lat_mon", self)
+
+        if (self.cfg.has_error_stats):
+            self.err_stats = err_stats.type_id.create("err_stats", self)
+
+        if (self.cfg.has_inflight_scoreboard):
+            self.inflight_sb = inflight_scoreboard.type_id.create("inflight_sb", self)
+
 
     def connect_phase(self, phase):
         super().connect_phase(phase)
@@ -113,17 +140,57 @@ class tb_env(UVMEnv):
            Args:
              phase: connect_phase
         """
+        lanes   = int(self.cfg.gdiv_params.get("lanes", 1))
+        cluster = int(self.cfg.gdiv_params.get("cores", 1)) > 1
+
         if (self.cfg.has_predictor):
             self.predictor.data_length = self.cfg.DUT_SLAVE_DATA_IN_LENGTH
-            self.wb4s_agent.ap.connect(self.predictor.analysis_export)
-
-        if (self.cfg.has_scoreboard):
+            self.predictor.lanes       = lanes
+            if (self.cfg.golden_table_file):
+                # The table holds the divisions of one lane
+                self.predictor.golden = golden_table(self.cfg.golden_table_file)
+                if (self.predictor.golden.factors_msb != int(self.cfg.DUT_SLAVE_DATA_IN_LENGTH/(2*lanes))-1):
+                    uvm_fatal("TB_ENV/GoldenTable", sv.sformatf("%s was generated for P_GDIV_FACTORS_MSB=%d",
+                        self.cfg.golden_table_file, self.predictor.golden.factors_msb))
+            if (not cluster and self.cfg.has_scoreboard):
+                # The tag and in flight scoreboards ask the predictor for each result themselves
+                self.wb4s_agent.ap.connect(self.predictor.analysis_export)
+
+        if (self.lat_mon is not None):
+            self.lat_mon.vif    = self.cfg.wb4s_agent_cfg.vif
+            self.lat_mon.tagged = cluster
+
+        if (self.cfg.has_scoreboard and self.cfg.has_predictor and cluster):
+            self.scoreboard.predictor = self.predictor
+            self.scoreboard.in_order  = int(self.cfg.gdiv_params.get("in_order", 0)) == 1
+            self.lat_mon.ap.connect(self.scoreboard.analysis_export)
+        elif (self.cfg.has_scoreboard and self.cfg.has_predictor):
             self.wb4s_agent.ap.connect(self.scoreboard.after_export)
             self.predictor.ap.connect(self.scoreboard.before_export)
 
         if (self.cfg.has_functional_coverage):
             self.f_cov.data_length = self.cfg.DUT_SLAVE_DATA_IN_LENGTH
             self.f_cov.data_bins_range = self.cfg.data_bins_range
+            self.f_cov.lanes           = lanes
+            if (self.cfg.gdiv_params.get("divmod", 0) == 1):
+                self.f_cov.operations = [0, 1, 2, 3, 4, 5]
             self.wb4s_agent.ap.connect(self.f_cov.analysis_export)
 
+        if (self.err_stats is not None):
+            self.err_stats.data_length = self.cfg.DUT_SLAVE_DATA_IN_LENGTH
+            self.err_stats.file_name   = self.cfg.error_stats_file
+            self.lat_mon.ap.connect(self.err_stats.analysis_export)
+
+        if (self.cfg.has_timing_check and self.cfg.has_predictor and cluster):
+            uvm_info(self.get_type_name(), "The cluster's latency depends on the other requests in flight, timing check off", UVM_LOW)
+        elif (self.cfg.has_timing_check and self.cfg.has_predictor):
+            self.predictor.model = gdiv_model(**self.cfg.gdiv_params)
+            self.lat_mon.ap.connect(self.predictor.timing_export)
+
+        if (self.inflight_sb is not None):
+            self.inflight_sb.data_length = self.cfg.DUT_SLAVE_DATA_IN_LENGTH
+            self.inflight_sb.predictor   = self.predictor
+            self.inflight_sb.model       = gdiv_model(**self.cfg.gdiv_params)
+            self.lat_mon.ap.connect(self.inflight_sb.analysis_export)
+
 uvm_component_utils(tb_env)
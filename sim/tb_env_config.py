@@ -71,9 +71,17 @@ class tb_env_config(UVMEnv):
         self.has_scoreboard          = False  # scoreboard on/off
         self.has_predictor           = False  # predictor on/off
         self.has_functional_coverage = False  # coverage on/off
+        self.has_latency_monitor     = False  # request to acknowledge latency monitor on/off
+        self.has_timing_check        = False  # predictor acknowledge timing check on/off, needs the latency monitor
+        self.has_error_stats         = False  # error distribution statistics on/off, needs the latency monitor
+        self.has_inflight_scoreboard = False  # scoreboard of the latency monitor's requests on/off, needs the predictor
         #
         self.DUT_SLAVE_DATA_IN_LENGTH = 0
         self.data_bins_range = [0, 10]
+        self.gdiv_params     = {} # Divider parameters, gdiv_model arguments
+        #
+        self.golden_table_file = None # Predictor's precomputed results, see golden_table.py
+        self.error_stats_file  = None # JSON export of the error statistics
         #
         self.tag = "tb_env_config"
 
@@ -0,0 +1,233 @@
+##################################################################################################
+# BSD 3-Clause License
+#
+# Copyright (c) 2022, Jose R. Garcia
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+##################################################################################################
+# File name    : tb_profiler.py
+# Author       : Jose R Garcia (jg-fossh@protonmail.com)
+# Project Name : Goldschmidt Integer Divider
+# Class Name   : tb_profiler
+# Description  : Opt in instrumentation of the test bench. Wraps methods of the components
+#                (analysis write paths) and of the sequences (start) with a call counter and
+#                a wall clock timer, optionally captures a cProfile of the run phase.
+#
+# Additional Comments:
+#   Enabled by test_base with +GDIV_PROFILE[=<json file>] and +GDIV_CPROFILE=<pstats file>.
+#   Times are inclusive: a wrapped method's time includes the methods it calls, the time of
+#   an awaited method (sequence start) includes the simulation time it waited for. Counters
+#   that overlap others are not subtracted from the run phase time when estimating the time
+#   spent in the simulator, cocotb and uvm.
+##################################################################################################
+import cProfile
+import json
+import time
+
+
+class tb_profiler:
+    """
+       Class: Test Bench Profiler
+
+       Definition: Counters and timers of the wrapped methods.
+    """
+
+    def __init__(self):
+        """
+           Function: new
+
+           Definition: Constructor.
+        """
+        self.counters  = {} # label: [calls, seconds, overlaps]
+        self.patched   = [] # (owner, attribute, original, owned), to restore them
+        self.profile   = None
+        self.run_start = None
+        self.run_time  = 0.0
+
+
+    def counter(self, label, overlaps=False):
+        if (label not in self.counters):
+            self.counters[label] = [0, 0.0, overlaps]
+        return self.counters[label]
+
+
+    def wrap(self, owner, attribute, label, overlaps=False):
+        """
+           Function: wrap
+
+           Definition: Replaces a method of an object (an instance or a class) by a timed
+             call to the original one. Objects that share a label share the counter.
+
+           Args:
+             owner: Object whose method is wrapped
+             attribute: Method name
+             label: Counter name
+             overlaps: The method calls, or is called by, other wrapped methods
+        """
+        original = getattr(owner, attribute)
+        counter  = self.counter(label, overlaps)
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                counter[0] += 1
+                counter[1] += time.perf_counter() - start
+
+        self.patched.append((owner, attribute, original, attribute in vars(owner)))
+        setattr(owner, attribute, timed)
+
+
+    def wrap_start(self, cls):
+        """
+           Function: wrap_start
+
+           Definition: Replaces the start task of a sequence class by a timed one. Each
+             sequence type has its own counter, named after it.
+
+           Args:
+             cls: Sequence class, i.e. UVMSequenceBase for every sequence
+        """
+        original = cls.start
+        profiler = self
+
+        async def timed(seq, *args, **kwargs):
+            counter = profiler.counter(seq.get_type_name() + ".start", True)
+            start   = time.perf_counter()
+            try:
+                return await original(seq, *args, **kwargs)
+            finally:
+                counter[0] += 1
+                counter[1] += time.perf_counter() - start
+
+        self.patched.append((cls, "start", original, "start" in vars(cls)))
+        cls.start = timed
+
+
+    def restore(self):
+        """
+           Function: restore
+
+           Definition: Puts back every wrapped method.
+        """
+        for owner, attribute, original, owned in reversed(self.patched):
+            if (owned):
+                setattr(owner, attribute, original)
+            else:
+                delattr(owner, attribute)
+        self.patched = []
+
+
+    def start(self, cprofile=False):
+        """
+           Function: start
+
+           Definition: Starts timing the run phase, and the cProfile capture when requested.
+        """
+        if (cprofile):
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+        self.run_start = time.perf_counter()
+
+
+    def stop(self):
+        if (self.run_start is not None):
+            self.run_time  = time.perf_counter() - self.run_start
+            self.run_start = None
+        if (self.profile is not None):
+            self.profile.disable()
+
+
+    def rows(self, transactions):
+        """
+           Function: rows
+
+           Definition: Returns the breakdown, one dict per counter plus the time not spent
+             in the exclusive counters.
+
+           Args:
+             transactions: Amount of verified transactions, for the time per transaction
+        """
+        transactions = max(transactions, 1)
+        rows      = []
+        exclusive = 0.0 # Time in counters that do not overlap
+        for label, (calls, seconds, overlaps) in sorted(self.counters.items(), key=lambda kv: -kv[1][1]):
+            if (not overlaps):
+                exclusive += seconds
+            rows.append({ "component"   : label,
+                          "calls"       : calls,
+                          "total_s"     : seconds,
+                          "us_per_tr"   : 1e6 * seconds / transactions,
+                          "overlaps"    : overlaps })
+        other = max(self.run_time - exclusive, 0.0)
+        rows.append({ "component"   : "other (simulator, cocotb, uvm)",
+                      "calls"       : 0,
+                      "total_s"     : other,
+                      "us_per_tr"   : 1e6 * other / transactions,
+                      "overlaps"    : False })
+        return rows
+
+
+    def report(self, transactions):
+        """
+           Function: report
+
+           Definition: Returns the breakdown as a printable table.
+        """
+        text  = "\n    Run phase : %0.3f s, %d transactions\n" % (self.run_time, transactions)
+        text += "    %-40s %10s %10s %12s\n" % ("Component", "Calls", "Total s", "us/trans")
+        for row in self.rows(transactions):
+            name = row["component"] + (" *" if row["overlaps"] else "")
+            text += "    %-40s %10d %10.3f %12.1f\n" % (name, row["calls"], row["total_s"], row["us_per_tr"])
+        text += "    * overlaps other counters, calls or awaits them\n"
+        return text
+
+
+    def write_json(self, file_name, transactions, info=None):
+        """
+           Function: write_json
+
+           Definition: Writes the breakdown to a file.
+
+           Args:
+             file_name: Output file
+             transactions: Amount of verified transactions
+             info: dict of additional fields, i.e. the test name
+        """
+        results = dict(info or {})
+        results["run_time"]     = self.run_time
+        results["transactions"] = transactions
+        results["breakdown"]    = self.rows(transactions)
+        with open(file_name, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+    def dump_cprofile(self, file_name):
+        if (self.profile is not None):
+            self.profile.dump_stats(file_name)
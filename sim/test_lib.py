@@ -41,7 +41,8 @@
 ##################################################################################################
 # Framework Libs
 import cocotb
-from cocotb.triggers import Timer
+from cocotb.triggers import Timer, RisingEdge, ReadOnly
+from cocotb.utils import get_sim_time
 # UVM Libs
 from uvm import *
 from wb4s_seq import *
@@ -50,9 +51,15 @@ from wb4s_config import *
 from tb_env_config import *
 from tb_env import *
 from predictor import *
+from tb_profiler import tb_profiler
+import sim_metrics
+from soak_stimulus import soak_stimulus
+from gdiv_model import gdiv_model, lanes_requests, free_tag
 # General Python Libs
+import json
 import math
 import random as rnd
+import time
 
 class test_base(UVMTest):
     """
@@ -68,10 +75,24 @@ class test_base(UVMTest):
         self.tb_env = None
         self.tb_env_config = None
         self.wb4s_agent_cfg = None
+        self.tb_envs = [] # One environment per divider instance in TB_TOP, tb_envs[0] is tb_env
         self.printer = None
+        # Profiling, +GDIV_PROFILE[=<json file>] +GDIV_CPROFILE=<pstats file>
+        self.profiler      = None
+        self.profile_file  = cocotb.plusargs.get("GDIV_PROFILE", None)
+        self.cprofile_file = cocotb.plusargs.get("GDIV_CPROFILE", None)
+        # Simulation speed metrics, one line per run in +GDIV_METRICS=<file>
+        self.metrics       = sim_metrics.sim_metrics()
+        self.metrics_file  = cocotb.plusargs.get("GDIV_METRICS", "sim_metrics.jsonl")
+        # Functional coverage, +GDIV_COVERAGE=<yaml file>
+        self.coverage_file = cocotb.plusargs.get("GDIV_COVERAGE", "coverage_result.yml")
+        self.seed          = cocotb.RANDOM_SEED # Tests with their own seed plusarg replace it
+        self.gdiv_params   = {}
+        self.clk_period    = (1, "ms")
 
     def build_phase(self, phase):
         super().build_phase(phase)
+        self.metrics.start_elaboration()
         # Enable transaction recording for everything
         UVMConfigDb.set(self, "*", "recording_detail", UVM_FULL)
 
@@ -79,73 +100,457 @@ class test_base(UVMTest):
         arr = []
         if UVMConfigDb.get(None, "dut", "DUT_SLAVE_DATA_IN_LENGTH", arr) is True:
             UVMConfigDb.set(None, "*", "DUT_SLAVE_DATA_IN_LENGTH", arr[0])
+        data_in_length = arr[0]
 
-        self.tb_env_config = tb_env_config.type_id.create("tb_env_config", self)
-        self.tb_env_config.has_scoreboard           = True
-        self.tb_env_config.has_predictor            = True
-        self.tb_env_config.has_functional_coverage  = False
-        self.tb_env_config.DUT_SLAVE_DATA_IN_LENGTH = arr[0]
-        self.tb_env_config.data_bins_range          = [0, 0xFFFFFFFF]
-
-        # Create the Mem Read agent
-        self.wb4s_agent_cfg = wb4s_config.type_id.create("wb4s_agent_cfg", self)
+        # Divider parameters, for the models
         arr = []
-        # Get the instruction interface created at top
-        if UVMConfigDb.get(None, "*", "vif_slave", arr) is True:
-            UVMConfigDb.set(self, "*", "vif_slave", arr[0])
-            # Make this agent's interface the interface connected at top
-            self.wb4s_agent_cfg.vif         = arr[0]
-            self.wb4s_agent_cfg.has_driver  = 1
-            self.wb4s_agent_cfg.has_monitor = 1
-        else:
-            uvm_fatal("NOVIF", "Could not get vif_slave from config DB")
+        gdiv_params = {}
+        if UVMConfigDb.get(None, "dut", "GDIV_PARAMS", arr) is True:
+            gdiv_params = arr[0]
+        self.gdiv_params = gdiv_params
 
-        # Make this instruction agent the test bench config agent
-        self.tb_env_config.wb4s_agent_cfg = self.wb4s_agent_cfg
+        arr = []
+        if UVMConfigDb.get(None, "dut", "CLK_PERIOD", arr) is True:
+            self.clk_period = arr[0]
 
-        # Place the tn_env_config in the Db. The tb_env will fetch this in its build phase .
-        UVMConfigDb.set(self, "*", "tb_env_config", self.tb_env_config)
+        arr = []
+        if UVMConfigDb.get(None, "dut", "START_TIME", arr) is True:
+            self.metrics.start_time = arr[0]
 
-        # Create the test bench environment
-        self.tb_env = tb_env.type_id.create("tb_env", self)
+        # Amount of divider instances in TB_TOP, each one gets its own environment
+        arr = []
+        num_instances = 1
+        if UVMConfigDb.get(None, "dut", "TB_INSTANCES", arr) is True:
+            num_instances = arr[0]
+
+        for ii in range(num_instances):
+            suffix = "" if ii == 0 else "_" + str(ii)
+
+            tb_env_cfg = tb_env_config.type_id.create("tb_env_config" + suffix, self)
+            tb_env_cfg.has_scoreboard           = True
+            tb_env_cfg.has_predictor            = True
+            tb_env_cfg.has_functional_coverage  = False
+            tb_env_cfg.DUT_SLAVE_DATA_IN_LENGTH = data_in_length
+            tb_env_cfg.data_bins_range          = [0, 0xFFFFFFFF]
+            tb_env_cfg.gdiv_params              = gdiv_params
+            tb_env_cfg.golden_table_file        = cocotb.plusargs.get("GDIV_GOLDEN", None)
+            # Error distribution, +GDIV_ERR_STATS[=<json file>]
+            err_stats_file = cocotb.plusargs.get("GDIV_ERR_STATS", None)
+            if (err_stats_file):
+                if (err_stats_file is True):
+                    err_stats_file = "err_stats.json"
+                tb_env_cfg.has_error_stats  = True
+                tb_env_cfg.error_stats_file = err_stats_file.replace(".json", "") + suffix + ".json"
+
+            # Create the Mem Read agent
+            agent_cfg = wb4s_config.type_id.create("wb4s_agent_cfg" + suffix, self)
+            arr = []
+            # Get the instruction interface created at top
+            if UVMConfigDb.get(None, "*", "vif_slave" + suffix, arr) is True:
+                UVMConfigDb.set(self, "tb_env" + suffix + ".*", "vif_slave", arr[0])
+                # Make this agent's interface the interface connected at top
+                agent_cfg.vif         = arr[0]
+                agent_cfg.has_driver  = 1
+                agent_cfg.has_monitor = 1
+            else:
+                uvm_fatal("NOVIF", "Could not get vif_slave" + suffix + " from config DB")
+
+            # Make this instruction agent the test bench config agent
+            tb_env_cfg.wb4s_agent_cfg = agent_cfg
+
+            # Let the tests adjust the environment before it is built
+            self.configure_tb_env(tb_env_cfg)
+
+            # Place the tn_env_config in the Db. The tb_env will fetch this in its build phase .
+            UVMConfigDb.set(self, "tb_env" + suffix, "tb_env_config", tb_env_cfg)
+
+            # Create the test bench environment
+            self.tb_envs.append(tb_env.type_id.create("tb_env" + suffix, self))
+
+            if (ii == 0):
+                self.tb_env_config  = tb_env_cfg
+                self.wb4s_agent_cfg = agent_cfg
+
+        self.tb_env = self.tb_envs[0]
 
         # Create a specific depth printer for printing the created topology
         self.printer = UVMTablePrinter()
         self.printer.knobs.depth = 3
 
 
+    def configure_tb_env(self, cfg):
+        """
+           Function: configure_tb_env
+
+           Definition: Called for every environment config before the environment is built.
+             Tests override it to enable or disable components.
+
+           Args:
+             cfg: tb_env_config
+        """
+        pass
+
+
+    def stimulus_plusargs(self, prefix, count=1000, distribution="log"):
+        """
+           Function: stimulus_plusargs
+
+           Definition: Reads the operand stream plusargs of a test into count, seed and
+             distribution.
+
+           Args:
+             prefix: Plusarg prefix, +<prefix>_COUNT, +<prefix>_SEED and +<prefix>_DIST
+             count: Default amount of requests
+             distribution: Default operand distribution, uniform, log or signed
+        """
+        self.count        = int(cocotb.plusargs.get(prefix + "_COUNT", count))
+        self.seed         = int(cocotb.plusargs.get(prefix + "_SEED", 1))
+        self.distribution = cocotb.plusargs.get(prefix + "_DIST", distribution)
+
+
+    def require_build(self, supported, make_args):
+        """
+           Function: require_build
+
+           Definition: Stops the test when the divider was not built the way it needs.
+
+           Args:
+             supported: True when the build has what the test needs
+             make_args: The make variables the test needs, for the message
+        """
+        if (not supported):
+            uvm_fatal(self.get_type_name().upper() + "/Build",
+                sv.sformatf("%s requires make %s", self.get_type_name(), make_args))
+
+
     def end_of_elaboration_phase(self, phase):
         # Print topology
         uvm_info(self.get_type_name(),
             sv.sformatf("Printing the test topology :\n%s", self.sprint(self.printer)), UVM_LOW)
 
+        if (self.profile_file or self.cprofile_file):
+            self.install_profiler()
+
+        self.mark_first_transaction()
+
+
+    def mark_first_transaction(self):
+        """
+           Function: mark_first_transaction
+
+           Definition: Hooks the agent's analysis port until the first transaction, for the
+             start up time. The hook removes itself so the following ones are not delayed.
+        """
+        ap       = self.tb_env.wb4s_agent.ap
+        original = ap.write
+        owned    = "write" in vars(ap)
+
+        def first_write(t):
+            if (owned):
+                ap.write = original
+            else:
+                del ap.write
+            self.metrics.first_transaction()
+            original(t)
+
+        ap.write = first_write
+
+
+    def install_profiler(self):
+        """
+           Function: install_profiler
+
+           Definition: Wraps the analysis write paths of every environment and the start task
+             of the sequences with the profiler's counters.
+        """
+        prof = tb_profiler()
+        for env in self.tb_envs:
+            # The monitor's broadcast calls the subscribers' write
+            prof.wrap(env.wb4s_agent.ap, "write", "wb4s_agent.ap.write", overlaps=True)
+            if (env.cfg.has_predictor):
+                prof.wrap(env.predictor, "write", "predictor.write")
+                if (env.predictor.model is not None):
+                    prof.wrap(env.predictor, "write_timing", "predictor.write_timing", overlaps=True)
+            if (env.cfg.has_functional_coverage):
+                prof.wrap(env.f_cov, "write", "f_cov.write")
+            if (env.scoreboard is not None and hasattr(env.scoreboard, "m_before_fifo")):
+                # The predictor's write calls the before fifo's
+                prof.wrap(env.scoreboard.m_before_fifo, "write", "scoreboard.before.write", overlaps=True)
+                prof.wrap(env.scoreboard.m_after_fifo, "write", "scoreboard.after.write")
+            if (env.lat_mon is not None):
+                prof.wrap(env.lat_mon, "sample", "lat_mon.sample")
+            if (env.inflight_sb is not None):
+                prof.wrap(env.inflight_sb, "write", "inflight_sb.write")
+        prof.wrap_start(UVMSequenceBase)
+        self.profiler = prof
+
+
+    def start_of_simulation_phase(self, phase):
+        self.metrics.start_run()
+        if (self.profiler is not None):
+            self.profiler.start(cprofile=bool(self.cprofile_file))
+
+
+    def scoreboard_counts(self):
+        """
+           Function: scoreboard_counts
+
+           Definition: Returns the matches and mismatches of all the environments' scoreboards.
+        """
+        matches    = 0
+        mismatches = 0
+        for env in self.tb_envs:
+            if (env.scoreboard is not None):
+                matches    += env.scoreboard.m_matches
+                mismatches += env.scoreboard.m_mismatches
+            if (env.inflight_sb is not None):
+                matches    += env.inflight_sb.m_matches
+                mismatches += env.inflight_sb.m_mismatches
+        return matches, mismatches
+
 
     def extract_phase(self, phase):
-        if(self.tb_env.scoreboard.m_mismatches == 0):
+        self.metrics.stop_run(int(get_sim_time(self.clk_period[1]) / self.clk_period[0]))
+        if (self.profiler is not None):
+            self.profiler.stop()
+
+        matches, mismatches = self.scoreboard_counts()
+        if(mismatches == 0):
            self.test_pass = True
         else:
            self.test_pass = False
-           self.err_msg += '\nMatches : ' + str(self.tb_env.scoreboard.m_matches)
-           self.err_msg += '\nMismatches : ' + str(self.tb_env.scoreboard.m_mismatches)
+           self.err_msg += '\nMatches : ' + str(matches)
+           self.err_msg += '\nMismatches : ' + str(mismatches)
+
+        timing_mismatches = sum(env.predictor.timing_mismatches for env in self.tb_envs if env.predictor is not None)
+        if (timing_mismatches > 0):
+           self.test_pass = False
+           self.err_msg += '\nTiming Mismatches : ' + str(timing_mismatches)
 
 
     def report_phase(self, phase):
+        matches, mismatches = self.scoreboard_counts()
+
+        self.report_metrics(matches + mismatches)
+
+        if (self.profiler is not None):
+            self.report_profile(matches + mismatches)
+
         if self.test_pass:
             uvm_info(self.get_type_name(),
-                sv.sformatf("\n\n-----------------------------------\n    UVM Test   : %s\n    Matches    : %d\n    Mismatches : %d\n    Pass/Fail  : Pass\n-----------------------------------\n", self.get_type_name(), self.tb_env.scoreboard.m_matches, self.tb_env.scoreboard.m_mismatches), UVM_NONE)
+                sv.sformatf("\n\n-----------------------------------\n    UVM Test   : %s\n    Matches    : %d\n    Mismatches : %d\n    Pass/Fail  : Pass\n-----------------------------------\n", self.get_type_name(), matches, mismatches), UVM_NONE)
         else:
             uvm_fatal(self.get_type_name(), "UVM TEST FAIL\n" +
                 self.err_msg)
 
-        cov_print = 0 # 
         # Coverage Report
-        if (cov_print == 1):
-            # Print coverage bins at the end of the sim
-            coverage.coverage_db.report_coverage(print, bins=False)
-            coverage.coverage_db.report_coverage(print, bins=True)
-
         if (self.tb_env_config.has_functional_coverage):
-            coverage.coverage_db.export_to_yaml(filename="coverage_result.yml")
+            # cocotb_coverage is only imported by the tests that collect coverage
+            from cocotb_coverage import coverage
+
+            cov_print = 0 # 
+            if (cov_print == 1):
+                # Print coverage bins at the end of the sim
+                coverage.coverage_db.report_coverage(print, bins=False)
+                coverage.coverage_db.report_coverage(print, bins=True)
+
+            coverage.coverage_db.export_to_yaml(filename=self.coverage_file)
+
+
+    def report_metrics(self, transactions):
+        """
+           Function: report_metrics
+
+           Definition: Prints the simulation speed of the run and appends it to the metrics
+             file, keyed by test, seed and parameters.
+
+           Args:
+             transactions: Amount of verified transactions
+        """
+        params = dict(self.gdiv_params)
+        params["backend"]   = cocotb.plusargs.get("GDIV_BACKEND", "rtl")
+        params["instances"] = len(self.tb_envs)
+        record = self.metrics.record(self.get_type_name(), self.seed, params, transactions)
+
+        uvm_info(self.get_type_name(), "Simulation speed" + self.metrics.report(record), UVM_LOW)
+        if (self.metrics_file):
+            sim_metrics.append(self.metrics_file, record)
+
+
+    def report_profile(self, transactions):
+        """
+           Function: report_profile
+
+           Definition: Prints the profiler's breakdown, writes it to the JSON file and the
+             cProfile capture to its file, then removes the wrappers.
+
+           Args:
+             transactions: Amount of verified transactions
+        """
+        uvm_info(self.get_type_name(), "Profile" + self.profiler.report(transactions), UVM_NONE)
+
+        if (self.profile_file):
+            file_name = self.profile_file
+            if (file_name is True):
+                file_name = "profile_" + self.get_type_name() + ".json"
+            self.profiler.write_json(file_name, transactions, {"test": self.get_type_name()})
+
+        if (self.cprofile_file):
+            self.profiler.dump_cprofile(self.cprofile_file)
+
+        self.profiler.restore()
+
+
+    def default_mix(self):
+        """
+           Function: default_mix
+
+           Definition: Returns the operation weights of the soak stimulus, every operation
+             the build has with the same weight.
+        """
+        return "1,1,1,1,1,1" if self.gdiv_params.get("divmod", 0) == 1 else "1,1,1,1"
+
+
+    async def wait_reset(self, vif=None):
+        """
+           Function: wait_reset
+
+           Definition: De-asserts cyc and stb until the reset is released, for the tests that
+             drive the interface themselves.
+
+           Args:
+             vif: Interface to hold, default tb_env's
+        """
+        vif = vif or self.tb_env.cfg.wb4s_agent_cfg.vif
+
+        vif.cyc_i <= 0
+        vif.stb_i <= 0
+        await RisingEdge(vif.clk_i)
+        while (int(vif.rst_i.value) == 1):
+            await RisingEdge(vif.clk_i)
+
+
+    async def write_seq(self, data, cycle_tag, cycle=1, strobe=1, env=None):
+        """
+           Function: write_seq
+
+           Definition: Creates and starts a single write sequence on the slave interface.
+
+           Args:
+             data: {divisor, dividend}
+             cycle_tag: i_wb4s_tgd, [1] 0=quotient, 1=rem; [0] 0=signed, 1=unsigned
+             cycle: cyc value
+             strobe: stb value
+             env: tb_env whose agent drives the sequence, default tb_env
+        """
+        env = env or self.tb_env
+
+        seq           = wb4s_single_write_seq("seq")
+        seq.data      = data
+        seq.cycle     = cycle
+        seq.strobe    = strobe
+        seq.cycle_tag = cycle_tag
+
+        await seq.start(env.wb4s_agent.sqr)
+
+
+    async def seeded_stimulus(self, env, seed, count):
+        """
+           Function: seeded_stimulus
+
+           Definition: Drives count random requests of every operation through env's agent,
+             the same seed gives the same requests, and waits for their results.
+
+           Args:
+             env: tb_env whose agent drives the requests
+             seed: Random seed
+             count: Amount of requests
+        """
+        factors_length = int(env.cfg.DUT_SLAVE_DATA_IN_LENGTH/2)
+        rng            = rnd.Random(seed)
+
+        # de-assert the CYC and STB signals
+        await self.write_seq(51966, 0, cycle=0, strobe=0, env=env)
+
+        for ii in range(count):
+            dividend  = rng.getrandbits(factors_length)
+            divisor   = rng.getrandbits(factors_length)
+            cycle_tag = rng.randrange(4)
+            await self.write_seq((divisor << factors_length) + dividend, cycle_tag, env=env)
+
+        # Let the last requests complete before dropping cyc
+        await self.drain(count, env=env)
+
+        # de-assert the CYC and STB signals
+        await self.write_seq(51966, 0, cycle=0, strobe=0, env=env)
+
+
+    async def drain(self, num_items, max_clocks=1000, env=None):
+        """
+           Function: drain
+
+           Definition: Holds cyc asserted with stb de-asserted until the latency monitor has
+             seen num_items acknowledges or max_clocks have elapsed.
+
+           Args:
+             num_items: Amount of acknowledges expected
+             max_clocks: Time out, in clocks
+             env: tb_env to drain, default tb_env
+        """
+        env = env or self.tb_env
+
+        await self.write_seq(0, 0, cycle=1, strobe=0, env=env)
+
+        while (env.lat_mon.num_items < num_items and max_clocks > 0):
+            max_clocks -= 1
+            await RisingEdge(env.cfg.wb4s_agent_cfg.vif.clk_i)
+
+
+    async def back_to_back(self, requests, count, max_clocks=1000, env=None, max_in_flight=None):
+        """
+           Function: back_to_back
+
+           Definition: Drives count requests straight on the interface, for the tests without
+             the agent's driver. Keeps stb asserted with each request, and the lowest tag the
+             latency monitor does not have in flight, until it is accepted. Then waits for the
+             last result before dropping cyc.
+
+           Args:
+             requests: iterable of (dividend, divisor, tgd), the operand and divisor source
+             count: Amount of requests
+             max_clocks: Time out of the last results, in clocks
+             env: tb_env to drive, default tb_env
+             max_in_flight: De-asserts stb while this many requests are in flight, the tags
+               stay below it, as gdiv_model.run(). Default no limit
+        """
+        env            = env or self.tb_env
+        vif            = env.cfg.wb4s_agent_cfg.vif
+        lat_mon        = env.lat_mon
+        factors_length = int(env.cfg.DUT_SLAVE_DATA_IN_LENGTH/2)
+        requests       = iter(requests)
+        completed      = lat_mon.num_items # Of the earlier calls
+
+        vif.cyc_i <= 1
+        for ii in range(count):
+            dividend, divisor, cycle_tag = next(requests)
+            accepted = False
+            while (not accepted):
+                strobe    = max_in_flight is None or len(lat_mon.in_flight) < max_in_flight
+                vif.stb_i <= int(strobe)
+                vif.dat_i <= (divisor << factors_length) + dividend
+                vif.tgc_i <= cycle_tag
+                vif.tga_i <= free_tag([request[3] for request in lat_mon.in_flight])
+                await ReadOnly()
+                accepted = strobe and int(vif.stall_o.value) == 0
+                await RisingEdge(vif.clk_i)
+        vif.stb_i <= 0
+
+        while (lat_mon.num_items < completed + count and max_clocks > 0):
+            max_clocks -= 1
+            await RisingEdge(vif.clk_i)
+
+        vif.cyc_i <= 0
+        await RisingEdge(vif.clk_i)
 
 
 uvm_component_utils(test_base)
@@ -379,3 +784,936 @@ class default_test(test_base):
 
 
 uvm_component_utils(default_test)
+
+
+class ab_test(test_base):
+    """
+       Class: A/B Test
+
+       Definition: Drives a seeded stream of random requests and records the result and
+         latency of each one. Running it once per DUT variant with the same seed produces
+         files that ab_compare.py checks for equivalence, latency and throughput.
+
+         Plusargs:
+           +AB_SEED=<int>  : operand stream seed, default 1
+           +AB_COUNT=<int> : amount of requests, default 200
+           +AB_OUT=<file>  : results file, default ab_<GDIV_DUT>.json
+    """
+
+    def __init__(self, name="ab_test", parent=None):
+        super().__init__(name, parent)
+        self.dut_variant = cocotb.plusargs.get("GDIV_DUT", "ff")
+        self.seed        = int(cocotb.plusargs.get("AB_SEED", 1))
+        self.count       = int(cocotb.plusargs.get("AB_COUNT", 200))
+        self.out_file    = cocotb.plusargs.get("AB_OUT", "ab_" + self.dut_variant + ".json")
+        self.wall_time   = 0.0
+
+
+    def configure_tb_env(self, cfg):
+        cfg.has_latency_monitor = True
+        cfg.has_timing_check    = True
+
+
+    def end_of_elaboration_phase(self, phase):
+        super().end_of_elaboration_phase(phase)
+        self.tb_env.lat_mon.keep_records = True
+
+
+    async def run_phase(self, phase):
+        phase.raise_objection(self, "ab_test raise objection")
+
+        await Timer(16, "NS") # Allow some clocks for evething to settle
+
+        uvm_info(self.get_type_name(),
+            sv.sformatf("\nSim Started, DUT %s seed %d count %d\n", self.dut_variant, self.seed, self.count), UVM_LOW)
+
+        start = time.perf_counter()
+        await self.seeded_stimulus(self.tb_env, self.seed, self.count)
+        self.wall_time = time.perf_counter() - start
+
+        uvm_info(self.get_type_name(), sv.sformatf("\nSim Finished\n"), UVM_LOW)
+
+        phase.drop_objection(self, "ab_test drop objection")
+
+
+    def report_phase(self, phase):
+        lat_mon = self.tb_env.lat_mon
+        results = {
+            "dut"            : self.dut_variant,
+            "seed"           : self.seed,
+            "count"          : self.count,
+            "factors_length" : int(self.tb_env.cfg.DUT_SLAVE_DATA_IN_LENGTH/2),
+            "cycles"         : lat_mon.cycle,
+            "wall_time"      : self.wall_time,
+            "records"        : lat_mon.records
+        }
+        with open(self.out_file, "w") as f:
+            json.dump(results, f)
+
+        uvm_info(self.get_type_name(),
+            "\n    DUT         : %s\n    Completed   : %d\n    Latency     : min %d, mean %0.2f, max %d\n    Throughput  : %0.4f results/clock\n    Results in  : %s\n" % (
+                self.dut_variant, lat_mon.num_items, lat_mon.min_latency or 0, lat_mon.mean_latency(),
+                lat_mon.max_latency, lat_mon.throughput(), self.out_file), UVM_NONE)
+
+        super().report_phase(phase)
+
+
+uvm_component_utils(ab_test)
+
+
+class multi_instance_test(test_base):
+    """
+       Class: Multi Instance Test
+
+       Definition: Drives every divider instance of TB_TOP at the same time, each one from its
+         own environment (agent, predictor and scoreboard) and reports the verified divisions
+         per wall clock second. Build with make TB_INSTANCES=<n>.
+
+         Plusargs:
+           +MI_SEED=<int>  : operand streams seed, instance ii uses seed+ii, default 1
+           +MI_COUNT=<int> : amount of requests per instance, default 100
+    """
+
+    def __init__(self, name="multi_instance_test", parent=None):
+        super().__init__(name, parent)
+        self.seed      = int(cocotb.plusargs.get("MI_SEED", 1))
+        self.count     = int(cocotb.plusargs.get("MI_COUNT", 100))
+        self.wall_time = 0.0
+
+
+    def configure_tb_env(self, cfg):
+        cfg.has_latency_monitor = True
+
+
+    async def run_phase(self, phase):
+        phase.raise_objection(self, "multi_instance_test raise objection")
+
+        await Timer(16, "NS") # Allow some clocks for evething to settle
+
+        uvm_info(self.get_type_name(),
+            sv.sformatf("\nSim Started, %d instances\n", len(self.tb_envs)), UVM_LOW)
+
+        start = time.perf_counter()
+        procs = []
+        for ii, env in enumerate(self.tb_envs):
+            procs.append(cocotb.fork(self.seeded_stimulus(env, self.seed + ii, self.count)))
+        await sv.fork_join(procs)
+        self.wall_time = time.perf_counter() - start
+
+        uvm_info(self.get_type_name(), sv.sformatf("\nSim Finished\n"), UVM_LOW)
+
+        phase.drop_objection(self, "multi_instance_test drop objection")
+
+
+    def report_phase(self, phase):
+        matches, mismatches = self.scoreboard_counts()
+        verified = matches + mismatches
+
+        summary = ""
+        for env in self.tb_envs:
+            summary += "\n    %-12s: %d verified" % (env.get_name(), env.scoreboard.m_matches + env.scoreboard.m_mismatches)
+
+        uvm_info(self.get_type_name(),
+            "\n    Instances   : %d%s\n    Run phase   : %0.3f s\n    Throughput  : %0.1f verified divisions/s\n" % (
+                len(self.tb_envs), summary, self.wall_time, verified / max(self.wall_time, 1e-9)), UVM_NONE)
+
+        super().report_phase(phase)
+
+
+uvm_component_utils(multi_instance_test)
+
+
+class soak_test(test_base):
+    """
+       Class: Soak Test
+
+       Definition: Long running test. Streams seeded random requests, generated one at a time,
+         until the count or the duration is reached, prints the progress periodically and
+         stops early once too many results mismatch.
+
+         Plusargs:
+           +SOAK_COUNT=<int>       : amount of requests, 0 for no limit, default 1000
+           +SOAK_DURATION=<float>  : wall clock seconds, 0 for no limit, default 0
+           +SOAK_SEED=<int>        : operand stream seed, default 1
+           +SOAK_DIST=<name>       : operand distribution, uniform, log or signed, default uniform
+           +SOAK_MIX=<w0,w1,w2,w3> : weight of each i_wb4s_tgd value, default 1,1,1,1. Six
+                                     weights add the divmod operations, GDIV_DIVMOD=1
+           +SOAK_PROGRESS=<float>  : seconds between progress prints, default 10
+           +SOAK_MAX_ERRORS=<int>  : mismatches that abort the test, 0 to never abort, default 10
+    """
+
+    def __init__(self, name="soak_test", parent=None):
+        super().__init__(name, parent)
+        self.count        = int(cocotb.plusargs.get("SOAK_COUNT", 1000))
+        self.duration     = float(cocotb.plusargs.get("SOAK_DURATION", 0))
+        self.seed         = int(cocotb.plusargs.get("SOAK_SEED", 1))
+        self.distribution = cocotb.plusargs.get("SOAK_DIST", "uniform")
+        self.mix          = cocotb.plusargs.get("SOAK_MIX", "1,1,1,1")
+        self.progress     = float(cocotb.plusargs.get("SOAK_PROGRESS", 10))
+        self.max_errors   = int(cocotb.plusargs.get("SOAK_MAX_ERRORS", 10))
+        self.issued       = 0
+        self.aborted      = False
+        self.wall_time    = 0.0
+
+        if (self.count <= 0 and self.duration <= 0):
+            uvm_fatal("SOAK_TEST/NoLimit", "Set +SOAK_COUNT or +SOAK_DURATION")
+
+
+    def configure_tb_env(self, cfg):
+        cfg.has_latency_monitor = True
+
+
+    async def run_phase(self, phase):
+        phase.raise_objection(self, "soak_test raise objection")
+
+        await Timer(16, "NS") # Allow some clocks for evething to settle
+
+        uvm_info(self.get_type_name(),
+            sv.sformatf("\nSim Started, seed %d count %d duration %0d s distribution %s mix %s\n",
+                self.seed, self.count, int(self.duration), self.distribution, self.mix), UVM_LOW)
+
+        await self.soak_stimulus()
+
+        uvm_info(self.get_type_name(), sv.sformatf("\nSim Finished\n"), UVM_LOW)
+
+        phase.drop_objection(self, "soak_test drop objection")
+
+
+    def done(self, elapsed):
+        """
+           Function: done
+
+           Definition: True once the count or the duration is reached, or the test aborted.
+        """
+        if (self.count > 0 and self.issued >= self.count):
+            return True
+        if (self.duration > 0 and elapsed >= self.duration):
+            return True
+        return self.aborted
+
+
+    async def soak_stimulus(self):
+        factors_length = int(self.tb_env.cfg.DUT_SLAVE_DATA_IN_LENGTH/2)
+        requests       = soak_stimulus(self.seed, factors_length, self.distribution, self.mix)
+
+        # de-assert the CYC and STB signals
+        await self.write_seq(51966, 0, cycle=0, strobe=0)
+
+        start         = time.perf_counter()
+        next_progress = self.progress
+        elapsed       = 0.0
+        while (not self.done(elapsed)):
+            dividend, divisor, cycle_tag = next(requests)
+            await self.write_seq((divisor << factors_length) + dividend, cycle_tag)
+            self.issued += 1
+
+            elapsed = time.perf_counter() - start
+            if (self.progress > 0 and elapsed >= next_progress):
+                next_progress += self.progress
+                self.report_progress(elapsed)
+
+            if (self.max_errors > 0 and self.scoreboard_counts()[1] >= self.max_errors):
+                self.aborted = True
+                uvm_error(self.get_type_name(), sv.sformatf("Aborting after %d mismatches", self.max_errors))
+
+        # Let the last requests complete before dropping cyc
+        await self.drain(self.issued)
+        self.wall_time = time.perf_counter() - start
+
+        # de-assert the CYC and STB signals
+        await self.write_seq(51966, 0, cycle=0, strobe=0)
+
+
+    def report_progress(self, elapsed):
+        matches, mismatches = self.scoreboard_counts()
+        uvm_info(self.get_type_name(),
+            "Progress %0.0f s : %d issued, %d verified, %d mismatches, %0.1f requests/s" % (
+                elapsed, self.issued, matches + mismatches, mismatches, self.issued / max(elapsed, 1e-9)), UVM_LOW)
+
+
+    def report_phase(self, phase):
+        matches, mismatches = self.scoreboard_counts()
+        uvm_info(self.get_type_name(),
+            "\n    Issued      : %d%s\n    Verified    : %d\n    Mismatches  : %d\n    Run phase   : %0.3f s\n    Throughput  : %0.1f requests/s\n" % (
+                self.issued, " (aborted)" if self.aborted else "", matches + mismatches, mismatches,
+                self.wall_time, self.issued / max(self.wall_time, 1e-9)), UVM_NONE)
+
+        super().report_phase(phase)
+
+
+uvm_component_utils(soak_test)
+
+
+class pipelined_test(test_base):
+    """
+       Class: Pipelined Test
+
+       Definition: Throughput test of the pipelined divider, build with make GDIV_PIPELINED=1.
+         Drives a new request every clock straight on the interface, without the agent's
+         driver. The in flight scoreboard checks every result against the predictor's and its
+         latency against the cycle model's. Checks that the results came back one per clock.
+
+         Plusargs:
+           +PIPE_COUNT=<int> : amount of back to back requests, default 1000
+           +PIPE_SEED=<int>  : operand stream seed, default 1
+           +PIPE_DIST=<name> : operand distribution, uniform, log or signed, default log
+    """
+
+    def __init__(self, name="pipelined_test", parent=None):
+        super().__init__(name, parent)
+        self.stimulus_plusargs("PIPE")
+        self.depth = 0 # Pipeline latency, in clocks
+
+
+    def build_phase(self, phase):
+        super().build_phase(phase)
+        self.require_build(int(self.gdiv_params.get("pipelined", 0)) == 1, "GDIV_PIPELINED=1")
+
+
+    def configure_tb_env(self, cfg):
+        cfg.has_predictor           = True
+        cfg.has_scoreboard          = False
+        cfg.has_inflight_scoreboard = True
+        # The test drives the interface every clock
+        cfg.wb4s_agent_cfg.has_driver = 0
+
+
+    async def run_phase(self, phase):
+        phase.raise_objection(self, "pipelined_test raise objection")
+
+        vif            = self.tb_env.cfg.wb4s_agent_cfg.vif
+        self.depth     = self.tb_env.inflight_sb.model.pipe_depth
+        factors_length = int(self.tb_env.cfg.DUT_SLAVE_DATA_IN_LENGTH/2)
+        requests       = soak_stimulus(self.seed, factors_length, self.distribution, self.default_mix())
+
+        await self.wait_reset(vif)
+
+        uvm_info(self.get_type_name(),
+            sv.sformatf("\nSim Started, seed %d count %d distribution %s, %d stages\n",
+                self.seed, self.count, self.distribution, self.depth), UVM_LOW)
+
+        # The pipeline never stalls, a new request every clock
+        await self.back_to_back(requests, self.count, max_clocks=2*self.depth)
+
+        uvm_info(self.get_type_name(), sv.sformatf("\nSim Finished\n"), UVM_LOW)
+
+        phase.drop_objection(self, "pipelined_test drop objection")
+
+
+    def extract_phase(self, phase):
+        super().extract_phase(phase)
+        lat_mon = self.tb_env.lat_mon
+
+        if (lat_mon.num_items != self.count):
+            self.test_pass = False
+            self.err_msg  += "\nCompleted : %d of %d requests" % (lat_mon.num_items, self.count)
+        elif (lat_mon.last_ack - lat_mon.first_ack + 1 != self.count):
+            self.test_pass = False
+            self.err_msg  += "\nResults were not one per clock, %d results in %d clocks" % (
+                self.count, lat_mon.last_ack - lat_mon.first_ack + 1)
+
+
+    def report_phase(self, phase):
+        lat_mon = self.tb_env.lat_mon
+        ack_clocks = 0 if lat_mon.first_ack is None else lat_mon.last_ack - lat_mon.first_ack + 1
+        uvm_info(self.get_type_name(),
+            "\n    Requests    : %d\n    Completed   : %d\n    Latency     : min %d, mean %0.2f, max %d (%d stages)\n    In flight   : max %d\n    Results     : %d in %d clocks, %0.4f results/clock\n" % (
+                self.count, lat_mon.num_items, lat_mon.min_latency or 0, lat_mon.mean_latency(), lat_mon.max_latency,
+                self.depth, lat_mon.max_in_flight, lat_mon.num_items, ack_clocks, lat_mon.num_items / max(ack_clocks, 1)), UVM_NONE)
+
+        super().report_phase(phase)
+
+
+uvm_component_utils(pipelined_test)
+
+
+class divmod_test(test_base):
+    """
+       Class: Divmod Test
+
+       Definition: Compares a quotient and a remainder requested separately against one divmod
+         request, build with make GDIV_DIVMOD=1. Drives every operand pair twice, first as a
+         quotient followed by a remainder then as a divmod, checks that both give the same
+         results and reports the clocks each one took.
+
+         Plusargs:
+           +DM_COUNT=<int> : amount of operand pairs, default 200
+           +DM_SEED=<int>  : operand stream seed, default 1
+           +DM_DIST=<name> : operand distribution, uniform, log or signed, default log
+    """
+
+    def __init__(self, name="divmod_test", parent=None):
+        super().__init__(name, parent)
+        self.stimulus_plusargs("DM", count=200)
+        self.pairs         = []
+        self.clocks        = [0, 0] # Separate requests, divmod requests
+        self.inconsistent  = 0
+
+
+    def build_phase(self, phase):
+        super().build_phase(phase)
+        self.require_build(int(self.gdiv_params.get("divmod", 0)) == 1, "GDIV_DIVMOD=1")
+
+
+    def configure_tb_env(self, cfg):
+        cfg.has_latency_monitor     = True
+        cfg.has_timing_check        = True
+        cfg.has_functional_coverage = True
+
+
+    def end_of_elaboration_phase(self, phase):
+        super().end_of_elaboration_phase(phase)
+        self.tb_env.lat_mon.keep_records = True
+
+
+    async def run_phase(self, phase):
+        phase.raise_objection(self, "divmod_test raise objection")
+
+        await Timer(16, "NS") # Allow some clocks for evething to settle
+
+        uvm_info(self.get_type_name(),
+            sv.sformatf("\nSim Started, seed %d count %d distribution %s\n", self.seed, self.count, self.distribution), UVM_LOW)
+
+        factors_length = int(self.tb_env.cfg.DUT_SLAVE_DATA_IN_LENGTH/2)
+        requests       = soak_stimulus(self.seed, factors_length, self.distribution, "1,1,0,0")
+        self.pairs     = [next(requests) for ii in range(self.count)]
+
+        # de-assert the CYC and STB signals
+        await self.write_seq(51966, 0, cycle=0, strobe=0)
+
+        # Quotient and remainder as two requests
+        start = self.tb_env.lat_mon.cycle
+        for dividend, divisor, sign in self.pairs:
+            await self.write_seq((divisor << factors_length) + dividend, sign)
+            await self.write_seq((divisor << factors_length) + dividend, sign | 2)
+        await self.drain(2*self.count)
+        self.clocks[0] = self.tb_env.lat_mon.cycle - start
+
+        # Both in one request
+        start = self.tb_env.lat_mon.cycle
+        for dividend, divisor, sign in self.pairs:
+            await self.write_seq((divisor << factors_length) + dividend, sign | 4)
+        await self.drain(3*self.count)
+        self.clocks[1] = self.tb_env.lat_mon.cycle - start
+
+        # de-assert the CYC and STB signals
+        await self.write_seq(51966, 0, cycle=0, strobe=0)
+
+        uvm_info(self.get_type_name(), sv.sformatf("\nSim Finished\n"), UVM_LOW)
+
+        phase.drop_objection(self, "divmod_test drop objection")
+
+
+    def extract_phase(self, phase):
+        super().extract_phase(phase)
+        records        = self.tb_env.lat_mon.records
+        factors_length = int(self.tb_env.cfg.DUT_SLAVE_DATA_IN_LENGTH/2)
+        mask           = (1 << factors_length) - 1
+
+        if (len(records) != 3*self.count):
+            self.test_pass = False
+            self.err_msg  += "\nCompleted : %d of %d requests" % (len(records), 3*self.count)
+            return
+
+        for ii, (dividend, divisor, sign) in enumerate(self.pairs):
+            quotient  = records[2*ii][2]
+            remainder = records[2*ii+1][2]
+            both      = records[2*self.count+ii][2]
+            if ((both >> factors_length) != remainder or (both & mask) != quotient):
+                self.inconsistent += 1
+                if (self.inconsistent <= 10):
+                    uvm_error(self.get_type_name(), sv.sformatf("Divmod differs from the separate requests \
+                        \n  Dividend  : 0x%h \
+                        \n  Divisor   : 0x%h \
+                        \n  Quotient  : 0x%h \
+                        \n  Remainder : 0x%h \
+                        \n  Divmod    : 0x%h", dividend, divisor, quotient, remainder, both))
+
+        if (self.inconsistent > 0):
+            self.test_pass = False
+            self.err_msg  += "\nInconsistent divmod results : " + str(self.inconsistent)
+
+
+    def report_phase(self, phase):
+        records  = self.tb_env.lat_mon.records
+        latency  = [sum(rec[4] - rec[3] for rec in records[:2*self.count]),
+                    sum(rec[4] - rec[3] for rec in records[2*self.count:])]
+        uvm_info(self.get_type_name(),
+            "\n    Pairs       : %d\n    Separate    : %d clocks, %d clocks of latency\n    Divmod      : %d clocks, %d clocks of latency\n    Saved       : %0.1f%% of the clocks, %0.2f clocks per pair\n" % (
+                self.count, self.clocks[0], latency[0], self.clocks[1], latency[1],
+                100.0 * (self.clocks[0] - self.clocks[1]) / max(self.clocks[0], 1),
+                (self.clocks[0] - self.clocks[1]) / max(self.count, 1)), UVM_NONE)
+
+        super().report_phase(phase)
+
+
+uvm_component_utils(divmod_test)
+
+
+class lanes_test(test_base):
+    """
+       Class: Lanes Test
+
+       Definition: Throughput test of the lane mode, build with make GDIV_LANES=2 or 4. Packs a
+         stream of divisions as wide as one lane into requests of one division per lane,
+         drives them back to back and reports the divisions per clock. The predictor checks
+         every lane and the acknowledge timing. The same stream is estimated with the cycle
+         model for every lane configuration of the datapath.
+
+         Plusargs:
+           +LANES_COUNT=<int> : amount of divisions, default 1000
+           +LANES_SEED=<int>  : operand stream seed, default 1
+           +LANES_DIST=<name> : operand distribution, uniform, log or signed, default log
+    """
+
+    def __init__(self, name="lanes_test", parent=None):
+        super().__init__(name, parent)
+        self.stimulus_plusargs("LANES")
+        self.lanes        = 1
+        self.divisions    = []   # (dividend, divisor, tgd) as wide as one lane
+        self.requests     = []   # Packed requests
+        self.clocks       = 0
+
+
+    def build_phase(self, phase):
+        super().build_phase(phase)
+        self.lanes = int(self.gdiv_params.get("lanes", 1))
+        self.require_build(self.lanes != 1, "GDIV_LANES=2 or GDIV_LANES=4")
+
+
+    def configure_tb_env(self, cfg):
+        cfg.has_latency_monitor = True
+        cfg.has_timing_check    = True
+
+
+    async def run_phase(self, phase):
+        phase.raise_objection(self, "lanes_test raise objection")
+
+        await Timer(16, "NS") # Allow some clocks for evething to settle
+
+        factors_length = int(self.tb_env.cfg.DUT_SLAVE_DATA_IN_LENGTH/2)
+        lane_width     = int(factors_length/self.lanes)
+        stimulus       = soak_stimulus(self.seed, lane_width, self.distribution, self.default_mix())
+        self.divisions = [next(stimulus) for ii in range(self.count)]
+        self.requests, count = lanes_requests(self.divisions, lane_width, factors_length, self.lanes)
+
+        uvm_info(self.get_type_name(),
+            sv.sformatf("\nSim Started, seed %d, %d divisions in %d requests of %d lanes\n",
+                self.seed, count, len(self.requests), self.lanes), UVM_LOW)
+
+        # de-assert the CYC and STB signals
+        await self.write_seq(51966, 0, cycle=0, strobe=0)
+
+        start = self.tb_env.lat_mon.cycle
+        for dividend, divisor, cycle_tag in self.requests:
+            await self.write_seq((divisor << factors_length) + dividend, cycle_tag)
+        await self.drain(len(self.requests))
+        self.clocks = self.tb_env.lat_mon.cycle - start
+
+        # de-assert the CYC and STB signals
+        await self.write_seq(51966, 0, cycle=0, strobe=0)
+
+        uvm_info(self.get_type_name(), sv.sformatf("\nSim Finished\n"), UVM_LOW)
+
+        phase.drop_objection(self, "lanes_test drop objection")
+
+
+    def extract_phase(self, phase):
+        super().extract_phase(phase)
+        lat_mon = self.tb_env.lat_mon
+
+        if (lat_mon.num_items != len(self.requests)):
+            self.test_pass = False
+            self.err_msg  += "\nCompleted : %d of %d requests" % (lat_mon.num_items, len(self.requests))
+
+
+    def report_phase(self, phase):
+        lat_mon        = self.tb_env.lat_mon
+        factors_length = int(self.tb_env.cfg.DUT_SLAVE_DATA_IN_LENGTH/2)
+        lane_width     = int(factors_length/self.lanes)
+        report         = "\n    Divisions   : %d of %d bits in %d requests\n    Latency     : min %d, mean %0.2f, max %d\n    Measured    : %d clocks, %0.4f divisions/clock\n    Estimated   :" % (
+            self.count, lane_width, lat_mon.num_items, lat_mon.min_latency or 0, lat_mon.mean_latency(),
+            lat_mon.max_latency, self.clocks, self.count / max(self.clocks, 1))
+
+        # The same divisions with every lane configuration
+        params = dict(self.gdiv_params)
+        for lanes in (1, 2, 4):
+            if ((factors_length % lanes) != 0 or (params["frac_length"] % lanes) != 0 or factors_length // lanes < lane_width):
+                continue
+            params["lanes"]     = lanes
+            model               = gdiv_model(**params)
+            requests, divisions = lanes_requests(self.divisions, lane_width, factors_length, lanes)
+            clocks, per_op      = model.estimate(requests)
+            report += "\n      %d lanes of %2d bits : %6d clocks, %0.4f divisions/clock" % (
+                lanes, model.lane_width, clocks, divisions / max(clocks, 1))
+
+        uvm_info(self.get_type_name(), report + "\n", UVM_NONE)
+
+        super().report_phase(phase)
+
+
+uvm_component_utils(lanes_test)
+
+
+class one_step_test(test_base):
+    """
+       Class: One Step Test
+
+       Definition: Directed test of the single clock results, a zero divisor, a dividend
+         smaller than the divisor, a divisor of one and equal factors. Drives every request
+         twice, first back to back so the strobe is asserted in the clock of its acknowledge,
+         then alone so the strobe is de-asserted in that clock, and checks that both return
+         the same quotient. The remainders of these requests are a known defect, see the
+         HDD, and are not requested.
+
+         Plusargs:
+           +OS_COUNT=<int> : requests of each case and sign, default 8
+           +OS_SEED=<int>  : operand seed, default 1
+    """
+
+    def __init__(self, name="one_step_test", parent=None):
+        super().__init__(name, parent)
+        self.count     = int(cocotb.plusargs.get("OS_COUNT", 8))
+        self.seed      = int(cocotb.plusargs.get("OS_SEED", 1))
+        self.requests  = [] # (dividend, divisor, tgd, expected quotient)
+        self.stb_high  = 0  # Wrong results acknowledged with the strobe asserted
+        self.stb_low   = 0  # Wrong results acknowledged with the strobe de-asserted
+
+
+    def build_phase(self, phase):
+        super().build_phase(phase)
+        # The test drives the divider itself
+        self.require_build(int(self.gdiv_params.get("lanes", 1)) == 1 and int(self.gdiv_params.get("cores", 1)) == 1,
+            "GDIV_LANES=1 GDIV_CORES=1")
+
+
+    def configure_tb_env(self, cfg):
+        cfg.has_latency_monitor = True
+
+
+    def end_of_elaboration_phase(self, phase):
+        super().end_of_elaboration_phase(phase)
+        self.tb_env.lat_mon.keep_records = True
+
+
+    async def run_phase(self, phase):
+        phase.raise_objection(self, "one_step_test raise objection")
+
+        await Timer(16, "NS") # Allow some clocks for evething to settle
+
+        factors_length = int(self.tb_env.cfg.DUT_SLAVE_DATA_IN_LENGTH/2)
+        mask           = (1 << factors_length) - 1
+        rng            = rnd.Random(self.seed)
+        for ii in range(self.count):
+            for sign in (0, 1):
+                factor   = (rng.getrandbits(factors_length) | 2) & (mask - 1) # Not 0, 1 or -1
+                positive = rng.randrange(4, 1 << (factors_length-1))
+                self.requests.append((factor, 0, sign, mask))                  # Divisor zero, -1
+                # Less than half the divisor, the predictor rounds its quotient
+                self.requests.append((rng.randrange(positive >> 1), positive, sign, 0))
+                self.requests.append((factor, 1, sign, factor))                # Divisor one
+                self.requests.append((factor, factor, sign, 1))                # Equal factors
+
+        uvm_info(self.get_type_name(),
+            sv.sformatf("\nSim Started, seed %d, %d requests\n", self.seed, len(self.requests)), UVM_LOW)
+
+        # de-assert the CYC and STB signals
+        await self.write_seq(51966, 0, cycle=0, strobe=0)
+
+        # Back to back, the next request's strobe is asserted when each one is acknowledged
+        for dividend, divisor, cycle_tag, expected in self.requests:
+            await self.write_seq((divisor << factors_length) + dividend, cycle_tag)
+        await self.drain(len(self.requests))
+
+        # One at a time, the strobe is de-asserted when each one is acknowledged
+        for ii, (dividend, divisor, cycle_tag, expected) in enumerate(self.requests):
+            await self.write_seq((divisor << factors_length) + dividend, cycle_tag)
+            await self.drain(len(self.requests) + ii + 1)
+
+        # de-assert the CYC and STB signals
+        await self.write_seq(51966, 0, cycle=0, strobe=0)
+
+        uvm_info(self.get_type_name(), sv.sformatf("\nSim Finished\n"), UVM_LOW)
+
+        phase.drop_objection(self, "one_step_test drop objection")
+
+
+    def extract_phase(self, phase):
+        super().extract_phase(phase)
+        records = self.tb_env.lat_mon.records
+        count   = len(self.requests)
+
+        if (len(records) != 2*count):
+            self.test_pass = False
+            self.err_msg  += "\nCompleted : %d of %d requests" % (len(records), 2*count)
+            return
+
+        for ii, (dividend, divisor, cycle_tag, expected) in enumerate(self.requests):
+            for stb, record in (("asserted", records[ii]), ("de-asserted", records[count+ii])):
+                if (record[2] == expected):
+                    continue
+                if (stb == "asserted"):
+                    self.stb_high += 1
+                else:
+                    self.stb_low  += 1
+                uvm_error(self.get_type_name(), sv.sformatf("Wrong single clock quotient, strobe %s at the acknowledge \
+                    \n  Dividend : 0x%h \
+                    \n  Divisor  : 0x%h \
+                    \n  TGD      : %d \
+                    \n  Expected : 0x%h \
+                    \n  Result   : 0x%h", stb, dividend, divisor, cycle_tag, expected, record[2]))
+
+        if (self.stb_high + self.stb_low > 0):
+            self.test_pass = False
+            self.err_msg  += "\nWrong quotients : %d with the strobe asserted, %d de-asserted" % (self.stb_high, self.stb_low)
+
+
+uvm_component_utils(one_step_test)
+
+
+class cluster_test(test_base):
+    """
+       Class: Cluster Test
+
+       Definition: Throughput test of the divider cluster, build with make GDIV_CORES=<K>. Drives
+         the same stream of requests K times straight on the interface, without the agent's
+         driver, with at most k = 1 to K requests in flight. Each request is tagged on tga_i
+         with the lowest tag not in flight, so only k tags are used, and every stalled request
+         is held until it is accepted. The tag scoreboard checks every result against the
+         request its tgd_o names. Reports the results per clock measured at every k, each one
+         must match the cycle model's of the same K cores and limit.
+
+         Plusargs:
+           +CLUSTER_COUNT=<int> : amount of requests of each pass, default 1000
+           +CLUSTER_SEED=<int>  : operand stream seed, default 1
+           +CLUSTER_DIST=<name> : operand distribution, uniform, log or signed, default log
+    """
+
+    def __init__(self, name="cluster_test", parent=None):
+        super().__init__(name, parent)
+        self.stimulus_plusargs("CLUSTER")
+        self.cores        = 1
+        self.requests     = []   # (dividend, divisor, tgd)
+        self.points       = []   # (in flight, measured clocks, model clocks, model mean latency)
+
+
+    def build_phase(self, phase):
+        super().build_phase(phase)
+        self.cores = int(self.gdiv_params.get("cores", 1))
+        self.require_build(self.cores > 1, "GDIV_CORES=2 or more")
+
+
+    def configure_tb_env(self, cfg):
+        cfg.has_latency_monitor = True
+        # The test drives the interface and the tags
+        cfg.wb4s_agent_cfg.has_driver = 0
+
+
+    def end_of_elaboration_phase(self, phase):
+        super().end_of_elaboration_phase(phase)
+        self.tb_env.lat_mon.keep_records = True
+
+
+    async def run_phase(self, phase):
+        phase.raise_objection(self, "cluster_test raise objection")
+
+        factors_length = int(self.tb_env.cfg.DUT_SLAVE_DATA_IN_LENGTH/2)
+        stimulus       = soak_stimulus(self.seed, factors_length, self.distribution, self.default_mix())
+        self.requests  = [next(stimulus) for ii in range(self.count)]
+
+        await self.wait_reset()
+
+        uvm_info(self.get_type_name(),
+            sv.sformatf("\nSim Started, seed %d count %d distribution %s, %d cores %s\n", self.seed, self.count,
+                self.distribution, self.cores, "in order" if self.gdiv_params.get("in_order", 0) == 1 else "out of order"), UVM_LOW)
+
+        for in_flight in range(1, self.cores+1):
+            await self.back_to_back(self.requests, self.count, max_in_flight=in_flight)
+
+        uvm_info(self.get_type_name(), sv.sformatf("\nSim Finished\n"), UVM_LOW)
+
+        phase.drop_objection(self, "cluster_test drop objection")
+
+
+    def extract_phase(self, phase):
+        super().extract_phase(phase)
+        records = self.tb_env.lat_mon.records
+
+        if (len(records) != self.cores*self.count):
+            self.test_pass = False
+            self.err_msg  += "\nCompleted : %d of %d requests" % (len(records), self.cores*self.count)
+            return
+
+        # The passes follow each other, the model keeps its registers between them as the DUT
+        model = gdiv_model(**self.gdiv_params)
+        for in_flight in range(1, self.cores+1):
+            passed           = records[(in_flight-1)*self.count:in_flight*self.count]
+            clocks           = max(rec[4] for rec in passed) - min(rec[3] for rec in passed)
+            estimate, per_op = model.estimate_cluster(self.requests, max_in_flight=in_flight, keep=(in_flight > 1))
+            latency          = sum(stats[1] for stats in per_op.values()) / max(self.count, 1)
+            self.points.append((in_flight, clocks, estimate, latency))
+            if (clocks != estimate):
+                self.test_pass = False
+                self.err_msg  += "\nClocks with %d in flight : measured %d, the cycle model %d" % (in_flight, clocks, estimate)
+
+
+    def report_phase(self, phase):
+        lat_mon   = self.tb_env.lat_mon
+        reordered = getattr(self.tb_env.scoreboard, "reordered", 0)
+        report    = "\n    Requests    : %d per pass, %d completed, %d out of order\n    Latency     : min %d, mean %0.2f, max %d\n    Cores       : %d\n    In flight   :" % (
+            self.count, lat_mon.num_items, reordered, lat_mon.min_latency or 0, lat_mon.mean_latency(),
+            lat_mon.max_latency, self.cores)
+
+        for in_flight, clocks, estimate, latency in self.points:
+            report += "\n      %2d : %6d clocks, model %6d, mean latency %6.2f, %0.4f results/clock, x%0.2f" % (
+                in_flight, clocks, estimate, latency, self.count / max(clocks, 1), self.points[0][1] / max(clocks, 1))
+
+        uvm_info(self.get_type_name(), report + "\n", UVM_NONE)
+
+        super().report_phase(phase)
+
+
+uvm_component_utils(cluster_test)
+
+
+class rcp_cache_test(test_base):
+    """
+       Class: Reciprocal Cache Test
+
+       Definition: Benchmark of the divisor reciprocal cache, build with make GDIV_RCP_CACHE=<N>.
+         Drives a stream of requests back to back straight on the interface, without the
+         agent's driver, whose divisors are drawn from a few values, and holds every stalled
+         request until it is accepted. The predictor checks the results and, with one divider,
+         the clocks of every request. Reads the cache's hit and miss counters, they must match
+         the cycle model's, and compares every quotient with the one of the cycle model without
+         the cache, a hit must round as the steps do. Reports the clocks measured against the
+         cycle model's without the cache. The narrowest divider with a cache is checked with
+         make GDIV_FACTORS_MSB=8 GDIV_RCP_CACHE=4.
+
+         Plusargs:
+           +RC_COUNT=<int>  : amount of requests, default 1000
+           +RC_SEED=<int>   : operand stream seed, default 1
+           +RC_DIST=<name>  : operand distribution, uniform, log or signed, default log
+           +RC_REPEAT=<int> : amount of divisors, default 4
+           +RC_MIX=<list>   : weights of i_wb4s_tgd 0 to 3, or 0 to 5, default every operation
+    """
+
+    def __init__(self, name="rcp_cache_test", parent=None):
+        super().__init__(name, parent)
+        self.stimulus_plusargs("RC")
+        self.repeat       = int(cocotb.plusargs.get("RC_REPEAT", 4))
+        self.mix          = cocotb.plusargs.get("RC_MIX", None)
+        self.counters     = None # TB_TOP's w_rcp_hits and w_rcp_misses
+        self.requests     = []   # (dividend, divisor, tgd)
+        self.clocks       = 0    # First request accepted to last acknowledge
+        self.measured     = (0, 0) # Hits and misses read from the divider
+        self.estimates    = {}   # {rcp_cache: (clocks, mean latency, hits, misses)} of the cycle model
+        self.differ       = 0    # Quotients that differ from the ones without the cache
+
+
+    def build_phase(self, phase):
+        super().build_phase(phase)
+        self.require_build(int(self.gdiv_params.get("rcp_cache", 0)) > 0 and int(self.gdiv_params.get("pipelined", 0)) == 0,
+            "GDIV_RCP_CACHE=1 or more, iterative")
+
+        arr = []
+        if UVMConfigDb.get(None, "dut", "RCP_COUNTERS", arr) is True:
+            self.counters = arr[0]
+
+
+    def configure_tb_env(self, cfg):
+        cfg.has_latency_monitor = True
+        cfg.has_timing_check    = True
+        # The test drives the interface
+        cfg.wb4s_agent_cfg.has_driver = 0
+
+
+    def end_of_elaboration_phase(self, phase):
+        super().end_of_elaboration_phase(phase)
+        self.tb_env.lat_mon.keep_records = True
+
+
+    async def run_phase(self, phase):
+        phase.raise_objection(self, "rcp_cache_test raise objection")
+
+        factors_length = int(self.tb_env.cfg.DUT_SLAVE_DATA_IN_LENGTH/2)
+        stimulus       = soak_stimulus(self.seed, factors_length, self.distribution, self.mix or self.default_mix(), self.repeat)
+        self.requests  = [next(stimulus) for ii in range(self.count)]
+
+        await self.wait_reset()
+
+        uvm_info(self.get_type_name(),
+            sv.sformatf("\nSim Started, seed %d count %d distribution %s, %d divisors, %d cache entries\n", self.seed,
+                self.count, self.distribution, self.repeat, int(self.gdiv_params.get("rcp_cache", 0))), UVM_LOW)
+
+        await self.back_to_back(self.requests, self.count)
+
+        uvm_info(self.get_type_name(), sv.sformatf("\nSim Finished\n"), UVM_LOW)
+
+        phase.drop_objection(self, "rcp_cache_test drop objection")
+
+
+    def extract_phase(self, phase):
+        super().extract_phase(phase)
+        lat_mon = self.tb_env.lat_mon
+
+        # The same requests with and without the cache
+        for rcp_cache in sorted(set([0, int(self.gdiv_params.get("rcp_cache", 0))])):
+            model          = gdiv_model(**dict(self.gdiv_params, rcp_cache=rcp_cache))
+            clocks, per_op = model.estimate(self.requests)
+            latency        = sum(stats[1] for stats in per_op.values()) / max(len(self.requests), 1)
+            self.estimates[rcp_cache] = (clocks, latency) + model.rcp_counters()
+
+        if (lat_mon.num_items != self.count):
+            self.test_pass = False
+            self.err_msg  += "\nCompleted : %d of %d requests" % (lat_mon.num_items, self.count)
+            return
+
+        self.clocks = lat_mon.last_ack - lat_mon.first_accept
+        expected    = self.estimates[max(self.estimates)]
+        if (self.counters is not None):
+            self.measured = (int(self.counters[0].value), int(self.counters[1].value))
+        if (self.measured != expected[2:4]):
+            self.test_pass = False
+            self.err_msg  += "\nHits and misses : measured %d / %d, the cycle model %d / %d" % (self.measured + expected[2:4])
+        if (self.clocks != expected[0]):
+            self.test_pass = False
+            self.err_msg  += "\nClocks : measured %d, the cycle model %d" % (self.clocks, expected[0])
+
+        # Quotients do not depend on the requests before them without the cache, the ones of
+        # a hit must be the same. Remainders and divmods always take the steps.
+        factors_length = int(self.tb_env.cfg.DUT_SLAVE_DATA_IN_LENGTH/2)
+        uncached       = gdiv_model(**dict(self.gdiv_params, rcp_cache=0)).run(self.requests)
+        steps          = {}
+        for (dividend, divisor, cycle_tag), result in zip(self.requests, uncached):
+            steps[((divisor << factors_length) + dividend, cycle_tag)] = result[0]
+        for data_in, cycle_tag, data_out, accept_cycle, ack_cycle in lat_mon.records:
+            if ((cycle_tag & 6) != 0 or data_out == steps[(data_in, cycle_tag)]):
+                continue
+            self.differ += 1
+            if (self.differ <= 10):
+                uvm_error(self.get_type_name(), sv.sformatf("Quotient differs from the steps' one \
+                    \n  Request  : 0x%h \
+                    \n  Tag      : %0d \
+                    \n  Quotient : 0x%h \
+                    \n  Steps    : 0x%h", data_in, cycle_tag, data_out, steps[(data_in, cycle_tag)]))
+        if (self.differ > 0):
+            self.test_pass = False
+            self.err_msg  += "\nQuotients : %d differ from the ones without the cache" % (self.differ)
+
+
+    def report_phase(self, phase):
+        lat_mon      = self.tb_env.lat_mon
+        hits, misses = self.measured
+        uncached     = self.estimates.get(0, (0, 0.0))
+        uvm_info(self.get_type_name(),
+            "\n    Requests    : %d, %d completed, divisors from %d values\n    Cache       : %d entries, %d hits, %d misses, %0.1f%% hit rate\n    Latency     : min %d, mean %0.2f, max %d\n    Measured    : %d clocks, %0.4f results/clock\n    No cache    : %d clocks, mean latency %0.2f (cycle model)\n    Saved       : %0.1f%% of the clocks\n" % (
+                self.count, lat_mon.num_items, self.repeat, int(self.gdiv_params.get("rcp_cache", 0)), hits, misses,
+                100.0 * hits / max(hits + misses, 1), lat_mon.min_latency or 0, lat_mon.mean_latency(), lat_mon.max_latency,
+                self.clocks, lat_mon.num_items / max(self.clocks, 1), uncached[0], uncached[1],
+                100.0 * (uncached[0] - self.clocks) / max(uncached[0], 1)), UVM_NONE)
+
+        super().report_phase(phase)
+
+
+uvm_component_utils(rcp_cache_test)
@@ -40,40 +40,102 @@
 # Additional Comments:
 #
 ##################################################################################################
-import random
+import time
+START_TIME = time.perf_counter() # Start up time reference, see test_base.mark_first_transaction
 import sys
 # Add the Wisbone Verification Agents directories.
 sys.path.append('../externals/uvm_python_Wishbone_Pipeline_Slave/')
 # Import cocotb clock and timers
 import cocotb
-from cocotb.triggers import Timer
+from cocotb.triggers import Timer, RisingEdge, ReadWrite
 from cocotb.clock import Clock
-from cocotb_coverage.coverage import *
 # Import uvm-python base items
 from uvm.base import UVMCoreService
-from uvm.base import run_test, UVMDebug
-from uvm.base.uvm_phase import UVMPhase
-from uvm.seq import UVMSequence
+from uvm.base import run_test
 # Import the Wisbone Verification Agents directories.
 from wb4s_if import *
-# Import test bench files
-from tb_env_config import *
-from tb_env import *
+# Import test bench files, test_lib brings the environment
 from test_lib import *
+from gdiv_model import gdiv_model
 
+# Clock period (value, units), also used to count the simulated cycles
+CLK_PERIOD = (1, "ms")
 
-async def initial_run_test(dut, vif_slave):
+
+async def initial_run_test(dut, vif_slaves):
     """
        Description: Places the virtual interfaces into the Config DB and await
-       for the test to finish.
+       for the test to finish. vif_slaves[0] is placed as vif_slave and the
+       other instances' interfaces as vif_slave_<n>.
     """
     #from uvm.base import UVMCoreService
     cs_ = UVMCoreService.get()
-    UVMConfigDb.set(None, "*", "vif_slave", vif_slave)
+    UVMConfigDb.set(None, "*", "vif_slave", vif_slaves[0])
+    for ii in range(1, len(vif_slaves)):
+        UVMConfigDb.set(None, "*", "vif_slave_" + str(ii), vif_slaves[ii])
     UVMConfigDb.set(None, "dut", "DUT_SLAVE_DATA_IN_LENGTH", len(dut.i_wb4s_data))
+    UVMConfigDb.set(None, "dut", "TB_INSTANCES", len(vif_slaves))
+    UVMConfigDb.set(None, "dut", "GDIV_PARAMS", gdiv_params(dut))
+    UVMConfigDb.set(None, "dut", "CLK_PERIOD", CLK_PERIOD)
+    UVMConfigDb.set(None, "dut", "START_TIME", START_TIME)
+    # Reciprocal cache counters of the first instance, TB_TOP's w_rcp_hits and w_rcp_misses
+    UVMConfigDb.set(None, "dut", "RCP_COUNTERS", (dut.w_rcp_hits, dut.w_rcp_misses))
     await run_test()
 
 
+def gdiv_params(dut):
+    """
+       Description: Returns the divider parameters, as gdiv_model arguments,
+       from the plusargs set by the Makefile. Defaults to TB_TOP's.
+    """
+    factors_msb = int(cocotb.plusargs.get("GDIV_FACTORS_MSB", int(len(dut.i_wb4s_data)/2)-1))
+    return { "factors_msb": factors_msb,
+             "frac_length": int(cocotb.plusargs.get("GDIV_FRAC_LENGTH", factors_msb+1)),
+             "round_lvl"  : int(cocotb.plusargs.get("GDIV_ROUND_LVL", 3)),
+             "rduc_stp_by": int(cocotb.plusargs.get("GDIV_RDUC_STP_BY", 0)),
+             "pipelined"  : int(cocotb.plusargs.get("GDIV_PIPELINED", 0)),
+             "divmod"     : int(cocotb.plusargs.get("GDIV_DIVMOD", 0)),
+             "early_term" : int(cocotb.plusargs.get("GDIV_EARLY_TERM", 0)),
+             "lanes"      : int(cocotb.plusargs.get("GDIV_LANES", 1)),
+             "cores"      : int(cocotb.plusargs.get("GDIV_CORES", 1)),
+             "tag_msb"    : int(cocotb.plusargs.get("GDIV_TAG_MSB", 3)),
+             "in_order"   : int(cocotb.plusargs.get("GDIV_IN_ORDER", 0)),
+             "rcp_cache"  : int(cocotb.plusargs.get("GDIV_RCP_CACHE", 0)),
+             "variant"    : cocotb.plusargs.get("GDIV_DUT", "ff") }
+
+
+async def model_backend(handle, vif_slave, params):
+    """
+       Description: Model backend (make BACKEND=model). Drives the outputs of one
+       TB_MODEL.v instance from the cycle accurate model of the divider. The
+       inputs read at the rising edge are the ones registered by the divider,
+       the outputs are updated once the agents drove the new inputs.
+    """
+    model = gdiv_model(**params)
+    handle.r_model_stall <= 0
+    handle.r_model_ack   <= 0
+    handle.r_model_data  <= 0
+    handle.r_model_tgd   <= 0
+    if (hasattr(handle, "r_model_rcp_hits")):
+        # Only instance 0 has the reciprocal cache counters
+        handle.r_model_rcp_hits   <= 0
+        handle.r_model_rcp_misses <= 0
+    while True:
+        await RisingEdge(vif_slave.clk_i)
+        model.clock(int(vif_slave.cyc_i.value), int(vif_slave.stb_i.value), int(vif_slave.tgc_i.value),
+                    int(vif_slave.dat_i.value), int(vif_slave.rst_i.value), int(vif_slave.tga_i.value))
+        await ReadWrite()
+        stall, ack, result, tag = model.outputs_tagged(int(vif_slave.stb_i.value))
+        handle.r_model_stall <= stall
+        handle.r_model_ack   <= ack
+        handle.r_model_data  <= result
+        handle.r_model_tgd   <= tag
+        if (hasattr(handle, "r_model_rcp_hits")):
+            hits, misses = model.rcp_counters()
+            handle.r_model_rcp_hits   <= hits
+            handle.r_model_rcp_misses <= misses
+
+
 async def initial_reset(vif_slave, dut):
     """
        Description: Perform power on reset. Toggle reset signals and fork the
@@ -108,11 +170,24 @@ async def top(dut):
 
     vif_slave = wb4s_if(dut, slave_bus_map)
 
-    # Create a 1Mhz clock
-    clock = Clock(dut.i_clk, 1, units="ms")
+    # Additional divider instances, TB_TOP parameter P_TB_INSTANCES
+    vif_slaves = [vif_slave]
+    handles    = [dut]
+    inst_bus_map = dict(slave_bus_map, clk_i="w_clk", rst_i="w_rst")
+    for ii in range(1, int(cocotb.plusargs.get("TB_INSTANCES", 1))):
+        handles.append(dut.g_tb_inst[ii])
+        vif_slaves.append(wb4s_if(handles[ii], inst_bus_map))
+
+    # Python cycle model in place of the RTL, TB_MODEL.v
+    if (cocotb.plusargs.get("GDIV_BACKEND", "rtl") == "model"):
+        for ii in range(len(vif_slaves)):
+            cocotb.fork(model_backend(handles[ii], vif_slaves[ii], gdiv_params(dut)))
+
+    # Create a 1Khz clock
+    clock = Clock(dut.i_clk, CLK_PERIOD[0], units=CLK_PERIOD[1])
     # Fork process threads
     proc_clk      = cocotb.fork(clock.start(None, True))  # Start the clock
     proc_reset    = cocotb.fork(initial_reset(vif_slave, dut))
-    proc_run_test = cocotb.fork(initial_run_test(dut, vif_slave))
+    proc_run_test = cocotb.fork(initial_run_test(dut, vif_slaves))
 
     await sv.fork_join([proc_run_test, proc_reset])
@@ -0,0 +1,223 @@
+/////////////////////////////////////////////////////////////////////////////////
+//
+// Copyright (c) 2023, Jose R. Garcia (jg-fossh@protonmail.com)
+// All rights reserved.
+//
+// The following hardware description source code is subject to the terms of the
+//                  Open Hardware Description License, v. 1.0
+// If a copy of the afromentioned license was not distributed with this file you
+// can obtain one at http://juliusbaxter.net/ohdl/ohdl.txt
+//
+/////////////////////////////////////////////////////////////////////////////////
+// File name    : Goldschmidt_Integer_Divider_Cluster.v
+// Author       : Jose R Garcia (jg-fossh@protonmail.com)
+// Project Name : Goldschmidt Integer Divider Parallel
+// Module Name  : Goldschmidt_Integer_Divider_Cluster
+// Description  : P_GDIV_CORES iterative Goldschmidt dividers behind one
+//                Wishbone pipeline port. Every request is dispatched to a
+//                free core, so up to P_GDIV_CORES divisions are in flight.
+//                Each request carries a tag, i_wb4s_tga, returned with its
+//                result on o_wb4s_tgd.
+//
+// Additional Comments:
+//   Same parameters and ports as Goldschmidt_Integer_Divider_Parallel plus the
+//   tags, either variant (_FF or block RAM) provides the cores.
+//   A request goes to the lowest numbered free core, the cluster stalls only
+//   when every core holds a request. A core is free again the clock its result
+//   is acknowledged.
+//   P_GDIV_IN_ORDER = 0 acknowledges the results as soon as the cores finish,
+//   the lowest numbered core first when several finish together, the tag
+//   tells which request a result belongs to. P_GDIV_IN_ORDER = 1 acknowledges
+//   them in the order the requests were accepted.
+//   A result is acknowledged the clock its core acknowledges when the port is
+//   free, otherwise the core keeps it until it is its turn.
+//   The tags are not interpreted, the master picks them. Tags unique among
+//   the requests in flight need P_GDIV_TAG_MSB+1 >= log2(P_GDIV_CORES) bits.
+/////////////////////////////////////////////////////////////////////////////////
+module Goldschmidt_Integer_Divider_Cluster #(
+  parameter integer P_GDIV_CORES       = 2,                    // Amount of dividers, requests in flight.
+  parameter integer P_GDIV_TAG_MSB     = 3,                    // The MSB of the request tag, i_wb4s_tga and o_wb4s_tgd.
+  parameter integer P_GDIV_IN_ORDER    = 0,                    // 0=results as soon as a core finishes. 1=results in request order.
+  parameter integer P_GDIV_FACTORS_MSB = 31,                   // The MSB of each division factor.
+  parameter integer P_GDIV_FRAC_LENGTH = P_GDIV_FACTORS_MSB+1, // he amount of bits after the fixed point.
+  parameter integer P_GDIV_ROUND_LVL   = 3,                    // Bits after fixed point that need to be '1' to round up result.
+  parameter integer P_GDIV_RDUC_STP_BY = 0,                    // Force a reduction in the amount of steps of the division.
+  parameter integer P_GDIV_PIPELINED   = 0,                    // Must be 0, the cores are iterative.
+  parameter integer P_GDIV_DIVMOD      = 0,                    // 1=adds the divmod operation, i_wb4s_tgd[2].
+  parameter integer P_GDIV_EARLY_TERM  = 0,                    // 1=ends the steps once the divisor converged.
+  parameter integer P_GDIV_RCP_CACHE   = 0                     // Entries of each core's divisor reciprocal cache, 0=none.
+)(
+  // Component's clocks and resets
+  input i_clk, // clock
+  input i_rst, // reset
+  // WB4S Pipeline Interface
+  input                               i_wb4s_cyc,   // WB cyc, active/abort signal
+  input                               i_wb4s_stb,   // WB stb, valid strobe
+  input  [(P_GDIV_FACTORS_MSB*2)+1:0] i_wb4s_data,  // WB data, {divisor, dividend}
+  input  [P_GDIV_TAG_MSB:0]           i_wb4s_tga,   // WB address tag, the request's tag
+  input  [P_GDIV_DIVMOD+1:0]          i_wb4s_tgd,   // [2] 1=divmod, P_GDIV_DIVMOD=1 only; [1] 0=quotient, 1=rem; [0] 0=signed, 1=unsigned
+  output                              o_wb4s_stall, // WB stall, not ready
+  output                              o_wb4s_ack,   // WB write enable
+  output [((P_GDIV_FACTORS_MSB+1)*(P_GDIV_DIVMOD+1))-1:0] o_wb4s_data, // WB data, result. P_GDIV_DIVMOD=1 {remainder, quotient}
+  output [P_GDIV_TAG_MSB:0]           o_wb4s_tgd    // WB data tag, the tag of the acknowledged request
+);
+
+  ///////////////////////////////////////////////////////////////////////////////
+  // Assertions Declaration
+  //     This is Verilog code and assertions were introduced in SystemVerilog,
+  //     therefore we are using an initial statement to catch mis-configurations.
+  //     Also Yosys and Verilator can't handle $error() nor $fatal() hence
+  //     defaulted to $display() to provide feedback to the integrator.
+  ///////////////////////////////////////////////////////////////////////////////
+  initial begin
+    if (P_GDIV_CORES < 1)
+      $display("\nError-Type : Parameter Out of Range\nError-Msg  : P_GDIV_CORES must be 1 or more. \n");
+
+    if ((1 << (P_GDIV_TAG_MSB+1)) < P_GDIV_CORES)
+      $display("\nError-Type : Parameter Out of Range\nError-Msg  : P_GDIV_TAG_MSB is too small to tag the requests of every core, 2^(P_GDIV_TAG_MSB+1) >= P_GDIV_CORES. \n");
+
+    if (P_GDIV_IN_ORDER != 0 && P_GDIV_IN_ORDER != 1)
+      $display("\nError-Type : Parameter Out of Range\nError-Msg  : P_GDIV_IN_ORDER must be 0 or 1. \n");
+
+    if (P_GDIV_PIPELINED != 0)
+      $display("\nError-Type : Parameter Out of Range\nError-Msg  : P_GDIV_PIPELINED must be 0, the pipelined divider accepts a request every clock by itself. \n");
+  end
+
+  ///////////////////////////////////////////////////////////////////////////////
+  // Internal Parameters Declaration
+  ///////////////////////////////////////////////////////////////////////////////
+  // Core indexing constants
+  localparam integer L_CORE_DATA     = (P_GDIV_FACTORS_MSB+1)*(P_GDIV_DIVMOD+1); // Width of each core's o_wb4s_data
+  localparam integer L_CORE_DATA_MSB = (L_CORE_DATA*P_GDIV_CORES)-1;
+  localparam integer L_TAG_WIDTH     = P_GDIV_TAG_MSB+1;
+  // Request order, counts modulo a power of two of at least P_GDIV_CORES
+  localparam integer L_SEQ_MSB       = (P_GDIV_CORES > 1) ? $clog2(P_GDIV_CORES)-1 : 0;
+  // Completion order select
+  localparam         L_IN_ORDER      = (P_GDIV_IN_ORDER == 1) ? 1'b1 : 1'b0;
+
+  ///////////////////////////////////////////////////////////////////////////////
+  // Internal Signals Declarations
+  ///////////////////////////////////////////////////////////////////////////////
+  // Cores outputs, one slice per core
+  wire [P_GDIV_CORES-1:0]    w_core_stall;
+  wire [P_GDIV_CORES-1:0]    w_core_ack;
+  wire [L_CORE_DATA_MSB:0]   w_core_data;
+  // Cluster Process
+  reg  [P_GDIV_CORES-1:0]    r_busy;       // Cores holding a request not acknowledged yet
+  reg  [P_GDIV_CORES-1:0]    r_done;       // Cores keeping a result for its turn
+  reg  [L_SEQ_MSB:0]         r_seq_in;     // Order of the next accepted request
+  reg  [L_SEQ_MSB:0]         r_seq_out;    // Order of the next acknowledged request, P_GDIV_IN_ORDER=1
+  wire [P_GDIV_CORES-1:0]    w_head;       // The core holding the oldest request
+  // Result select, lowest numbered core with a result it can return
+  wire [P_GDIV_CORES-1:0]    w_avail     = r_done | w_core_ack;
+  wire [P_GDIV_CORES-1:0]    w_ready     = (L_IN_ORDER==1'b1) ? (w_avail & w_head) : w_avail;
+  wire [P_GDIV_CORES-1:0]    w_sel       = w_ready & (~w_ready + 1'b1);
+  // Dispatch, lowest numbered free core
+  wire [P_GDIV_CORES-1:0]    w_free      = ~r_busy | w_sel;
+  wire [P_GDIV_CORES-1:0]    w_pick      = w_free & (~w_free + 1'b1);
+  wire                       w_accept    = i_wb4s_stb & (|w_free);
+  wire [P_GDIV_CORES-1:0]    w_dispatch  = {P_GDIV_CORES{w_accept}} & w_pick;
+  // Acknowledged result and tag, or-ed through the cores, one slice per core plus the zero
+  wire [(L_CORE_DATA*(P_GDIV_CORES+1))-1:0] w_chain_data;
+  wire [(L_TAG_WIDTH*(P_GDIV_CORES+1))-1:0] w_chain_tag;
+
+  ///////////////////////////////////////////////////////////////////////////////
+  //            ********      Architecture Declaration      ********           //
+  ///////////////////////////////////////////////////////////////////////////////
+
+  // WB4 Slave Interface ouput wires
+  assign o_wb4s_stall = ~(|w_free);
+  assign o_wb4s_ack   = |w_sel;
+  assign o_wb4s_data  = w_chain_data[P_GDIV_CORES*L_CORE_DATA +: L_CORE_DATA];
+  assign o_wb4s_tgd   = w_chain_tag[P_GDIV_CORES*L_TAG_WIDTH +: L_TAG_WIDTH];
+
+  assign w_chain_data[0 +: L_CORE_DATA] = {L_CORE_DATA{1'b0}};
+  assign w_chain_tag[0 +: L_TAG_WIDTH]  = {L_TAG_WIDTH{1'b0}};
+
+  ///////////////////////////////////////////////////////////////////////////////
+  // Process     : Cluster Process
+  // Description : Tracks the cores holding a request and the ones done that
+  //               wait for their turn to acknowledge. Each core keeps its own
+  //               tag and result, see g_core.
+  ///////////////////////////////////////////////////////////////////////////////
+  always @(posedge i_clk) begin : Cluster_Process
+    if (i_rst == 1'b1 || i_wb4s_cyc == 1'b0) begin
+      r_busy    <= 0;
+      r_done    <= 0;
+      r_seq_in  <= 0;
+      r_seq_out <= 0;
+    end
+    else begin
+      // A core acknowledged can take a new request in the same clock.
+      r_busy <= (r_busy & ~w_sel) | w_dispatch;
+      r_done <= (r_done | w_core_ack) & ~w_sel;
+
+      if (w_accept == 1'b1) begin
+        r_seq_in <= r_seq_in + 1'b1;
+      end
+
+      if (o_wb4s_ack == 1'b1) begin
+        r_seq_out <= r_seq_out + 1'b1;
+      end
+    end
+  end
+
+  ///////////////////////////////////////////////////////////////////////////////
+  // Instance    : g_core
+  // Description : One divider per core, each one gets the strobe of the
+  //               requests dispatched to it.
+  ///////////////////////////////////////////////////////////////////////////////
+  genvar gc;
+  generate
+    for (gc = 0; gc < P_GDIV_CORES; gc = gc+1) begin : g_core
+      wire [L_CORE_DATA-1:0] w_live = w_core_data[gc*L_CORE_DATA +: L_CORE_DATA];
+      wire [L_CORE_DATA-1:0] w_result;
+      reg  [L_CORE_DATA-1:0] r_core_data; // The result of a core waiting for its turn
+      reg  [P_GDIV_TAG_MSB:0] r_core_tag; // The tag of the core's request
+      reg  [L_SEQ_MSB:0]     r_core_seq;  // The order of the core's request
+
+      Goldschmidt_Integer_Divider_Parallel #(
+        .P_GDIV_FACTORS_MSB(P_GDIV_FACTORS_MSB),
+        .P_GDIV_FRAC_LENGTH(P_GDIV_FRAC_LENGTH),
+        .P_GDIV_ROUND_LVL(P_GDIV_ROUND_LVL),
+        .P_GDIV_RDUC_STP_BY(P_GDIV_RDUC_STP_BY),
+        .P_GDIV_PIPELINED(P_GDIV_PIPELINED),
+        .P_GDIV_DIVMOD(P_GDIV_DIVMOD),
+        .P_GDIV_EARLY_TERM(P_GDIV_EARLY_TERM),
+        .P_GDIV_RCP_CACHE(P_GDIV_RCP_CACHE)
+      ) core (
+        // Component's clocks and resets
+        .i_clk(i_clk), // clock
+        .i_rst(i_rst), // reset
+        // Wishbone(Pipeline) Slave Interface
+        .i_wb4s_cyc(i_wb4s_cyc),                                   // WB cyc, active/abort signal
+        .i_wb4s_stb(w_dispatch[gc]),                               // WB stb, only with the requests of this core
+        .i_wb4s_data(i_wb4s_data),                                 // WB data, {divisor, dividend}
+        .i_wb4s_tgd(i_wb4s_tgd),                                   // WB data tag, operation
+        .o_wb4s_stall(w_core_stall[gc]),                           // WB stall, not ready
+        .o_wb4s_ack(w_core_ack[gc]),                               // WB write enable
+        .o_wb4s_data(w_core_data[gc*L_CORE_DATA +: L_CORE_DATA])   // WB data, result
+      );
+
+      // The request's tag and order, and the result once the core is done.
+      always @(posedge i_clk) begin : Core_Request_Process
+        if (w_dispatch[gc] == 1'b1) begin
+          r_core_tag <= i_wb4s_tga;
+          r_core_seq <= r_seq_in;
+        end
+
+        if (w_core_ack[gc] == 1'b1) begin
+          r_core_data <= w_live;
+        end
+      end
+
+      assign w_head[gc] = r_busy[gc] & (r_core_seq == r_seq_out);
+      assign w_result   = (r_done[gc]==1'b1) ? r_core_data : w_live;
+
+      assign w_chain_data[(gc+1)*L_CORE_DATA +: L_CORE_DATA] = w_chain_data[gc*L_CORE_DATA +: L_CORE_DATA] |
+                                                               ((w_sel[gc]==1'b1) ? w_result : {L_CORE_DATA{1'b0}});
+      assign w_chain_tag[(gc+1)*L_TAG_WIDTH +: L_TAG_WIDTH]  = w_chain_tag[gc*L_TAG_WIDTH +: L_TAG_WIDTH] |
+                                                               ((w_sel[gc]==1'b1) ? r_core_tag : {L_TAG_WIDTH{1'b0}});
+    end
+  endgenerate
+endmodule // Goldschmidt_Integer_Divider_Cluster
@@ -0,0 +1,180 @@
+/////////////////////////////////////////////////////////////////////////////////
+//
+// Copyright (c) 2023, Jose R. Garcia (jg-fossh@protonmail.com)
+// All rights reserved.
+//
+// The following hardware description source code is subject to the terms of the
+//                  Open Hardware Description License, v. 1.0
+// If a copy of the afromentioned license was not distributed with this file you
+// can obtain one at http://juliusbaxter.net/ohdl/ohdl.txt
+//
+/////////////////////////////////////////////////////////////////////////////////
+// File name    : Goldschmidt_Integer_Divider_Lanes.v
+// Author       : Jose R Garcia (jg-fossh@protonmail.com)
+// Project Name : Goldschmidt Integer Divider Parallel
+// Module Name  : Goldschmidt_Integer_Divider_Lanes
+// Description  : SIMD lane mode of the Goldschmidt divider. Splits the
+//                P_GDIV_FACTORS_MSB+1 bits datapath into P_GDIV_LANES
+//                independent narrower dividers that share the Wishbone port.
+//                Every transaction carries one packed operand pair per lane
+//                and returns one packed result per lane.
+//
+// Additional Comments:
+//   Same parameters and ports as Goldschmidt_Integer_Divider_Parallel, either
+//   variant (_FF or block RAM) provides the lanes. Lane k divides
+//     dividend : i_wb4s_data[k*L_LANE_WIDTH +: L_LANE_WIDTH]
+//     divisor  : i_wb4s_data[(P_GDIV_FACTORS_MSB+1)+(k*L_LANE_WIDTH) +: L_LANE_WIDTH]
+//   and returns its result in o_wb4s_data[k*L_LANE_WIDTH +: L_LANE_WIDTH],
+//   P_GDIV_DIVMOD=1 places the remainders in the upper half. i_wb4s_tgd
+//   applies to every lane.
+//   Each lane has P_GDIV_FRAC_LENGTH/P_GDIV_LANES fraction bits, its
+//   multiplier pair is 1/P_GDIV_LANES as wide as the full width ones. The
+//   lanes take their own amount of clocks, the ones done first hold their
+//   result until the last one acknowledges. The transaction is acknowledged
+//   with the last lane, the same clock a new one can be accepted.
+//   P_GDIV_PIPELINED = 1 lanes acknowledge in the same clock and never stall.
+/////////////////////////////////////////////////////////////////////////////////
+module Goldschmidt_Integer_Divider_Lanes #(
+  parameter integer P_GDIV_LANES       = 2,                    // Amount of independent divisions per transaction, 1, 2 or 4.
+  parameter integer P_GDIV_FACTORS_MSB = 31,                   // The MSB of the packed factors, all lanes.
+  parameter integer P_GDIV_FRAC_LENGTH = P_GDIV_FACTORS_MSB+1, // he amount of bits after the fixed point, all lanes.
+  parameter integer P_GDIV_ROUND_LVL   = 3,                    // Bits after fixed point that need to be '1' to round up result.
+  parameter integer P_GDIV_RDUC_STP_BY = 0,                    // Force a reduction in the amount of steps of the division.
+  parameter integer P_GDIV_PIPELINED   = 0,                    // 0=iterative, stalls per division. 1=unrolled, one division per clock.
+  parameter integer P_GDIV_DIVMOD      = 0,                    // 1=adds the divmod operation, i_wb4s_tgd[2].
+  parameter integer P_GDIV_EARLY_TERM  = 0,                    // 1=ends the steps once the divisor converged, iterative only.
+  parameter integer P_GDIV_RCP_CACHE   = 0                     // Entries of each lane's divisor reciprocal cache, 0=none.
+)(
+  // Component's clocks and resets
+  input i_clk, // clock
+  input i_rst, // reset
+  // WB4S Pipeline Interface
+  input                               i_wb4s_cyc,   // WB cyc, active/abort signal
+  input                               i_wb4s_stb,   // WB stb, valid strobe
+  input  [(P_GDIV_FACTORS_MSB*2)+1:0] i_wb4s_data,  // WB data, {divisor lanes, dividend lanes}
+  input  [P_GDIV_DIVMOD+1:0]          i_wb4s_tgd,   // [2] 1=divmod, P_GDIV_DIVMOD=1 only; [1] 0=quotient, 1=rem; [0] 0=signed, 1=unsigned
+  output                              o_wb4s_stall, // WB stall, not ready
+  output                              o_wb4s_ack,   // WB write enable
+  output [((P_GDIV_FACTORS_MSB+1)*(P_GDIV_DIVMOD+1))-1:0] o_wb4s_data // WB data, result lanes. P_GDIV_DIVMOD=1 {remainder lanes, quotient lanes}
+);
+
+  ///////////////////////////////////////////////////////////////////////////////
+  // Assertions Declaration
+  //     This is Verilog code and assertions were introduced in SystemVerilog,
+  //     therefore we are using an initial statement to catch mis-configurations.
+  //     Also Yosys and Verilator can't handle $error() nor $fatal() hence
+  //     defaulted to $display() to provide feedback to the integrator.
+  ///////////////////////////////////////////////////////////////////////////////
+  initial begin
+    if (P_GDIV_LANES != 1 && P_GDIV_LANES != 2 && P_GDIV_LANES != 4)
+      $display("\nError-Type : Parameter Out of Range\nError-Msg  : P_GDIV_LANES must be 1, 2 or 4. \n");
+
+    if (((P_GDIV_FACTORS_MSB+1) % P_GDIV_LANES) != 0 || (P_GDIV_FRAC_LENGTH % P_GDIV_LANES) != 0)
+      $display("\nError-Type : Parameter Out of Range\nError-Msg  : P_GDIV_FACTORS_MSB+1 and P_GDIV_FRAC_LENGTH must be multiples of P_GDIV_LANES. \n");
+
+    if (L_LANE_WIDTH < 8)
+      $display("\nError-Type : Parameter Out of Range\nError-Msg  : Each lane must be at least 8 bits wide, (P_GDIV_FACTORS_MSB+1)/P_GDIV_LANES >= 8. \n");
+  end
+
+  ///////////////////////////////////////////////////////////////////////////////
+  // Internal Parameters Declaration
+  ///////////////////////////////////////////////////////////////////////////////
+  // Lane indexing constants
+  localparam integer L_WIDTH          = P_GDIV_FACTORS_MSB+1;
+  localparam integer L_LANE_WIDTH     = L_WIDTH/P_GDIV_LANES;
+  localparam integer L_LANE_FRAC      = P_GDIV_FRAC_LENGTH/P_GDIV_LANES;
+  localparam integer L_LANE_DATA      = L_LANE_WIDTH*(P_GDIV_DIVMOD+1); // Width of each lane's o_wb4s_data
+  localparam integer L_LANE_DATA_MSB  = (L_LANE_DATA*P_GDIV_LANES)-1;
+  // Architecture Select
+  localparam         L_ITERATIVE      = (P_GDIV_PIPELINED == 0) ? 1'b1 : 1'b0;
+
+  ///////////////////////////////////////////////////////////////////////////////
+  // Internal Signals Declarations
+  ///////////////////////////////////////////////////////////////////////////////
+  // Lanes outputs, one slice per lane
+  wire [P_GDIV_LANES-1:0]    w_lane_stall;
+  wire [P_GDIV_LANES-1:0]    w_lane_ack;
+  wire [L_LANE_DATA_MSB:0]   w_lane_data;
+  // Lane Results Process
+  reg  [P_GDIV_LANES-1:0]    r_pending;    // Lanes of the accepted transaction yet to acknowledge
+  wire                       w_waiting   = |(r_pending & ~w_lane_ack);
+  wire                       w_accept    = i_wb4s_stb & !w_waiting;
+  wire [L_LANE_DATA_MSB:0]   w_result;
+
+  ///////////////////////////////////////////////////////////////////////////////
+  //            ********      Architecture Declaration      ********           //
+  ///////////////////////////////////////////////////////////////////////////////
+
+  // WB4 Slave Interface ouput wires
+  assign o_wb4s_stall = (L_ITERATIVE==1'b1) ? w_waiting : 1'b0;
+  assign o_wb4s_ack   = (L_ITERATIVE==1'b1) ? (|r_pending & !w_waiting) : w_lane_ack[0];
+
+  ///////////////////////////////////////////////////////////////////////////////
+  // Process     : Lane Results Process
+  // Description : Tracks the lanes of the accepted transaction that have not
+  //               acknowledged. Each lane keeps its own result, see g_lane.
+  ///////////////////////////////////////////////////////////////////////////////
+  always @(posedge i_clk) begin : Lane_Results_Process
+    if (i_rst == 1'b1 || i_wb4s_cyc == 1'b0 || L_ITERATIVE == 1'b0) begin
+      r_pending <= 0;
+    end
+    else if (w_accept == 1'b1) begin
+      // Every lane starts a division.
+      r_pending <= {P_GDIV_LANES{1'b1}};
+    end
+    else begin
+      r_pending <= r_pending & ~w_lane_ack;
+    end
+  end
+
+  ///////////////////////////////////////////////////////////////////////////////
+  // Instance    : g_lane
+  // Description : One divider per lane, the lanes start together.
+  ///////////////////////////////////////////////////////////////////////////////
+  genvar gl;
+  generate
+    for (gl = 0; gl < P_GDIV_LANES; gl = gl+1) begin : g_lane
+      wire [L_LANE_DATA-1:0] w_live = w_lane_data[gl*L_LANE_DATA +: L_LANE_DATA];
+      reg  [L_LANE_DATA-1:0] r_lane_data; // The result of a lane that acknowledged first
+
+      Goldschmidt_Integer_Divider_Parallel #(
+        .P_GDIV_FACTORS_MSB(L_LANE_WIDTH-1),
+        .P_GDIV_FRAC_LENGTH(L_LANE_FRAC),
+        .P_GDIV_ROUND_LVL(P_GDIV_ROUND_LVL),
+        .P_GDIV_RDUC_STP_BY(P_GDIV_RDUC_STP_BY),
+        .P_GDIV_PIPELINED(P_GDIV_PIPELINED),
+        .P_GDIV_DIVMOD(P_GDIV_DIVMOD),
+        .P_GDIV_EARLY_TERM(P_GDIV_EARLY_TERM),
+        .P_GDIV_RCP_CACHE(P_GDIV_RCP_CACHE)
+      ) lane (
+        // Component's clocks and resets
+        .i_clk(i_clk), // clock
+        .i_rst(i_rst), // reset
+        // Wishbone(Pipeline) Slave Interface
+        .i_wb4s_cyc(i_wb4s_cyc),                                                 // WB cyc, active/abort signal
+        .i_wb4s_stb(w_accept),                                                   // WB stb, only with the transaction
+        .i_wb4s_data({i_wb4s_data[L_WIDTH+(gl*L_LANE_WIDTH) +: L_LANE_WIDTH],
+                      i_wb4s_data[gl*L_LANE_WIDTH +: L_LANE_WIDTH]}),            // WB data, {divisor, dividend}
+        .i_wb4s_tgd(i_wb4s_tgd),                                                 // WB data tag, shared
+        .o_wb4s_stall(w_lane_stall[gl]),                                         // WB stall, not ready
+        .o_wb4s_ack(w_lane_ack[gl]),                                             // WB write enable
+        .o_wb4s_data(w_lane_data[gl*L_LANE_DATA +: L_LANE_DATA])                 // WB data, result
+      );
+
+      // The lane's result the clock it acknowledges, else the kept one.
+      always @(posedge i_clk) begin : Lane_Data_Process
+        if (w_lane_ack[gl] == 1'b1) begin
+          r_lane_data <= w_live;
+        end
+      end
+
+      assign w_result[gl*L_LANE_DATA +: L_LANE_DATA] = (w_lane_ack[gl]==1'b1) ? w_live : r_lane_data;
+
+      // Pack the results, quotients (or remainders) in the lower half.
+      assign o_wb4s_data[gl*L_LANE_WIDTH +: L_LANE_WIDTH] = w_result[gl*L_LANE_DATA +: L_LANE_WIDTH];
+      if (P_GDIV_DIVMOD == 1) begin : g_divmod_data
+        assign o_wb4s_data[L_WIDTH+(gl*L_LANE_WIDTH) +: L_LANE_WIDTH] = w_result[(gl*L_LANE_DATA)+L_LANE_WIDTH +: L_LANE_WIDTH];
+      end
+    end
+  endgenerate
+endmodule // Goldschmidt_Integer_Divider_Lanes
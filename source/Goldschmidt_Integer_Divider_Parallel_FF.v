@@ -26,12 +26,45 @@
 //     P_GDIV_FACTORS_MSB = 31,                   
 //     P_GDIV_FRAC_LENGTH = P_GDIV_FACTORS_MSB+1,           
 //     P_GDIV_ROUND_LVL   = 3                   
+//   P_GDIV_PIPELINED = 1 unrolls the Goldschmidt steps into a pipeline of
+//   L_REM_LIMIT+3 stages with a multiplier pair per stage. It never stalls,
+//   accepts one division per clock and acknowledges each result
+//   L_REM_LIMIT+3 clocks after it was accepted, in request order. The
+//   results are the same as the ones of the iterative mode.
+//   P_GDIV_DIVMOD = 1 widens i_wb4s_tgd to 3 bits and o_wb4s_data to
+//   {remainder, quotient}. i_wb4s_tgd[2] = 1 requests both results at once,
+//   the remainder's steps pass through the quotient's so a divmod takes as
+//   long as a remainder. The upper half is zero for the other operations.
+//   P_GDIV_EARLY_TERM = 1 ends the iterations of a division once its divisor
+//   reached 1-2^-P_GDIV_FRAC_LENGTH, the fixed point of the 1's complement
+//   2-d. From there 2-d is 1+2^-P_GDIV_FRAC_LENGTH and every remaining step
+//   is a shift and add of the dividend, all of them are added in one clock.
+//   The results are the same as the ones of the fixed steps.
+//   P_GDIV_RCP_CACHE > 0 adds a cache of the scaling product of the last
+//   P_GDIV_RCP_CACHE divisors, the product of every multiplier the quotient's
+//   steps applied to the dividend. A third multiplier takes the dividend's
+//   steps with 2^P_GDIV_FACTORS_MSB, its product is 2^(2*P_GDIV_FRAC_LENGTH)/d.
+//   A quotient whose divisor is in the cache starts its steps while the third
+//   multiplier takes the dividend times the scaling product. The truncations
+//   of both chains leave the two products within 2^(L_QUO_LIMIT+4) of each
+//   other, in units of 2^-P_GDIV_FRAC_LENGTH, so when the cached product's
+//   fraction is further than that from the round up threshold both round to
+//   the same quotient and the division is acknowledged the next clock with
+//   it. Else the division carries on with its steps. The others take the
+//   steps and leave their divisor's scaling product in the cache. Remainders
+//   always take the steps, their fraction is the one of the dividend's own
+//   steps. The results are the same as without the cache. The hits and
+//   misses are counted in w_rcp_hits and w_rcp_misses. Iterative mode only.
 /////////////////////////////////////////////////////////////////////////////////
 module Goldschmidt_Integer_Divider_Parallel #(
   parameter integer P_GDIV_FACTORS_MSB = 24,                   // The MSB of each division factor.
   parameter integer P_GDIV_FRAC_LENGTH = P_GDIV_FACTORS_MSB+1, // he amount of bits after the fixed point.
   parameter integer P_GDIV_ROUND_LVL   = 3,                    // Bits after fixed point that need to be '1' to round up result.
-  parameter integer P_GDIV_RDUC_STP_BY = 0                     // Force a reduction in the amount of steps of the division.
+  parameter integer P_GDIV_RDUC_STP_BY = 0,                    // Force a reduction in the amount of steps of the division.
+  parameter integer P_GDIV_PIPELINED   = 0,                    // 0=iterative, stalls per division. 1=unrolled, one division per clock.
+  parameter integer P_GDIV_DIVMOD      = 0,                    // 1=adds the divmod operation, i_wb4s_tgd[2].
+  parameter integer P_GDIV_EARLY_TERM  = 0,                    // 1=ends the steps once the divisor converged, iterative only.
+  parameter integer P_GDIV_RCP_CACHE   = 0                     // Entries of the divisor reciprocal cache, 0=none. Iterative only.
 )(
   // Component's clocks and resets
   input i_clk, // clock
@@ -40,10 +73,10 @@ module Goldschmidt_Integer_Divider_Parallel #(
   input                               i_wb4s_cyc,   // WB cyc, active/abort signal
   input                               i_wb4s_stb,   // WB stb, valid strobe
   input  [(P_GDIV_FACTORS_MSB*2)+1:0] i_wb4s_data,  // WB data, {divisor, dividend}
-  input  [1:0]                        i_wb4s_tgd,   // [1] 0=quotient, 1=rem; [0] 0=signed, 1=unsigned
+  input  [P_GDIV_DIVMOD+1:0]          i_wb4s_tgd,   // [2] 1=divmod, P_GDIV_DIVMOD=1 only; [1] 0=quotient, 1=rem; [0] 0=signed, 1=unsigned
   output                              o_wb4s_stall, // WB stall, not ready
   output                              o_wb4s_ack,   // WB write enable
-  output [P_GDIV_FACTORS_MSB:0]       o_wb4s_data   // WB data, result
+  output [((P_GDIV_FACTORS_MSB+1)*(P_GDIV_DIVMOD+1))-1:0] o_wb4s_data // WB data, result. P_GDIV_DIVMOD=1 {remainder, quotient}
 );
 
   ///////////////////////////////////////////////////////////////////////////////
@@ -65,6 +98,33 @@ module Goldschmidt_Integer_Divider_Parallel #(
       
     if (P_GDIV_RDUC_STP_BY < 0 || P_GDIV_RDUC_STP_BY > $rtoi($ceil($sqrt(P_GDIV_FACTORS_MSB+1)))-1)
       $display("\nError-Type : Parameter Out of Range\nError-Msg  : P_GDIV_RDUC_STP_BY is out of range. \n");
+
+    if (P_GDIV_PIPELINED < 0 || P_GDIV_PIPELINED > 1)
+      $display("\nError-Type : Parameter Out of Range\nError-Msg  : P_GDIV_PIPELINED must be 0 or 1. \n");
+
+    if (P_GDIV_DIVMOD < 0 || P_GDIV_DIVMOD > 1)
+      $display("\nError-Type : Parameter Out of Range\nError-Msg  : P_GDIV_DIVMOD must be 0 or 1. \n");
+
+    if (P_GDIV_DIVMOD == 1 && L_REM_LIMIT <= L_QUO_LIMIT)
+      $display("\nError-Type : Parameter Out of Range\nError-Msg  : P_GDIV_DIVMOD requires more remainder than quotient steps, increase P_GDIV_FRAC_LENGTH. \n");
+
+    if (P_GDIV_EARLY_TERM < 0 || P_GDIV_EARLY_TERM > 1)
+      $display("\nError-Type : Parameter Out of Range\nError-Msg  : P_GDIV_EARLY_TERM must be 0 or 1. \n");
+
+    if (P_GDIV_EARLY_TERM == 1 && P_GDIV_PIPELINED == 1)
+      $display("\nError-Type : Parameter Ignored\nError-Msg  : P_GDIV_EARLY_TERM has no effect when P_GDIV_PIPELINED=1, the stages are fixed. \n");
+
+    if (P_GDIV_RCP_CACHE < 0)
+      $display("\nError-Type : Parameter Out of Range\nError-Msg  : P_GDIV_RCP_CACHE must be 0 or greater. \n");
+
+    if (P_GDIV_RCP_CACHE > 0 && (P_GDIV_FRAC_LENGTH < P_GDIV_FACTORS_MSB+1 || P_GDIV_FRAC_LENGTH > P_GDIV_FACTORS_MSB+2))
+      $display("\nError-Type : Parameter Out of Range\nError-Msg  : P_GDIV_RCP_CACHE requires P_GDIV_FACTORS_MSB+1 <= P_GDIV_FRAC_LENGTH <= P_GDIV_FACTORS_MSB+2, the scaling products are P_GDIV_FACTORS_MSB+P_GDIV_FRAC_LENGTH+1 bits. \n");
+
+    if (P_GDIV_RCP_CACHE > 0 && L_RCP_EXACT == 1'b0)
+      $display("\nError-Type : Parameter Out of Range\nError-Msg  : P_GDIV_RCP_CACHE requires P_GDIV_FRAC_LENGTH >= L_QUO_LIMIT+4+P_GDIV_ROUND_LVL, the hits' guard band does not fit below the round up threshold. The cache never hits. \n");
+
+    if (P_GDIV_RCP_CACHE > 0 && P_GDIV_PIPELINED == 1)
+      $display("\nError-Type : Parameter Ignored\nError-Msg  : P_GDIV_RCP_CACHE has no effect when P_GDIV_PIPELINED=1, the stages are fixed. \n");
   end
 
   ///////////////////////////////////////////////////////////////////////////////
@@ -150,6 +210,29 @@ module Goldschmidt_Integer_Divider_Parallel #(
   // Division Iteration Steps Limits
   localparam integer L_QUO_LIMIT = $rtoi($ceil($sqrt(P_GDIV_FACTORS_MSB+1)))-1-P_GDIV_RDUC_STP_BY;
   localparam integer L_REM_LIMIT = $rtoi($ceil($sqrt((P_GDIV_FACTORS_MSB+1)+(P_GDIV_FRAC_LENGTH))))-1-P_GDIV_RDUC_STP_BY;
+  // Architecture Select
+  localparam       L_ITERATIVE = (P_GDIV_PIPELINED == 0) ? 1'b1 : 1'b0;
+  localparam integer L_PIPE_LAST = L_REM_LIMIT+2; // Normalize, EE and one stage per step.
+  // Early Termination Constants
+  localparam                       L_EARLY_TERM     = (P_GDIV_EARLY_TERM == 1 && P_GDIV_PIPELINED == 0) ? 1'b1 : 1'b0;
+  localparam [L_MUL_FACTORS_MSB:0] L_DIVISOR_FIXED  = {{(P_GDIV_FACTORS_MSB+1){1'b0}}, {(P_GDIV_FRAC_LENGTH-1){1'b1}}, 1'b0}; // 1-2^-F
+  localparam integer               L_FF_LAST        = (L_QUO_LIMIT > L_REM_LIMIT-1) ? L_QUO_LIMIT : L_REM_LIMIT-1;
+  localparam integer               L_FF_QUO_PREV    = (L_QUO_LIMIT > 0) ? L_QUO_LIMIT-1 : 0;
+  localparam integer               L_FF_REM_PREV    = (L_REM_LIMIT > 0) ? L_REM_LIMIT-1 : 0;
+  localparam [L_REM_LIMIT:0]       L_FF_BEFORE_QUO  = (1 << L_QUO_LIMIT)-1;     // steps before the quotient's last
+  localparam [L_REM_LIMIT:0]       L_FF_UPTO_QUO    = (1 << (L_QUO_LIMIT+1))-1; // steps up to the quotient's last
+  localparam [L_REM_LIMIT:0]       L_FF_BEFORE_REM  = (1 << L_FF_REM_PREV)-1;   // steps before the remainder's fraction
+  // Reciprocal Cache Constants
+  localparam                       L_RCP_CACHE      = (P_GDIV_RCP_CACHE > 0 && P_GDIV_PIPELINED == 0) ? 1'b1 : 1'b0;
+  localparam integer               L_RCP_ENTRIES    = (P_GDIV_RCP_CACHE > 0) ? P_GDIV_RCP_CACHE : 1;
+  localparam integer               L_RCP_PTR_MSB    = (L_RCP_ENTRIES > 1) ? $clog2(L_RCP_ENTRIES)-1 : 0;
+  localparam [L_RCP_PTR_MSB:0]     L_RCP_LAST       = L_RCP_ENTRIES-1;
+  localparam [L_MUL_FACTORS_MSB:0] L_RCP_ONE        = {1'b1, {L_MUL_FACTORS_MSB{1'b0}}}; // 2^P_GDIV_FACTORS_MSB, fixed point
+  localparam integer               L_RCP_GUARD_LSB  = P_GDIV_FRAC_LENGTH+L_QUO_LIMIT+4;         // Hits' error bound, fraction bits
+  localparam integer               L_RCP_CEIL_LSB   = (P_GDIV_FRAC_LENGTH*2)-P_GDIV_ROUND_LVL;  // Round up threshold's LSB
+  localparam                       L_RCP_EXACT      = (L_RCP_GUARD_LSB <= L_RCP_CEIL_LSB) ? 1'b1 : 1'b0;
+  localparam integer               L_RCP_NEAR_LSB   = (L_RCP_EXACT == 1'b1) ? L_RCP_GUARD_LSB : L_RCP_CEIL_LSB;
+  localparam [(P_GDIV_FRAC_LENGTH*2)-1:0] L_RCP_CEIL = {P_GDIV_ROUND_LVL{1'b1}} << L_RCP_CEIL_LSB;
 
   ///////////////////////////////////////////////////////////////////////////////
   // Internal Signals Declarations
@@ -169,7 +252,7 @@ module Goldschmidt_Integer_Divider_Parallel #(
     r_calc_remainder==1'b1 ? r_div_step[L_REM_LIMIT] : r_div_step[L_QUO_LIMIT];
 
   // FSM States
-  wire s_initiate = i_wb4s_stb & !r_stall;
+  wire s_initiate = L_ITERATIVE & i_wb4s_stb & !r_stall;
   wire s_ee_mul   = r_gte_twenty;
   wire s_iterate  = !r_gte_twenty & r_stall;
 
@@ -194,6 +277,18 @@ module Goldschmidt_Integer_Divider_Parallel #(
   reg [L_PRODUCT_MSB:0] r_product0;
   reg [L_PRODUCT_MSB:0] r_product1;
 
+  // Reciprocal Cache Signals
+  wire                       w_rcp_lookup = L_RCP_CACHE & i_wb4s_cyc & s_initiate & !(w_divisor_zero | 
+    w_less_than | w_divisor_is_one | w_divisor_is_neg_one | w_equal_factors);
+  wire                       w_rcp_quotient = (i_wb4s_tgd[P_GDIV_DIVMOD+1:1]==0) ? 1'b1 : 1'b0; // Not a remainder nor a divmod
+  wire                       w_rcp_found;  // The divisor's scaling product is in the cache
+  wire [L_MUL_FACTORS_MSB:0] w_rcp_value;  // The divisor's scaling product, 2^(2*P_GDIV_FRAC_LENGTH)/d
+  wire                       w_rcp_start = w_rcp_lookup & w_rcp_found & w_rcp_quotient;
+  wire                       w_rcp_hit;    // The cached product rounds to the steps' quotient
+  wire [L_PRODUCT_MSB:0]     w_rcp_product; // The dividend times the cached scaling product
+  wire [31:0]                w_rcp_hits   /*verilator public*/; // Quotients done with the cache
+  wire [31:0]                w_rcp_misses /*verilator public*/; // Divisions that took the steps
+
   // Iterative operation signals
   wire [L_MUL_FACTORS_MSB:0] w_divisor_acc = s_initiate==1'b1 ?
       {w_divisor, {P_GDIV_FRAC_LENGTH{1'b0}}} : r_product1[L_PRODUCT_MSB:L_STEP_PRODUCT_LSB];
@@ -221,24 +316,82 @@ module Goldschmidt_Integer_Divider_Parallel #(
   // Round Up?
   wire w_ceil = &r_product0[(P_GDIV_FRAC_LENGTH*2)-1 -: P_GDIV_ROUND_LVL];
 
+  // Early Termination Signals, slice k of w_ff_product is r_product0 after
+  // step k when every step from the current one multiplies by 1+2^-F.
+  wire [((L_FF_LAST+1)*(L_PRODUCT_MSB+1))-1:0] w_ff_product;
+  wire [L_PRODUCT_MSB:0] w_ff_quo_prev_product = w_ff_product[L_FF_QUO_PREV*(L_PRODUCT_MSB+1) +: (L_PRODUCT_MSB+1)];
+  wire [L_PRODUCT_MSB:0] w_ff_quo_product      = w_ff_product[L_QUO_LIMIT*(L_PRODUCT_MSB+1) +: (L_PRODUCT_MSB+1)];
+  wire [L_PRODUCT_MSB:0] w_ff_rem_prev_product = w_ff_product[L_FF_REM_PREV*(L_PRODUCT_MSB+1) +: (L_PRODUCT_MSB+1)];
+  wire w_divisor_fixed = (r_product1[L_PRODUCT_MSB:L_STEP_PRODUCT_LSB] == L_DIVISOR_FIXED) ? 1'b1 : 1'b0;
+  wire w_ff_rem_zero   = r_calc_remainder & (|(r_div_step & L_FF_BEFORE_QUO)) & 
+    (&w_ff_quo_prev_product[(P_GDIV_FRAC_LENGTH*2)-1 -: P_GDIV_ROUND_LVL]);
+  wire w_fast_forward  = L_EARLY_TERM & s_iterate & w_divisor_fixed & 
+    !(w_ceil & r_calc_remainder & r_div_step[L_QUO_LIMIT]) &
+    (|(r_div_step & ((r_calc_remainder==1'b1) ? L_FF_BEFORE_REM : L_FF_BEFORE_QUO)));
+  wire [L_PRODUCT_MSB:0] w_ff_product0 = 
+    (r_calc_remainder==1'b1 && w_ff_rem_zero==1'b0) ? w_ff_rem_prev_product : w_ff_quo_product;
+  wire [P_GDIV_FACTORS_MSB:0] w_ff_quotient_mag = 
+    (&w_ff_quo_product[(P_GDIV_FRAC_LENGTH*2)-1 -: P_GDIV_ROUND_LVL]) ? 
+      (w_ff_quo_product[L_PRODUCT_MSB -: (P_GDIV_FACTORS_MSB+1)]+1) : 
+       w_ff_quo_product[L_PRODUCT_MSB -: (P_GDIV_FACTORS_MSB+1)];
+
+  genvar ff;
+  generate
+    for (ff = 0; ff <= L_FF_LAST; ff = ff+1) begin : g_fast_forward
+      wire [L_MUL_FACTORS_MSB:0] w_step_in;
+      if (ff == 0) begin : g_first
+        assign w_step_in = r_product0[L_PRODUCT_MSB:L_STEP_PRODUCT_LSB];
+      end
+      else begin : g_next
+        // The steps before the current one are not needed.
+        assign w_step_in = (r_div_step[ff]==1'b1) ? r_product0[L_PRODUCT_MSB:L_STEP_PRODUCT_LSB] :
+          w_ff_product[((ff-1)*(L_PRODUCT_MSB+1))+L_STEP_PRODUCT_LSB +: (L_MUL_FACTORS_MSB+1)];
+      end
+      // x*(1+2^-F), a shift and add
+      assign w_ff_product[ff*(L_PRODUCT_MSB+1) +: (L_PRODUCT_MSB+1)] = 
+        {w_step_in, {P_GDIV_FRAC_LENGTH{1'b0}}} + {{P_GDIV_FRAC_LENGTH{1'b0}}, w_step_in};
+    end
+  endgenerate
+
   // Result Select Signals
   reg                         r_rem_zero;
+  // Pipelined Architecture results
+  wire                        w_pipe_ack;
+  wire [P_GDIV_FACTORS_MSB:0] w_pipe_result;
   wire [P_GDIV_FACTORS_MSB:0] w_result_mag = 
     (w_ceil==1'b1) ? (r_product0[L_PRODUCT_MSB -: (P_GDIV_FACTORS_MSB+1)]+1) : 
                       r_product0[L_PRODUCT_MSB -: (P_GDIV_FACTORS_MSB+1)];
+  // Selected with the registers only, the result does not depend on the strobe
+  // of the acknowledge's clock.
   wire [P_GDIV_FACTORS_MSB:0] w_result = 
     (r_rem_zero==1'b1)   ?              0 :
-    (s_initiate==1'b1 && r_calc_remainder==1'b1) ? 
+    (r_stall==1'b0 && r_calc_remainder==1'b1) ? 
       ((r_neg_result==1'b1) ? -w_result_mag : w_result_mag) :
-    (s_initiate==1'b1 && r_div_step[L_QUO_LIMIT+1]==1'b0) ? r_1step_result :
+    (r_stall==1'b0 && r_div_step[L_QUO_LIMIT+1]==1'b0) ? r_1step_result :
     (r_neg_result==1'b1) ?  -w_result_mag : w_result_mag;
 
+  // Divmod Signals
+  wire                        w_divmod = (P_GDIV_DIVMOD == 1) ? i_wb4s_tgd[P_GDIV_DIVMOD+1] : 1'b0;
+  reg                         r_divmod;
+  reg  [P_GDIV_FACTORS_MSB:0] r_quotient;
+  wire [P_GDIV_FACTORS_MSB:0] w_signed_result_mag = (r_neg_result==1'b1) ? -w_result_mag : w_result_mag;
+  wire [P_GDIV_FACTORS_MSB:0] w_quotient = (r_rem_zero==1'b1) ? w_signed_result_mag : r_quotient;
+  wire [P_GDIV_FACTORS_MSB:0] w_1step_result = 
+    (w_divisor_zero==1'b1)       ? -1 :
+    (w_less_than==1'b1)          ?  0 :
+    (w_divisor_is_one==1'b1)     ? i_wb4s_data[P_GDIV_FACTORS_MSB:0] :
+    (w_divisor_is_neg_one==1'b1) ? -(i_wb4s_data[P_GDIV_FACTORS_MSB:0]) :
+    (w_equal_factors==1'b1)      ?  1 : 0;
+  // Pipelined Architecture divmod results
+  wire                        w_pipe_divmod;
+  wire [P_GDIV_FACTORS_MSB:0] w_pipe_quotient;
+
   ///////////////////////////////////////////////////////////////////////////////
   //            ********      Architecture Declaration      ********           //
   ///////////////////////////////////////////////////////////////////////////////
 
   // WB4 Slave Interface ouput wires
-  assign o_wb4s_stall = r_stall;
+  assign o_wb4s_stall = (L_ITERATIVE==1'b1) ? r_stall : 1'b0;
 
   ///////////////////////////////////////////////////////////////////////////////
   // Process     : Divider Accumulator
@@ -257,6 +410,7 @@ module Goldschmidt_Integer_Divider_Parallel #(
       r_calc_remainder <= 1'b0;
       r_neg_result     <= 1'b0;
       r_rem_zero       <= 1'b0;
+      r_divmod         <= 1'b0;
     end
     else if (i_wb4s_cyc == 1'b1) begin
       casez (1'b1)
@@ -317,10 +471,19 @@ module Goldschmidt_Integer_Divider_Parallel #(
               r_ack          <= 1'b0;
             end
           endcase
-          r_calc_remainder <= i_wb4s_tgd[1];
+          r_calc_remainder <= i_wb4s_tgd[1] | w_divmod; // divmod takes the remainder's steps
+          r_divmod         <= w_divmod;
           r_divisor        <= w_divisor;
           r_rem_zero       <= 1'b0;
         end
+        w_rcp_hit : begin
+          // The dividend times the cached scaling product is the quotient.
+          r_gte_twenty <= 1'b0;
+          r_lut_value  <= L_ONE_TENGTH;
+          r_rem_zero   <= 1'b0;
+          r_stall      <= 1'b0;
+          r_ack        <= 1'b1;
+        end
         s_ee_mul : begin
           r_gte_twenty <= 1'b0;
           r_lut_value  <= L_ONE_TENGTH;
@@ -337,6 +500,18 @@ module Goldschmidt_Integer_Divider_Parallel #(
             r_stall    <= 1'b0;
             r_ack      <= 1'b1;
           end
+          else if (w_fast_forward == 1'b1 && w_ff_rem_zero == 1'b1) begin
+            // Early termination, the remainder's fraction rounds up to one.
+            r_rem_zero <= 1'b1;
+            r_stall    <= 1'b0;
+            r_ack      <= 1'b1;
+          end
+          else if (w_fast_forward == 1'b1 && r_calc_remainder == 1'b0) begin
+            // Early termination, the quotient's remaining steps are done.
+            r_rem_zero <= 1'b0;
+            r_stall    <= 1'b0;
+            r_ack      <= 1'b1;
+          end
           else begin
 	          //
             r_rem_zero <= 1'b0;
@@ -352,6 +527,7 @@ module Goldschmidt_Integer_Divider_Parallel #(
           r_stall          <= 1'b0;
           r_ack            <= 1'b0;
           r_rem_zero       <= 1'b0;
+          r_divmod         <= 1'b0;
           r_gte_twenty     <= 1'b0;
           r_lut_value      <= L_ONE_TENGTH;
         end
@@ -360,8 +536,40 @@ module Goldschmidt_Integer_Divider_Parallel #(
   end // Divider_Accumulator_Process
 
   // WB4 Master Write Interface wires
-  assign o_wb4s_ack  = r_ack;
-  assign o_wb4s_data = w_result;
+  assign o_wb4s_ack  = (L_ITERATIVE==1'b1) ? r_ack : w_pipe_ack;
+  generate
+    if (P_GDIV_DIVMOD == 1) begin : g_divmod_data
+      wire                        w_out_divmod   = (L_ITERATIVE==1'b1) ? r_divmod : w_pipe_divmod;
+      wire [P_GDIV_FACTORS_MSB:0] w_out_result   = (L_ITERATIVE==1'b1) ? w_result : w_pipe_result;
+      wire [P_GDIV_FACTORS_MSB:0] w_out_quotient = (L_ITERATIVE==1'b1) ? w_quotient : w_pipe_quotient;
+
+      assign o_wb4s_data = (w_out_divmod==1'b1) ? {w_out_result, w_out_quotient} : 
+                                                  {{(P_GDIV_FACTORS_MSB+1){1'b0}}, w_out_result};
+    end
+    else begin : g_data
+      assign o_wb4s_data = (L_ITERATIVE==1'b1) ? w_result : w_pipe_result;
+    end
+  endgenerate
+
+  /////////////////////////////////////////////////////////////////////////////
+  // Process     : Divmod Quotient Process
+  // Description : Keeps the quotient of a divmod. The remainder's steps pass
+  //               through the quotient's, which is in r_product0 the clock
+  //               after the quotient's last step.
+  /////////////////////////////////////////////////////////////////////////////
+  always @(posedge i_clk) begin : Divmod_Quotient_Process
+    if (s_initiate == 1'b1) begin
+      // Single clock results are the same for both.
+      r_quotient <= w_1step_result;
+    end
+    else if (w_fast_forward == 1'b1 && (|(r_div_step & L_FF_UPTO_QUO)) == 1'b1) begin
+      // Early termination skips the quotient's last step.
+      r_quotient <= (r_neg_result==1'b1) ? -w_ff_quotient_mag : w_ff_quotient_mag;
+    end
+    else if (s_iterate == 1'b1 && r_div_step[L_QUO_LIMIT+1] == 1'b1) begin
+      r_quotient <= w_signed_result_mag;
+    end
+  end // Divmod_Quotient_Process
 
   /////////////////////////////////////////////////////////////////////////////
   // Process     : Division Step Process
@@ -369,7 +577,16 @@ module Goldschmidt_Integer_Divider_Parallel #(
   //               to track the convergance for the quotient and remainder.
   /////////////////////////////////////////////////////////////////////////////
   always @(posedge i_clk) begin : Division_Step_Process
-    if (r_stall == 1'b1 && s_ee_mul == 1'b0) begin
+    if (w_rcp_hit == 1'b1) begin
+      // Reciprocal cache hit, the quotient's steps are done.
+      r_div_step <= 1 << (L_QUO_LIMIT+1);
+    end
+    else if (w_fast_forward == 1'b1) begin
+      // Early termination, continue after the steps done in this clock. The
+      // remainder's fraction step is left.
+      r_div_step <= (r_calc_remainder==1'b1 && w_ff_rem_zero==1'b0) ? (1 << L_REM_LIMIT) : (1 << (L_QUO_LIMIT+1));
+    end
+    else if (r_stall == 1'b1 && s_ee_mul == 1'b0) begin
       // In the itrative steps, push 1s in to detect when the compile time 
       // determined convergence occurs.
       r_div_step <= r_div_step << 1;
@@ -387,9 +604,11 @@ module Goldschmidt_Integer_Divider_Parallel #(
   //               by modern synthesis tools.
   /////////////////////////////////////////////////////////////////////////////
   always @(posedge i_clk) begin : Dividen_Multiplication_Process
-    if (i_wb4s_cyc == 1'b1) begin
-      // Multiply during active cycle
-      r_product0 <= w_dividend_acc * w_multiplier;
+    if (i_wb4s_cyc == 1'b1 && L_ITERATIVE == 1'b1) begin
+      // Multiply during active cycle, add the remaining steps of an early
+      // termination, or take the quotient of a reciprocal cache hit.
+      r_product0 <= (w_rcp_hit==1'b1)      ? w_rcp_product :
+                    (w_fast_forward==1'b1) ? w_ff_product0 : w_dividend_acc * w_multiplier;
     end
   end // Dividen_Multiplication_Process
 
@@ -399,9 +618,395 @@ module Goldschmidt_Integer_Divider_Parallel #(
   //               by modern synthesis tools.
   /////////////////////////////////////////////////////////////////////////////
   always @(posedge i_clk) begin : Divisor_Multiplication_Process
-    if (i_wb4s_cyc == 1'b1) begin
+    if (i_wb4s_cyc == 1'b1 && L_ITERATIVE == 1'b1) begin
       // Multiply during active cycle
       r_product1 <= w_divisor_acc * w_multiplier;
     end
   end // Divisor_Multiplication_Process
+
+  ///////////////////////////////////////////////////////////////////////////////
+  // Reciprocal Cache, P_GDIV_RCP_CACHE > 0
+  //   r_product2 takes the dividend's steps with 2^P_GDIV_FACTORS_MSB up to the
+  //   quotient's last one, it holds the scaling product of the divisor when
+  //   the division is acknowledged. When the divisor is found it takes the
+  //   dividend times the cached scaling product instead, checked against the
+  //   round up threshold the next clock. Each entry keeps a divisor and its
+  //   scaling product, the oldest one is replaced. The division being acknowledged
+  //   forwards its scaling product and the entry it replaces is not matched,
+  //   so a hit depends only on the divisors requested before, not on when.
+  ///////////////////////////////////////////////////////////////////////////////
+  generate
+    if (L_RCP_CACHE == 1'b1) begin : g_rcp_cache
+      genvar gc;
+      reg  [L_PRODUCT_MSB:0]     r_product2;   // Scale chain
+      reg                        r_rcp_fill;   // The division in progress fills an entry
+      reg                        r_rcp_check;  // r_product2 holds the dividend times the cached product
+      reg  [L_RCP_PTR_MSB:0]     r_rcp_next;   // The entry to replace
+      reg  [31:0]                r_rcp_hits;
+      reg  [31:0]                r_rcp_misses;
+      wire [L_MUL_FACTORS_MSB:0] w_scale_acc = 
+        (w_rcp_start==1'b1) ? {{P_GDIV_FRAC_LENGTH{1'b0}}, w_dividend} : // Integer, times the scaling product
+        (s_initiate==1'b1)  ? L_RCP_ONE : r_product2[L_PRODUCT_MSB:L_STEP_PRODUCT_LSB];
+      wire [L_MUL_FACTORS_MSB:0] w_scale_multiplier = (w_rcp_start==1'b1) ? w_rcp_value : w_multiplier;
+      // Distance of the cached product's fraction to the round up threshold
+      wire [P_GDIV_FRAC_LENGTH*2:0] w_rcp_offset = 
+        {1'b0, r_product2[(P_GDIV_FRAC_LENGTH*2)-1:0]} - {1'b0, L_RCP_CEIL};
+      wire                       w_rcp_near = !L_RCP_EXACT | (&w_rcp_offset[P_GDIV_FRAC_LENGTH*2:L_RCP_NEAR_LSB]) |
+        !(|w_rcp_offset[P_GDIV_FRAC_LENGTH*2:L_RCP_NEAR_LSB]);
+      wire [L_PRODUCT_MSB:0]     w_scale_shift = r_product2 >> P_GDIV_FACTORS_MSB;
+      wire [L_MUL_FACTORS_MSB:0] w_rcp_scale   = w_scale_shift[L_MUL_FACTORS_MSB:0]; // 2^(2*P_GDIV_FRAC_LENGTH)/d
+      wire                       w_rcp_filling = r_ack & r_rcp_fill;
+      wire                       w_rcp_forward = w_rcp_filling & ((r_divisor == w_divisor) ? 1'b1 : 1'b0);
+      wire [L_RCP_ENTRIES-1:0]   w_rcp_match;
+      // Matching entry's scaling product, the keys are unique
+      wire [((L_RCP_ENTRIES+1)*(L_MUL_FACTORS_MSB+1))-1:0] w_rcp_select;
+      // Early termination, r_product2 after the quotient's last step
+      wire [((L_QUO_LIMIT+1)*(L_PRODUCT_MSB+1))-1:0] w_ff_scale;
+
+      assign w_rcp_found  = w_rcp_forward | (|w_rcp_match);
+      assign w_rcp_value  = (w_rcp_forward==1'b1) ? w_rcp_scale : 
+        w_rcp_select[L_RCP_ENTRIES*(L_MUL_FACTORS_MSB+1) +: (L_MUL_FACTORS_MSB+1)];
+      assign w_rcp_hit     = r_rcp_check & !w_rcp_near;
+      assign w_rcp_product = r_product2;
+      assign w_rcp_hits    = r_rcp_hits;
+      assign w_rcp_misses  = r_rcp_misses;
+      assign w_rcp_select[L_MUL_FACTORS_MSB:0] = 0;
+
+      for (gc = 0; gc < L_RCP_ENTRIES; gc = gc+1) begin : g_rcp_entry
+        reg                        r_valid;
+        reg [P_GDIV_FACTORS_MSB:0] r_key;
+        reg [L_MUL_FACTORS_MSB:0]  r_value;
+
+        assign w_rcp_match[gc] = r_valid & ((r_key == w_divisor) ? 1'b1 : 1'b0) & 
+          !(w_rcp_filling & ((r_rcp_next == gc) ? 1'b1 : 1'b0));
+        assign w_rcp_select[(gc+1)*(L_MUL_FACTORS_MSB+1) +: (L_MUL_FACTORS_MSB+1)] = 
+          w_rcp_select[gc*(L_MUL_FACTORS_MSB+1) +: (L_MUL_FACTORS_MSB+1)] | 
+          ((w_rcp_match[gc]==1'b1) ? r_value : 0);
+
+        always @(posedge i_clk) begin : Reciprocal_Entry_Process
+          if (i_rst == 1'b1) begin
+            r_valid <= 1'b0;
+          end
+          else if (w_rcp_filling == 1'b1 && r_rcp_next == gc) begin
+            // The acknowledged division's divisor and scaling product.
+            r_valid <= 1'b1;
+            r_key   <= r_divisor;
+            r_value <= w_rcp_scale;
+          end
+        end
+      end
+
+      for (gc = 0; gc <= L_QUO_LIMIT; gc = gc+1) begin : g_rcp_fast_forward
+        wire [L_MUL_FACTORS_MSB:0] w_step_in;
+        if (gc == 0) begin : g_first
+          assign w_step_in = r_product2[L_PRODUCT_MSB:L_STEP_PRODUCT_LSB];
+        end
+        else begin : g_next
+          assign w_step_in = (r_div_step[gc]==1'b1) ? r_product2[L_PRODUCT_MSB:L_STEP_PRODUCT_LSB] :
+            w_ff_scale[((gc-1)*(L_PRODUCT_MSB+1))+L_STEP_PRODUCT_LSB +: (L_MUL_FACTORS_MSB+1)];
+        end
+        // x*(1+2^-F), a shift and add
+        assign w_ff_scale[gc*(L_PRODUCT_MSB+1) +: (L_PRODUCT_MSB+1)] = 
+          {w_step_in, {P_GDIV_FRAC_LENGTH{1'b0}}} + {{P_GDIV_FRAC_LENGTH{1'b0}}, w_step_in};
+      end
+
+      /////////////////////////////////////////////////////////////////////////
+      // Process     : Scale Multiplication Process
+      // Description : Applies the multiplier of the dividend's steps to
+      //               2^P_GDIV_FACTORS_MSB, holds after the quotient's last.
+      //               Multiplies the dividend by the scaling product found
+      //               in the cache.
+      /////////////////////////////////////////////////////////////////////////
+      always @(posedge i_clk) begin : Scale_Multiplication_Process
+        if (i_wb4s_cyc == 1'b1) begin
+          if (w_fast_forward == 1'b1 && (|(r_div_step & L_FF_UPTO_QUO)) == 1'b1) begin
+            r_product2 <= w_ff_scale[L_QUO_LIMIT*(L_PRODUCT_MSB+1) +: (L_PRODUCT_MSB+1)];
+          end
+          else if (s_initiate == 1'b1 || (|(r_div_step & ~L_FF_UPTO_QUO)) == 1'b0) begin
+            r_product2 <= w_scale_acc * w_scale_multiplier;
+          end
+        end
+      end // Scale_Multiplication_Process
+
+      /////////////////////////////////////////////////////////////////////////
+      // Process     : Reciprocal Cache Process
+      // Description : Marks the divisions that fill an entry, the ones whose
+      //               divisor was not found, and the ones to check against
+      //               the round up threshold. Counts the hits and misses.
+      /////////////////////////////////////////////////////////////////////////
+      always @(posedge i_clk) begin : Reciprocal_Cache_Process
+        if (i_rst == 1'b1) begin
+          r_rcp_fill   <= 1'b0;
+          r_rcp_check  <= 1'b0;
+          r_rcp_next   <= 0;
+          r_rcp_hits   <= 0;
+          r_rcp_misses <= 0;
+        end
+        else begin
+          if (w_rcp_filling == 1'b1) begin
+            // Replace the oldest entry next.
+            r_rcp_next <= (r_rcp_next == L_RCP_LAST) ? 0 : r_rcp_next+1;
+          end
+          if (w_rcp_hit == 1'b1) begin
+            r_rcp_hits   <= r_rcp_hits+1;
+          end
+          else if ((w_rcp_lookup & !w_rcp_start) == 1'b1 || r_rcp_check == 1'b1) begin
+            // Not found, or too close to the round up threshold.
+            r_rcp_misses <= r_rcp_misses+1;
+          end
+          r_rcp_check <= i_wb4s_cyc & w_rcp_start;
+          if (i_wb4s_cyc == 1'b0) begin
+            r_rcp_fill <= 1'b0;
+          end
+          else if (s_initiate == 1'b1) begin
+            r_rcp_fill <= w_rcp_lookup & !w_rcp_found;
+          end
+          else if (r_stall == 1'b0) begin
+            r_rcp_fill <= 1'b0;
+          end
+        end
+      end // Reciprocal_Cache_Process
+    end
+    else begin : g_no_rcp_cache
+      assign w_rcp_found   = 1'b0;
+      assign w_rcp_value   = 0;
+      assign w_rcp_hit     = 1'b0;
+      assign w_rcp_product = 0;
+      assign w_rcp_hits    = 0;
+      assign w_rcp_misses  = 0;
+    end
+  endgenerate
+
+  ///////////////////////////////////////////////////////////////////////////////
+  // Pipelined Architecture, P_GDIV_PIPELINED = 1
+  //   Stage 0            : Special cases and the fixed point normalization.
+  //   Stage 1            : EE multiplication, passes through divisors below 20.
+  //   Stage 2 to L_REM_LIMIT+2 : One Goldschmidt step per stage. Quotients
+  //                        converge at L_QUO_LIMIT and pass through the rest.
+  //   Each stage carries the valid, operation tag, sign and divisor of its
+  //   division so a new division can enter every clock.
+  ///////////////////////////////////////////////////////////////////////////////
+  generate
+    if (P_GDIV_PIPELINED == 1) begin : g_pipelined
+      genvar gs;
+      // Stage signals, one slice per stage
+      wire [L_PIPE_LAST:0]                              w_pipe_valid;
+      wire [L_PIPE_LAST:0]                              w_pipe_calc_remainder;
+      wire [L_PIPE_LAST:0]                              w_pipe_neg_result;
+      wire [L_PIPE_LAST:0]                              w_pipe_1step;
+      wire [L_PIPE_LAST:0]                              w_pipe_rem_zero;
+      wire [L_PIPE_LAST:0]                              w_pipe_divmod_stage;
+      wire [((L_PIPE_LAST+1)*(P_GDIV_FACTORS_MSB+1))-1:0] w_pipe_quotient_stage;
+      wire [((L_PIPE_LAST+1)*(P_GDIV_FACTORS_MSB+1))-1:0] w_pipe_divisor;
+      wire [((L_PIPE_LAST+1)*(P_GDIV_FACTORS_MSB+1))-1:0] w_pipe_1step_result;
+      wire [((L_PIPE_LAST+1)*(L_PRODUCT_MSB+1))-1:0]      w_pipe_product0;
+      wire [((L_PIPE_LAST+1)*(L_PRODUCT_MSB+1))-1:0]      w_pipe_product1;
+      // Fixed point adjust multipliers, sized like w_multiplier
+      wire [L_MUL_FACTORS_MSB:0] w_pipe_one_tength = {{(P_GDIV_FACTORS_MSB+1){1'b0}}, L_ONE_TENGTH};
+      wire [L_MUL_FACTORS_MSB:0] w_pipe_ee;
+
+      ///////////////////////////////////////////////////////////////////////////
+      // Process     : Pipeline Normalize Process
+      // Description : Stage 0, accepts a division every clock. Resolves the
+      //               special cases and moves the factors to fixed point.
+      ///////////////////////////////////////////////////////////////////////////
+      reg                         r_valid;
+      reg                         r_calc_remainder;
+      reg                         r_neg_result;
+      reg                         r_1step;
+      reg                         r_divmod;
+      reg  [P_GDIV_FACTORS_MSB:0] r_divisor;
+      reg  [P_GDIV_FACTORS_MSB:0] r_1step_result;
+      reg                         r_gte_twenty;
+      integer                     pipe_iter;
+      reg  [L_LUT_MSB:0]          r_lut_value;
+      reg  [L_PRODUCT_MSB:0]      r_product0;
+      reg  [L_PRODUCT_MSB:0]      r_product1;
+
+      always @(posedge i_clk) begin : Pipeline_Normalize_Process
+        if (i_rst == 1'b1 || i_wb4s_cyc == 1'b0) begin
+          r_valid <= 1'b0;
+        end
+        else begin
+          r_valid <= i_wb4s_stb;
+        end
+        r_1step_result   <= w_1step_result;
+        r_1step          <= w_divisor_zero | w_less_than | w_divisor_is_one | w_divisor_is_neg_one | w_equal_factors;
+        r_neg_result     <= i_wb4s_tgd[0] == 1'b0 && (i_wb4s_data[P_GDIV_FACTORS_MSB]==1'b1 ^ i_wb4s_data[L_FACTOR1_MSB]==1'b1);
+        r_calc_remainder <= i_wb4s_tgd[1] | w_divmod;
+        r_divmod         <= w_divmod;
+        r_divisor        <= w_divisor;
+        r_gte_twenty     <= (w_divisor >= 20) ? 1'b1 : 1'b0;
+        r_lut_value      <= L_ONE_TENGTH;
+        for (pipe_iter = 2; pipe_iter <= L_ARRAY_HIGH; pipe_iter = pipe_iter+1) begin
+          if (w_divisor >= F_TWO_EE(pipe_iter-1)) begin
+            r_lut_value <= F_EE_LUT(pipe_iter);
+          end
+        end
+        r_product0       <= {w_dividend, {P_GDIV_FRAC_LENGTH{1'b0}}} * w_pipe_one_tength;
+        r_product1       <= {w_divisor, {P_GDIV_FRAC_LENGTH{1'b0}}} * w_pipe_one_tength;
+      end // Pipeline_Normalize_Process
+
+      ///////////////////////////////////////////////////////////////////////////
+      // Process     : Pipeline EE Process
+      // Description : Stage 1, shifts the decimal point of divisors greater
+      //               than or equal 20. Keeps the latency the same for all.
+      ///////////////////////////////////////////////////////////////////////////
+      reg                         r_ee_valid;
+      reg                         r_ee_calc_remainder;
+      reg                         r_ee_neg_result;
+      reg                         r_ee_1step;
+      reg                         r_ee_divmod;
+      reg  [P_GDIV_FACTORS_MSB:0] r_ee_divisor;
+      reg  [P_GDIV_FACTORS_MSB:0] r_ee_1step_result;
+      reg  [L_PRODUCT_MSB:0]      r_ee_product0;
+      reg  [L_PRODUCT_MSB:0]      r_ee_product1;
+
+      always @(posedge i_clk) begin : Pipeline_EE_Process
+        if (i_rst == 1'b1 || i_wb4s_cyc == 1'b0) begin
+          r_ee_valid <= 1'b0;
+        end
+        else begin
+          r_ee_valid <= r_valid;
+        end
+        r_ee_calc_remainder <= r_calc_remainder;
+        r_ee_neg_result     <= r_neg_result;
+        r_ee_1step          <= r_1step;
+        r_ee_divmod         <= r_divmod;
+        r_ee_divisor        <= r_divisor;
+        r_ee_1step_result   <= r_1step_result;
+        if (r_gte_twenty == 1'b1) begin
+          r_ee_product0 <= r_product0[L_PRODUCT_MSB:L_STEP_PRODUCT_LSB] * w_pipe_ee;
+          r_ee_product1 <= r_product1[L_PRODUCT_MSB:L_STEP_PRODUCT_LSB] * w_pipe_ee;
+        end
+        else begin
+          r_ee_product0 <= r_product0;
+          r_ee_product1 <= r_product1;
+        end
+      end // Pipeline_EE_Process
+
+      assign w_pipe_ee = {{(P_GDIV_FACTORS_MSB+1){1'b0}}, r_lut_value};
+
+      assign w_pipe_valid[1:0]          = {r_ee_valid, r_valid};
+      assign w_pipe_calc_remainder[1:0] = {r_ee_calc_remainder, r_calc_remainder};
+      assign w_pipe_neg_result[1:0]     = {r_ee_neg_result, r_neg_result};
+      assign w_pipe_1step[1:0]          = {r_ee_1step, r_1step};
+      assign w_pipe_rem_zero[1:0]       = 2'b00;
+      assign w_pipe_divmod_stage[1:0]   = {r_ee_divmod, r_divmod};
+      assign w_pipe_quotient_stage[(2*(P_GDIV_FACTORS_MSB+1))-1:0] = {r_ee_1step_result, r_1step_result};
+      assign w_pipe_divisor[(2*(P_GDIV_FACTORS_MSB+1))-1:0]      = {r_ee_divisor, r_divisor};
+      assign w_pipe_1step_result[(2*(P_GDIV_FACTORS_MSB+1))-1:0] = {r_ee_1step_result, r_1step_result};
+      assign w_pipe_product0[(2*(L_PRODUCT_MSB+1))-1:0]          = {r_ee_product0, r_product0};
+      assign w_pipe_product1[(2*(L_PRODUCT_MSB+1))-1:0]          = {r_ee_product1, r_product1};
+
+      for (gs = 0; gs <= L_REM_LIMIT; gs = gs+1) begin : g_step
+        // Previous stage
+        wire                         w_valid          = w_pipe_valid[gs+1];
+        wire                         w_calc_remainder = w_pipe_calc_remainder[gs+1];
+        wire                         w_1step          = w_pipe_1step[gs+1];
+        wire                         w_rem_zero       = w_pipe_rem_zero[gs+1];
+        wire [P_GDIV_FACTORS_MSB:0]  w_divisor_in     = w_pipe_divisor[(gs+1)*(P_GDIV_FACTORS_MSB+1) +: (P_GDIV_FACTORS_MSB+1)];
+        wire [L_PRODUCT_MSB:0]       w_product0       = w_pipe_product0[(gs+1)*(L_PRODUCT_MSB+1) +: (L_PRODUCT_MSB+1)];
+        wire [L_PRODUCT_MSB:0]       w_product1       = w_pipe_product1[(gs+1)*(L_PRODUCT_MSB+1) +: (L_PRODUCT_MSB+1)];
+        wire [L_MUL_FACTORS_MSB:0]   w_two_minus_divisor_in = 
+          (L_NUMBER_TWO_EXT + ~w_product1[L_PRODUCT_MSB:L_STEP_PRODUCT_LSB]); // 2-divisor
+        // Same conditions the iterative FSM evaluates at step gs
+        wire w_step_ceil  = &w_product0[(P_GDIV_FRAC_LENGTH*2)-1 -: P_GDIV_ROUND_LVL];
+        wire w_to_zero    = w_calc_remainder == 1'b1 && gs == L_QUO_LIMIT && w_step_ceil == 1'b1;
+        wire w_done       = w_1step | w_rem_zero | (w_calc_remainder == 1'b0 && gs > L_QUO_LIMIT);
+        // Divmod, the quotient's last step product enters stage L_QUO_LIMIT+1
+        wire [P_GDIV_FACTORS_MSB:0] w_step_mag = 
+          (w_step_ceil==1'b1) ? (w_product0[L_PRODUCT_MSB -: (P_GDIV_FACTORS_MSB+1)]+1) : 
+                                 w_product0[L_PRODUCT_MSB -: (P_GDIV_FACTORS_MSB+1)];
+        wire w_take_quotient = gs == L_QUO_LIMIT+1 && w_1step == 1'b0;
+
+        ///////////////////////////////////////////////////////////////////////
+        // Process     : Pipeline Step Process
+        // Description : Goldschmidt step gs. Remainders multiply the fraction
+        //               of the quotient by the divisor in their last step.
+        ///////////////////////////////////////////////////////////////////////
+        reg                         r_step_valid;
+        reg                         r_step_calc_remainder;
+        reg                         r_step_neg_result;
+        reg                         r_step_1step;
+        reg                         r_step_rem_zero;
+        reg                         r_step_divmod;
+        reg  [P_GDIV_FACTORS_MSB:0] r_step_quotient;
+        reg  [P_GDIV_FACTORS_MSB:0] r_step_divisor;
+        reg  [P_GDIV_FACTORS_MSB:0] r_step_1step_result;
+        reg  [L_PRODUCT_MSB:0]      r_step_product0;
+        reg  [L_PRODUCT_MSB:0]      r_step_product1;
+
+        always @(posedge i_clk) begin : Pipeline_Step_Process
+          if (i_rst == 1'b1 || i_wb4s_cyc == 1'b0) begin
+            r_step_valid <= 1'b0;
+          end
+          else begin
+            r_step_valid <= w_valid;
+          end
+          r_step_calc_remainder <= w_calc_remainder;
+          r_step_neg_result     <= w_pipe_neg_result[gs+1];
+          r_step_1step          <= w_1step;
+          r_step_rem_zero       <= w_rem_zero | (w_to_zero & !w_1step);
+          r_step_divisor        <= w_divisor_in;
+          r_step_1step_result   <= w_pipe_1step_result[(gs+1)*(P_GDIV_FACTORS_MSB+1) +: (P_GDIV_FACTORS_MSB+1)];
+          r_step_divmod         <= w_pipe_divmod_stage[gs+1];
+          if (w_take_quotient == 1'b1) begin
+            r_step_quotient <= (w_pipe_neg_result[gs+1]==1'b1) ? -w_step_mag : w_step_mag;
+          end
+          else begin
+            r_step_quotient <= w_pipe_quotient_stage[(gs+1)*(P_GDIV_FACTORS_MSB+1) +: (P_GDIV_FACTORS_MSB+1)];
+          end
+          if (w_done == 1'b1) begin
+            // Converged, carry the result to the last stage.
+            r_step_product0 <= w_product0;
+            r_step_product1 <= w_product1;
+          end
+          else if (w_calc_remainder == 1'b1 && gs == L_REM_LIMIT) begin
+            // Remainder, fraction times divisor.
+            r_step_product0 <= {{(P_GDIV_FACTORS_MSB+1){1'b0}}, w_product0[L_STEP_PRODUCT_LSB-1 -: P_GDIV_FRAC_LENGTH]} *
+                               {w_divisor_in, {P_GDIV_FRAC_LENGTH{1'b0}}};
+            r_step_product1 <= w_product1;
+          end
+          else begin
+            r_step_product0 <= w_product0[L_PRODUCT_MSB:L_STEP_PRODUCT_LSB] * w_two_minus_divisor_in;
+            r_step_product1 <= w_product1[L_PRODUCT_MSB:L_STEP_PRODUCT_LSB] * w_two_minus_divisor_in;
+          end
+        end // Pipeline_Step_Process
+
+        assign w_pipe_valid[gs+2]          = r_step_valid;
+        assign w_pipe_calc_remainder[gs+2] = r_step_calc_remainder;
+        assign w_pipe_neg_result[gs+2]     = r_step_neg_result;
+        assign w_pipe_1step[gs+2]          = r_step_1step;
+        assign w_pipe_rem_zero[gs+2]       = r_step_rem_zero;
+        assign w_pipe_divmod_stage[gs+2]   = r_step_divmod;
+        assign w_pipe_quotient_stage[(gs+2)*(P_GDIV_FACTORS_MSB+1) +: (P_GDIV_FACTORS_MSB+1)] = r_step_quotient;
+        assign w_pipe_divisor[(gs+2)*(P_GDIV_FACTORS_MSB+1) +: (P_GDIV_FACTORS_MSB+1)]      = r_step_divisor;
+        assign w_pipe_1step_result[(gs+2)*(P_GDIV_FACTORS_MSB+1) +: (P_GDIV_FACTORS_MSB+1)] = r_step_1step_result;
+        assign w_pipe_product0[(gs+2)*(L_PRODUCT_MSB+1) +: (L_PRODUCT_MSB+1)]               = r_step_product0;
+        assign w_pipe_product1[(gs+2)*(L_PRODUCT_MSB+1) +: (L_PRODUCT_MSB+1)]               = r_step_product1;
+      end
+
+      // Result Select, last stage
+      wire [L_PRODUCT_MSB:0]      w_last_product0 = w_pipe_product0[L_PIPE_LAST*(L_PRODUCT_MSB+1) +: (L_PRODUCT_MSB+1)];
+      wire                        w_last_ceil     = &w_last_product0[(P_GDIV_FRAC_LENGTH*2)-1 -: P_GDIV_ROUND_LVL];
+      wire [P_GDIV_FACTORS_MSB:0] w_last_mag      = 
+        (w_last_ceil==1'b1) ? (w_last_product0[L_PRODUCT_MSB -: (P_GDIV_FACTORS_MSB+1)]+1) : 
+                               w_last_product0[L_PRODUCT_MSB -: (P_GDIV_FACTORS_MSB+1)];
+
+      assign w_pipe_ack      = w_pipe_valid[L_PIPE_LAST];
+      assign w_pipe_divmod   = w_pipe_divmod_stage[L_PIPE_LAST];
+      assign w_pipe_quotient = w_pipe_quotient_stage[L_PIPE_LAST*(P_GDIV_FACTORS_MSB+1) +: (P_GDIV_FACTORS_MSB+1)];
+      assign w_pipe_result = 
+        (w_pipe_1step[L_PIPE_LAST]==1'b1)      ? w_pipe_1step_result[L_PIPE_LAST*(P_GDIV_FACTORS_MSB+1) +: (P_GDIV_FACTORS_MSB+1)] :
+        (w_pipe_rem_zero[L_PIPE_LAST]==1'b1)   ? 0 :
+        (w_pipe_neg_result[L_PIPE_LAST]==1'b1) ? -w_last_mag : w_last_mag;
+    end
+    else begin : g_iterative
+      assign w_pipe_ack      = 1'b0;
+      assign w_pipe_result   = 0;
+      assign w_pipe_divmod   = 1'b0;
+      assign w_pipe_quotient = 0;
+    end
+  endgenerate
 endmodule // Goldschmidt_Integer_Divider_Parallel